@@ -2,7 +2,9 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional
+
+from ..helpers.event_types import ACTIVITIES_SET
 
 
 # BASE ALERT
@@ -11,6 +13,8 @@ class BaseAlert(ABC):
 
     ALERT_TYPE = "BaseAlert"
     ROUTING_EVENT_TYPE: Optional[str] = None
+    # Event types this alert reacts to; None subscribes to every event type.
+    SUPPORTED_EVENT_TYPES: Optional[FrozenSet[str]] = None
 
     def __init__(self, notification_manager):
         """Initializes the alert with a notification manager."""
@@ -30,7 +34,7 @@ class BaseAlert(ABC):
 
     def _is_end_event(self, event_type: str, event_data: Dict[str, Any]) -> bool:
         return (
-            event_type == "activities.set"
+            event_type == ACTIVITIES_SET
             and "Name" in event_data
             and not event_data.get("Value", "")
         )
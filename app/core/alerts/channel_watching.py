@@ -9,11 +9,10 @@ from .common.session_manager import SessionManager
 from .common.alert_formatter import AlertFormatter
 from .common.cleanup_mixin import CleanupMixin
 from .common.stream_tracker import StreamTracker
+from ..helpers.event_types import ACTIVITIES_SET
 from ..helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
 from ..helpers.parsing import (
-    extract_channel_number,
-    extract_channel_name,
-    extract_device_name,
+    extract_channel_details,
     extract_ip_address,
     extract_resolution,
     extract_source_from_session_id,
@@ -31,6 +30,7 @@ class ChannelWatchingAlert(BaseAlert, CleanupMixin):
 
     ALERT_TYPE = "Channel-Watching"
     ROUTING_EVENT_TYPE = "channel"
+    SUPPORTED_EVENT_TYPES = frozenset({ACTIVITIES_SET})
     DESCRIPTION = "Notifications when someone is watching TV"
 
     def __init__(self, alert_manager):
@@ -119,11 +119,10 @@ class ChannelWatchingAlert(BaseAlert, CleanupMixin):
             value = event_data.get("Value", "")
             session_id = event_data.get("Name", "")
 
-            channel_number = extract_channel_number(value)
+            channel_number, _, device_name = extract_channel_details(value)
             if not channel_number:
                 return False
 
-            device_name = extract_device_name(value)
             ip_address = extract_ip_address(value)
 
             device_identifier = device_name if device_name else ip_address
@@ -170,7 +169,7 @@ class ChannelWatchingAlert(BaseAlert, CleanupMixin):
     def _is_watching_event(self, event_type: str, event_data: Dict[str, Any]) -> bool:
         """Determines if an event represents channel watching activity."""
         if (
-            event_type != "activities.set"
+            event_type != ACTIVITIES_SET
             or "Value" not in event_data
             or not event_data.get("Value")
         ):
@@ -197,11 +196,12 @@ class ChannelWatchingAlert(BaseAlert, CleanupMixin):
             session_id = event_data.get("Name", "")
             value = event_data.get("Value", "")
 
-            channel_number = extract_channel_number(value)
+            channel_number, channel_name, device_name = extract_channel_details(
+                value
+            )
             if not channel_number:
                 return False
 
-            device_name = extract_device_name(value)
             if not device_name:
                 device_name = "Unknown device"
 
@@ -252,7 +252,6 @@ class ChannelWatchingAlert(BaseAlert, CleanupMixin):
             channel_info = {}
             channel_info["number"] = channel_number
 
-            channel_name = extract_channel_name(value)
             if channel_name:
                 channel_info["name"] = channel_name
 
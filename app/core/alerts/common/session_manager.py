@@ -2,7 +2,8 @@
 
 import asyncio
 import time
-from typing import Dict, Any, Optional
+from operator import itemgetter
+from typing import Dict, Any, List, Optional
 
 from ...helpers.logging import log, LOG_VERBOSE, LOG_STANDARD
 
@@ -14,6 +15,8 @@ class SessionManager:
 
     def __init__(self):
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
+        # Both timestamp maps are kept oldest-first so cleanup can stop at the
+        # first entry that is still fresh.
         self.processing_events: Dict[str, float] = {}
         self.notification_history: Dict[str, float] = {}
         self.lock = asyncio.Lock()
@@ -51,6 +54,7 @@ class SessionManager:
 
     async def mark_event_processing(self, event_id: str) -> None:
         async with self.lock:
+            self.processing_events.pop(event_id, None)
             self.processing_events[event_id] = time.time()
 
     async def is_event_processing(self, event_id: str) -> bool:
@@ -66,6 +70,7 @@ class SessionManager:
 
     async def record_notification(self, notification_key: str) -> None:
         async with self.lock:
+            self.notification_history.pop(notification_key, None)
             self.notification_history[notification_key] = time.time()
 
     async def was_notification_sent(
@@ -97,22 +102,10 @@ class SessionManager:
                 log(f"Removing stale session: {sid}", LOG_VERBOSE)
                 del self.active_sessions[sid]
 
-            stale_events = [
-                eid
-                for eid, ts in self.processing_events.items()
-                if current_time - ts > event_ttl
-            ]
-            for eid in stale_events:
+            for eid in _evict_expired(self.processing_events, event_ttl, current_time):
                 log(f"Removing stale event: {eid}", LOG_VERBOSE)
-                del self.processing_events[eid]
 
-            old_notifications = [
-                k
-                for k, ts in self.notification_history.items()
-                if current_time - ts > notification_ttl
-            ]
-            for k in old_notifications:
-                del self.notification_history[k]
+            _evict_expired(self.notification_history, notification_ttl, current_time)
 
     # STATE PERSISTENCE
 
@@ -140,10 +133,12 @@ class SessionManager:
                 self.active_sessions[session_id] = data
                 loaded_sessions += 1
 
-            raw_history = state.get("notification_history", {})
-            for key, ts in raw_history.items():
+            history = dict(self.notification_history)
+            for key, ts in state.get("notification_history", {}).items():
                 if current_time - ts <= stale_threshold:
-                    self.notification_history[key] = ts
+                    history[key] = ts
+            self.notification_history.clear()
+            self.notification_history.update(sorted(history.items(), key=itemgetter(1)))
 
             if loaded_sessions or stale_sessions:
                 log(
@@ -151,3 +146,15 @@ class SessionManager:
                     f"{stale_sessions} stale session(s) discarded",
                     level=LOG_STANDARD,
                 )
+
+
+def _evict_expired(data: Dict[str, float], ttl: int, current_time: float) -> List[str]:
+    """Pop entries older than ttl from the front of an oldest-first timestamp map."""
+    removed = []
+    while data:
+        oldest_key = next(iter(data))
+        if current_time - data[oldest_key] <= ttl:
+            break
+        del data[oldest_key]
+        removed.append(oldest_key)
+    return removed
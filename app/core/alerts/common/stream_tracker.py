@@ -1,6 +1,7 @@
 """Tracks active streaming sessions and maintains accurate stream count information."""
 
 import asyncio
+import re
 import time
 from typing import Dict, Any, Optional
 import httpx
@@ -14,6 +15,9 @@ from ...helpers.dvr_connection import build_dvr_base_url
 
 CONFIG_PATH = os.getenv("CONFIG_PATH", "/config")
 
+_RE_DEVICE_FROM = re.compile(r"from\s+([^(:]+)")
+_RE_DEVICE_LABEL = re.compile(r"Device:\s*([^,]+)")
+
 # STREAM TRACKER
 
 
@@ -86,13 +90,11 @@ class StreamTracker:
 
         activity_str = str(activity_data)
 
-        import re
-
-        device_match = re.search(r"from\s+([^(:]+)", activity_str)
+        device_match = _RE_DEVICE_FROM.search(activity_str)
         if device_match:
             return device_match.group(1).strip()
 
-        device_match = re.search(r"Device:\s*([^,]+)", activity_str)
+        device_match = _RE_DEVICE_LABEL.search(activity_str)
         if device_match:
             return device_match.group(1).strip()
 
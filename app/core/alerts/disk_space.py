@@ -3,7 +3,7 @@
 import json
 import time
 import threading
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional
 import random
 from urllib.error import HTTPError, URLError
 from urllib.request import urlopen
@@ -26,6 +26,7 @@ class DiskSpaceAlert(BaseAlert):
 
     ALERT_TYPE = "Disk-Space"
     ROUTING_EVENT_TYPE = "disk"
+    SUPPORTED_EVENT_TYPES: FrozenSet[str] = frozenset()
     DESCRIPTION = "Notifications when DVR disk space runs low"
     DISK_STATE_SESSION_ID = "disk-space-state"
     BYTES_PER_GIB = 1024 * 1024 * 1024
@@ -12,6 +12,7 @@ from .common.session_manager import SessionManager
 from .common.alert_formatter import AlertFormatter
 from .common.cleanup_mixin import CleanupMixin
 from .common.stream_tracker import StreamTracker
+from ..helpers.event_types import JOBS_CREATED, JOBS_DELETED, PROGRAMS_SET
 from ..helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
 from ..helpers.channel_info import ChannelInfoProvider
 from ..helpers.job_info import JobInfoProvider
@@ -23,6 +24,7 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
 
     ALERT_TYPE = "Recording-Events"
     ROUTING_EVENT_TYPE = "recording"
+    SUPPORTED_EVENT_TYPES = frozenset({JOBS_CREATED, JOBS_DELETED, PROGRAMS_SET})
     DESCRIPTION = (
         "Notifications for recording events (scheduled, started, cancelled, completed)"
     )
@@ -620,11 +622,11 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
 
     def _should_handle_event(self, event_type: str, event_data: Dict[str, Any]) -> bool:
         """Determines if this alert should handle the given recording event type."""
-        if event_type == "jobs.created" and "Name" in event_data:
+        if event_type == JOBS_CREATED and "Name" in event_data:
             return True
 
         if (
-            event_type == "programs.set"
+            event_type == PROGRAMS_SET
             and "Name" in event_data
             and "Value" in event_data
         ):
@@ -634,7 +636,7 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
             if value.startswith("recorded-"):
                 return True
 
-        if event_type == "jobs.deleted" and "Name" in event_data:
+        if event_type == JOBS_DELETED and "Name" in event_data:
             return True
 
         return False
@@ -659,12 +661,12 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
         recording_details = None
         error_occurred = False
 
-        if event_type in ("jobs.created", "jobs.deleted"):
+        if event_type in (JOBS_CREATED, JOBS_DELETED):
             job_id_to_fetch = event_data.get("Name", "")
             if not job_id_to_fetch:
                 log(f"Missing job ID in {event_type} event", level=LOG_STANDARD)
                 return False
-        elif event_type == "programs.set":
+        elif event_type == PROGRAMS_SET:
             value = event_data.get("Value", "")
             if value.startswith("recording-"):
                 job_id_to_fetch = value.replace("recording-", "")
@@ -692,7 +694,7 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
                         f"Failed to pre-fetch job details for '{job_id_to_fetch}'",
                         level=LOG_VERBOSE,
                     )
-                    if event_type != "jobs.deleted":
+                    if event_type != JOBS_DELETED:
                         error_occurred = True
                 else:
                     log(
@@ -705,7 +707,7 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
                     level=LOG_VERBOSE,
                 )
                 log(traceback.format_exc(), level=LOG_VERBOSE)
-                if event_type != "jobs.deleted":
+                if event_type != JOBS_DELETED:
                     error_occurred = True
         elif file_id_to_fetch:
             log(
@@ -741,8 +743,8 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
                 log(traceback.format_exc(), level=LOG_VERBOSE)
 
         if error_occurred:
-            if event_type == "jobs.created" or (
-                event_type == "programs.set" and job_id_to_fetch
+            if event_type == JOBS_CREATED or (
+                event_type == PROGRAMS_SET and job_id_to_fetch
             ):
                 log(
                     f"Aborting {event_type} due to pre-fetch error.", level=LOG_STANDARD
@@ -794,11 +796,11 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
         recording_details: Optional[Dict[str, Any]],
     ) -> bool:
         try:
-            if event_type == "jobs.created":
+            if event_type == JOBS_CREATED:
                 return await self._handle_recording_created(event_data, job_details)
-            elif event_type == "jobs.deleted":
+            elif event_type == JOBS_DELETED:
                 return await self._handle_recording_deleted(event_data, job_details)
-            elif event_type == "programs.set":
+            elif event_type == PROGRAMS_SET:
                 value = event_data.get("Value", "")
                 if value.startswith("recording-"):
                     return await self._handle_recording_started(event_data, job_details)
@@ -1851,7 +1853,6 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
             stale_jobs = []
             async with self._event_lock:
                 active_job_ids = list(self.active_recordings.keys())
-            active_jobs_checked = 0
             MAX_ACTIVE_CHECKS_PER_CYCLE = 50
 
             log(
@@ -1859,37 +1860,36 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
                 level=LOG_VERBOSE,
             )
 
-            for job_id in active_job_ids:
-                if active_jobs_checked >= MAX_ACTIVE_CHECKS_PER_CYCLE:
-                    log(
-                        f"Reached limit of {MAX_ACTIVE_CHECKS_PER_CYCLE} active job checks, will continue in next cycle",
-                        level=LOG_VERBOSE,
-                    )
-                    break
-                active_jobs_checked += 1
+            if len(active_job_ids) > MAX_ACTIVE_CHECKS_PER_CYCLE:
+                log(
+                    f"Reached limit of {MAX_ACTIVE_CHECKS_PER_CYCLE} active job checks, will continue in next cycle",
+                    level=LOG_VERBOSE,
+                )
+            active_job_ids = active_job_ids[:MAX_ACTIVE_CHECKS_PER_CYCLE]
 
-                is_active = False
+            active_status = {}
+            if active_job_ids:
                 try:
                     start_time = time.time()
-                    is_active = await asyncio.to_thread(
-                        self.job_provider.is_job_active, job_id
+                    active_status = await asyncio.to_thread(
+                        self.job_provider.is_jobs_active_bulk, active_job_ids
                     )
                     request_time = time.time() - start_time
 
                     if request_time > 2.0:
                         log(
-                            f"Slow job status check for {job_id}: {request_time:.2f}s",
+                            f"Slow job status check for {len(active_job_ids)} jobs: {request_time:.2f}s",
                             level=LOG_VERBOSE,
                         )
 
                 except Exception as e:
                     log(
-                        f"Error checking active status for job {job_id}: {e}",
+                        f"Error checking active status for jobs: {e}",
                         level=LOG_VERBOSE,
                     )
                     log(traceback.format_exc(), level=LOG_VERBOSE)
-                    continue
 
+            for job_id, is_active in active_status.items():
                 if not is_active:
                     log(
                         f"Job {job_id} is no longer active, marking for removal",
@@ -1918,7 +1918,6 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
             async with self._event_lock:
                 scheduled_snapshot = dict(self.scheduled_recordings)
             scheduled_job_ids = list(scheduled_snapshot.keys())
-            scheduled_jobs_checked = 0
             MAX_SCHEDULED_CHECKS_PER_CYCLE = 50
             current_time = time.time()
 
@@ -1927,38 +1926,36 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
                 level=LOG_VERBOSE,
             )
 
-            for job_id in scheduled_job_ids:
-                if scheduled_jobs_checked >= MAX_SCHEDULED_CHECKS_PER_CYCLE:
-                    log(
-                        f"Reached limit of {MAX_SCHEDULED_CHECKS_PER_CYCLE} scheduled job checks, will continue in next cycle",
-                        level=LOG_VERBOSE,
-                    )
-                    break
-                scheduled_jobs_checked += 1
+            if len(scheduled_job_ids) > MAX_SCHEDULED_CHECKS_PER_CYCLE:
+                log(
+                    f"Reached limit of {MAX_SCHEDULED_CHECKS_PER_CYCLE} scheduled job checks, will continue in next cycle",
+                    level=LOG_VERBOSE,
+                )
+            scheduled_job_ids = scheduled_job_ids[:MAX_SCHEDULED_CHECKS_PER_CYCLE]
 
-                info = scheduled_snapshot[job_id]
-                is_active = True
+            scheduled_status = {}
+            if scheduled_job_ids:
                 try:
                     start_time = time.time()
-                    is_active = await asyncio.to_thread(
-                        self.job_provider.is_job_active, job_id
+                    scheduled_status = await asyncio.to_thread(
+                        self.job_provider.is_jobs_active_bulk, scheduled_job_ids
                     )
                     request_time = time.time() - start_time
 
                     if request_time > 2.0:
                         log(
-                            f"Slow scheduled job status check for {job_id}: {request_time:.2f}s",
+                            f"Slow scheduled job status check for {len(scheduled_job_ids)} jobs: {request_time:.2f}s",
                             level=LOG_VERBOSE,
                         )
 
                 except Exception as e:
                     log(
-                        f"Error checking active status for scheduled job {job_id}: {e}",
+                        f"Error checking active status for scheduled jobs: {e}",
                         level=LOG_VERBOSE,
                     )
                     log(traceback.format_exc(), level=LOG_VERBOSE)
-                    continue
 
+            for job_id, is_active in scheduled_status.items():
                 if not is_active:
                     log(
                         f"Scheduled job {job_id} is no longer active, marking for removal",
@@ -1967,6 +1964,7 @@ class RecordingEventsAlert(BaseAlert, CleanupMixin):
                     stale_scheduled.append(job_id)
                     continue
 
+                info = scheduled_snapshot[job_id]
                 if current_time - info.get("created_at", 0) > 86400:
                     log(
                         f"Scheduled job {job_id} was created over 24 hours ago, marking as stale",
@@ -9,12 +9,19 @@ from .base import BaseAlert
 from .common.session_manager import SessionManager
 from .common.alert_formatter import AlertFormatter
 from .common.cleanup_mixin import CleanupMixin
+from ..helpers.event_types import ACTIVITIES_SET
 from ..helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
 from ..helpers.parsing import is_valid_ip_address, extract_ip_address
-from ..helpers.vod_info import VODInfoProvider, _metadata_id
+from ..helpers.vod_info import VODInfoProvider
 from ..helpers.type_utils import ensure_str
 from ..helpers.activity_recorder import record_vod_watching
 
+_RE_HOURS = re.compile(r"(\d+)h")
+_RE_MINUTES = re.compile(r"(\d+)m")
+_RE_SECONDS = re.compile(r"(\d+)s")
+_RE_FILE_ID = re.compile(r"file-?(\d+)")
+_RE_SESSION_ID = re.compile(r"file\d+-([a-zA-Z0-9.\-]+)")
+
 # UTILITY FUNCTIONS
 
 
@@ -85,15 +92,15 @@ def format_timestamp(timestamp_str: str) -> str:
     minutes = 0
     seconds = 0
 
-    hour_match = re.search(r"(\d+)h", timestamp_str)
+    hour_match = _RE_HOURS.search(timestamp_str)
     if hour_match:
         hours = int(hour_match.group(1))
 
-    minute_match = re.search(r"(\d+)m", timestamp_str)
+    minute_match = _RE_MINUTES.search(timestamp_str)
     if minute_match:
         minutes = int(minute_match.group(1))
 
-    second_match = re.search(r"(\d+)s", timestamp_str)
+    second_match = _RE_SECONDS.search(timestamp_str)
     if second_match:
         seconds = int(second_match.group(1))
 
@@ -144,6 +151,7 @@ class VODWatchingAlert(BaseAlert, CleanupMixin):
 
     ALERT_TYPE = "VOD-Watching"
     ROUTING_EVENT_TYPE = "vod"
+    SUPPORTED_EVENT_TYPES = frozenset({ACTIVITIES_SET})
     DESCRIPTION = "Notifications when someone is watching DVR content"
 
     def __init__(self, alert_manager):
@@ -200,16 +208,10 @@ class VODWatchingAlert(BaseAlert, CleanupMixin):
     def _cache_vod_metadata(self):
         """Updates VOD information cache for processing viewer sessions. Returns item count."""
         try:
-            metadata = self.vod_provider._fetch_metadata()
-            if metadata:
-                self.vod_metadata = {
-                    item_id: item
-                    for item in metadata
-                    if (item_id := _metadata_id(item)) is not None
-                }
-                self.vod_provider.last_fetch = time.time()
-
-                return len(metadata)
+            self.vod_provider._force_refresh()
+            self.vod_metadata = self.vod_provider.metadata_cache
+            if self.vod_metadata:
+                return len(self.vod_metadata)
             else:
                 log("No VOD metadata found to cache", level=LOG_STANDARD)
                 return 0
@@ -236,7 +238,7 @@ class VODWatchingAlert(BaseAlert, CleanupMixin):
         if not is_file_event:
             return False
 
-        if event_type != "activities.set" or "Value" not in event_data:
+        if event_type != ACTIVITIES_SET or "Value" not in event_data:
             return False
 
         value = event_data.get("Value", "")
@@ -274,12 +276,12 @@ class VODWatchingAlert(BaseAlert, CleanupMixin):
                         session_identifier = "-".join(name_parts[2:])
 
             if not file_id:
-                file_match = re.search(r"file-?(\\d+)", event_name)
+                file_match = _RE_FILE_ID.search(event_name)
                 if file_match:
                     file_id = file_match.group(1)
 
             if not session_identifier:
-                id_match = re.search(r"file\\d+-([a-zA-Z0-9\\.\\-]+)", event_name)
+                id_match = _RE_SESSION_ID.search(event_name)
                 if id_match:
                     session_identifier = id_match.group(1)
 
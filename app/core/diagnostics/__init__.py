@@ -1,21 +1,8 @@
 """Runtime diagnostics for ChannelWatch."""
 
-from .connectivity.server import (
-    test_connectivity,
-    test_api_endpoints,
-    test_event_stream,
-)
-from .alerts.channel_watching import test_channel_watching_alert
-from .alerts.disk_space import test_disk_space_alert
-from .alerts.vod_watching import test_vod_watching_alert
-from .alerts.recording_events import (
-    test_recording_events_alert,
-    test_recording_scheduled_alert,
-    test_recording_started_alert,
-    test_recording_completed_alert,
-    test_recording_stopped_alert,
-    test_recording_cancelled_alert,
-)
+import importlib
+from typing import Any, Callable
+
 from ..helpers.logging import log
 
 # ---------------- EXPORTED FUNCTIONS ----------------
@@ -31,22 +18,60 @@ __all__ = [
     "run_test",
 ]
 
+# Diagnostics run once per CLI or UI request, so their modules (and requests)
+# are imported on first use instead of with the package.
+_LAZY_EXPORTS = {
+    "test_connectivity": ".connectivity.server",
+    "test_api_endpoints": ".connectivity.server",
+    "test_event_stream": ".connectivity.server",
+    "test_channel_watching_alert": ".alerts.channel_watching",
+    "test_disk_space_alert": ".alerts.disk_space",
+    "test_vod_watching_alert": ".alerts.vod_watching",
+    "test_recording_events_alert": ".alerts.recording_events",
+    "test_recording_scheduled_alert": ".alerts.recording_events",
+    "test_recording_started_alert": ".alerts.recording_events",
+    "test_recording_completed_alert": ".alerts.recording_events",
+    "test_recording_stopped_alert": ".alerts.recording_events",
+    "test_recording_cancelled_alert": ".alerts.recording_events",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _load(name: str) -> Callable[..., bool]:
+    return globals().get(name) or __getattr__(name)
+
+
 # ---------------- DIAGNOSTIC RUNNER ----------------
 
+# name -> (function, whether it takes the duration argument)
+SERVER_TESTS = {
+    "connectivity": ("test_connectivity", False),
+    "api": ("test_api_endpoints", False),
+    "event_stream": ("test_event_stream", True),
+}
+
 ALERT_TESTS = {
-    "Channel-Watching": test_channel_watching_alert,
-    "ALERT_CHANNEL_WATCHING": test_channel_watching_alert,
-    "Disk-Space": test_disk_space_alert,
-    "ALERT_DISK_SPACE": test_disk_space_alert,
-    "VOD-Watching": test_vod_watching_alert,
-    "ALERT_VOD_WATCHING": test_vod_watching_alert,
-    "Recording-Events": test_recording_events_alert,
-    "ALERT_RECORDING_EVENTS": test_recording_events_alert,
-    "Recording-Scheduled": test_recording_scheduled_alert,
-    "Recording-Started": test_recording_started_alert,
-    "Recording-Completed": test_recording_completed_alert,
-    "Recording-Stopped": test_recording_stopped_alert,
-    "Recording-Cancelled": test_recording_cancelled_alert,
+    "Channel-Watching": "test_channel_watching_alert",
+    "ALERT_CHANNEL_WATCHING": "test_channel_watching_alert",
+    "Disk-Space": "test_disk_space_alert",
+    "ALERT_DISK_SPACE": "test_disk_space_alert",
+    "VOD-Watching": "test_vod_watching_alert",
+    "ALERT_VOD_WATCHING": "test_vod_watching_alert",
+    "Recording-Events": "test_recording_events_alert",
+    "ALERT_RECORDING_EVENTS": "test_recording_events_alert",
+    "Recording-Scheduled": "test_recording_scheduled_alert",
+    "Recording-Started": "test_recording_started_alert",
+    "Recording-Completed": "test_recording_completed_alert",
+    "Recording-Stopped": "test_recording_stopped_alert",
+    "Recording-Cancelled": "test_recording_cancelled_alert",
 }
 
 
@@ -54,17 +79,17 @@ def run_test(
     test_name: str, host: str, port: int, alert_manager=None, duration=30
 ) -> bool:
     """Executes a specified diagnostic with given parameters and returns the result."""
-    if test_name == "connectivity":
-        return test_connectivity(host, port)
-    elif test_name == "api":
-        return test_api_endpoints(host, port)
-    elif test_name == "event_stream":
-        return test_event_stream(host, port, duration)
-    elif test_name in ALERT_TESTS:
-        if not alert_manager:
-            log(f"[FAIL]  alert_manager required for {test_name} test")
-            return False
-        return ALERT_TESTS[test_name](host, port, alert_manager)
-    else:
+    server_test = SERVER_TESTS.get(test_name)
+    if server_test is not None:
+        func_name, takes_duration = server_test
+        func = _load(func_name)
+        return func(host, port, duration) if takes_duration else func(host, port)
+
+    alert_test = ALERT_TESTS.get(test_name)
+    if alert_test is None:
         log(f"[FAIL]  Unknown test: {test_name}")
         return False
+    if not alert_manager:
+        log(f"[FAIL]  alert_manager required for {test_name} test")
+        return False
+    return _load(alert_test)(host, port, alert_manager)
@@ -4,12 +4,28 @@ import asyncio
 import inspect
 import json
 import time
-from typing import Dict, Any, Optional, List
+import traceback
+import httpx
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..alerts.registry import get_alert_class
-from ..helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
+from ..helpers.event_types import HELLO
+from ..helpers.logging import is_verbose, log, LOG_STANDARD, LOG_VERBOSE
 from ..helpers.config import CoreSettings, CONFIG_DIR
 
+# Failures an alert can hit at runtime (bad event payloads, DVR API errors).
+# Anything else is a bug: it is logged with a traceback at verbose level and
+# the remaining alerts for the event still run.
+ALERT_PROCESSING_ERRORS = (
+    AttributeError,
+    KeyError,
+    ValueError,
+    OSError,
+    httpx.HTTPError,
+)
+ERROR_LOG_INTERVAL_SECONDS = 5.0
+
 
 # ALERT MANAGER
 class AlertManager:
@@ -30,10 +46,17 @@ class AlertManager:
         self.settings = settings
         self.dvr = dvr
         self.alert_instances = {}
+        self._by_type: Dict[str, Tuple[Tuple[str, Any], ...]] = {}
+        self._wildcard_alerts: Tuple[Tuple[str, Any], ...] = ()
+        self._dispatch_ready = False
         self.cleanup_interval = 3600
-        self.last_cleanup = time.time()
+        self.cleanup_check_interval = 60
+        self.last_cleanup = time.monotonic()
+        self._background_stop: Optional[asyncio.Event] = None
         self._state_lock = asyncio.Lock()
-        self._notification_history: Dict[str, float] = {}
+        # Kept oldest-first by should_record_activity, which evicts from the front.
+        self._notification_history: Dict[str, float] = OrderedDict()
+        self._last_error_log: Dict[str, float] = {}
 
         self._state_file = CONFIG_DIR / f"session_state_{dvr_id}.json"
         self._save_interval = 30
@@ -41,6 +64,8 @@ class AlertManager:
     # BACKGROUND TASKS (started by EventMonitor._async_monitor_events)
 
     def create_background_tasks(self) -> list:
+        # Created per run: each connection attempt has its own event loop.
+        self._background_stop = asyncio.Event()
         return [
             asyncio.create_task(
                 self._async_cleanup_loop(), name="alert-manager-cleanup"
@@ -50,14 +75,35 @@ class AlertManager:
             ),
         ]
 
+    def shutdown(self) -> None:
+        """Wake the background loops so they exit now instead of after their interval.
+
+        Must run on the monitor's event loop; EventMonitor.stop_monitoring()
+        schedules it there.
+        """
+        if self._background_stop is not None:
+            self._background_stop.set()
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        stop = self._background_stop
+        if stop is None:
+            await asyncio.sleep(timeout)
+            return False
+        try:
+            await asyncio.wait_for(stop.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def _async_cleanup_loop(self):
         while True:
             try:
-                await asyncio.sleep(60)
-                current_time = time.time()
-                if current_time - self.last_cleanup >= self.cleanup_interval:
+                if await self._wait_for_shutdown(self.cleanup_check_interval):
+                    return
+                now = time.monotonic()
+                if now - self.last_cleanup >= self.cleanup_interval:
                     await self._run_cleanup()
-                    self.last_cleanup = current_time
+                    self.last_cleanup = now
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -66,7 +112,8 @@ class AlertManager:
     async def _async_state_save_loop(self):
         while True:
             try:
-                await asyncio.sleep(self._save_interval)
+                if await self._wait_for_shutdown(self._save_interval):
+                    return
                 await self.save_all_state()
             except asyncio.CancelledError:
                 raise
@@ -107,6 +154,7 @@ class AlertManager:
             if alert_class:
                 instance = alert_class(self)
                 self.alert_instances[alert_type] = instance
+                self._dispatch_ready = False
                 return True
             else:
                 log(f"Unknown alert type: {alert_type}")
@@ -118,25 +166,86 @@ class AlertManager:
     def get_registered_alerts(self) -> List[str]:
         return list(self.alert_instances.keys())
 
+    def finalize_registration(self) -> None:
+        """Freeze registered alerts into a per-event-type dispatch table.
+
+        Called once after startup registration; process_event rebuilds lazily if
+        alerts are registered afterwards. Alerts without SUPPORTED_EVENT_TYPES
+        receive every event, and registration order is kept within each bucket.
+        """
+        items = [
+            (alert_type, instance, getattr(instance, "SUPPORTED_EVENT_TYPES", None))
+            for alert_type, instance in self.alert_instances.items()
+        ]
+        known_types = set()
+        for _, _, supported in items:
+            if supported is not None:
+                known_types.update(supported)
+
+        self._by_type = {
+            event_type: tuple(
+                (alert_type, instance)
+                for alert_type, instance, supported in items
+                if supported is None or event_type in supported
+            )
+            for event_type in known_types
+        }
+        self._wildcard_alerts = tuple(
+            (alert_type, instance)
+            for alert_type, instance, supported in items
+            if supported is None
+        )
+        self._dispatch_ready = True
+
     # PROCESSING
 
     async def process_event(
         self, event_type: str, event_data: Dict[str, Any]
     ) -> Optional[str]:
-        if event_type == "hello":
+        if event_type == HELLO:
             return None
+        if not self._dispatch_ready:
+            self.finalize_registration()
 
-        for alert_type, alert_instance in self.alert_instances.items():
+        for alert_type, alert_instance in self._by_type.get(
+            event_type, self._wildcard_alerts
+        ):
             try:
                 result = await alert_instance.process_event(event_type, event_data)
                 if result:
-                    log(f"Alert triggered: {alert_type}", level=LOG_VERBOSE)
+                    if is_verbose():
+                        log(f"Alert triggered: {alert_type}", level=LOG_VERBOSE)
                     return alert_type
+            except ALERT_PROCESSING_ERRORS as e:
+                self._log_processing_error(alert_type, e)
             except Exception as e:
-                log(f"Error processing {alert_type}: {e}")
+                # One alert's bug must not disable the others on this event.
+                self._log_processing_error(alert_type, e, unexpected=True)
 
         return None
 
+    def _log_processing_error(
+        self, alert_type: str, error: Exception, unexpected: bool = False
+    ) -> None:
+        """Log an alert failure at most once per interval per alert type.
+
+        An unexpected error also gets its traceback logged at verbose level,
+        formatted only once the throttle lets the summary line through.
+        """
+        now = time.monotonic()
+        last = self._last_error_log.get(alert_type)
+        if last is not None and now - last < ERROR_LOG_INTERVAL_SECONDS:
+            return
+        self._last_error_log[alert_type] = now
+        if not unexpected:
+            log(f"Error processing {alert_type}: {error}")
+            return
+        log(
+            f"Unexpected error processing {alert_type}: {type(error).__name__}: {error}"
+        )
+        details = traceback.format_exception(type(error), error, error.__traceback__)
+        log("".join(details), level=LOG_VERBOSE)
+
     # STATE PERSISTENCE
 
     def _write_state_file(self, all_state: Dict[str, Any]) -> None:
@@ -1,18 +1,44 @@
 """Monitors and processes Channels DVR server events for alert generation."""
 
 import asyncio
-import json
+import random
+import threading
 import time
 import httpx
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Dict, Any, Optional
-
-from ..helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
-from ..helpers.dvr_connection import build_dvr_base_url
+from typing import Dict, Any, Optional, Union
+
+from ..helpers.event_types import (
+    ACTIVITIES_SET,
+    HELLO,
+    JOBS_CREATED,
+    JOBS_DELETED,
+    PROGRAMS_SET,
+    intern_event_type,
+)
+from ..helpers.logging import is_verbose, log, LOG_STANDARD, LOG_VERBOSE
+from ..helpers.dvr_connection import (
+    EVENT_STREAM_HEADERS,
+    EVENT_STREAM_PATH,
+    build_dvr_base_url,
+)
+from ..helpers.json_codec import loads as json_loads
+from .sse import split_sse_payloads
 
 MAX_RETRY_AFTER_DELAY_SECONDS = 60.0
-RECONNECT_SLEEP_SLICE_SECONDS = 1.0
+EVENT_DISPATCH_QUEUE_SIZE = 1024
+DISPATCH_DRAIN_TIMEOUT_SECONDS = 5.0
+# Verbose mode logs every event the built-in alerts act on, and 1 in N of the rest.
+VERBOSE_ALWAYS_LOGGED_TYPES = frozenset(
+    {HELLO, ACTIVITIES_SET, JOBS_CREATED, JOBS_DELETED, PROGRAMS_SET}
+)
+VERBOSE_EVENT_SAMPLE_RATE = 100
+# The watchdog snapshot reads live freshness off the monitor; pushing every
+# event into its locked registry only needs to happen about once a second.
+WATCHDOG_EVENT_MARK_INTERVAL_SECONDS = 1.0
+# One connection for the SSE stream plus one reusable slot for keep-alive polls.
+STREAM_CLIENT_LIMITS = httpx.Limits(max_connections=2, max_keepalive_connections=1)
 
 
 # CORE MONITOR
@@ -47,15 +73,18 @@ class EventMonitor:
         # State
         self.running = False
         self.connected = False
+        self._stop_event = threading.Event()
         self.monitoring_thread = None
         self.last_message_time = 0
         self.last_event_at = 0.0
         self.last_freshness_at = 0.0
         self.last_freshness_source: Optional[str] = None
         self.watchdog = None
+        self._watchdog_event_marked_at = 0.0
         self._monitor_loop: Optional[asyncio.AbstractEventLoop] = None
         self._active_client: Optional[httpx.AsyncClient] = None
         self._active_response: Optional[httpx.Response] = None
+        self._dispatch_queue: Optional[asyncio.Queue] = None
         self._retry_after_delay: Optional[float] = None
         self._attempt_healthy = False
         self._state_loaded = False
@@ -64,6 +93,11 @@ class EventMonitor:
         self._connection_status: str = "unknown"
         self._last_seen: float = 0.0
 
+        # Cached at start_monitoring(); the log level is fixed after startup.
+        self._verbose = is_verbose()
+        self._verbose_sample_n = VERBOSE_EVENT_SAMPLE_RATE
+        self._verbose_seen = 0
+
         # Keep-alive
         self.ping_interval = 15
         self.last_ping = 0
@@ -75,16 +109,27 @@ class EventMonitor:
         self.keep_alive_success_streak = 0
 
         # Statistics
-        current_time = time.time()
-        self.stats = {
-            "start_time": current_time,
-            "total_events": 0,
-            "previous_total_events": 0,
-            "alert_events": 0,
-            "filtered_events": 0,
-            "error_events": 0,
-            "last_status_update": current_time,
-            "status_update_interval": 300,
+        self._stats_start_time = time.time()
+        self._total_events = 0
+        self._alert_events = 0
+        self._filtered_events = 0
+        self._error_events = 0
+        self._dropped_events = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the event counters.
+
+        Every parsed event lands in exactly one outcome bucket, so total_events
+        equals alert + filtered + error + dropped once the dispatch queue drains.
+        """
+        return {
+            "start_time": self._stats_start_time,
+            "total_events": self._total_events,
+            "alert_events": self._alert_events,
+            "filtered_events": self._filtered_events,
+            "error_events": self._error_events,
+            "dropped_events": self._dropped_events,
         }
 
     # OFFLINE STATUS PROPERTY
@@ -100,24 +145,31 @@ class EventMonitor:
     def start_monitoring(self):
         """Run event monitoring until shutdown is requested."""
         self.running = True
+        self._stop_event.clear()
+        self._verbose = is_verbose()
         self._state_loaded = False
         try:
             self._monitor_events_loop()
         except KeyboardInterrupt:
             log("KeyboardInterrupt received, shutting down...")
             self.running = False
+            self._stop_event.set()
         finally:
             log("Monitoring loop finished.")
 
     def stop_monitoring(self) -> None:
         """Request monitoring shutdown and wake an idle SSE read if one is active."""
         self.running = False
+        self._stop_event.set()
         loop = self._monitor_loop
         if loop is None or not loop.is_running():
             return
 
         try:
             asyncio.run_coroutine_threadsafe(self._close_active_stream(), loop)
+            shutdown = getattr(self.alert_manager, "shutdown", None)
+            if callable(shutdown):
+                loop.call_soon_threadsafe(shutdown)
         except RuntimeError:
             pass
 
@@ -141,7 +193,8 @@ class EventMonitor:
     def _monitor_events_loop(self):
         """Manages continuous connection to event stream with reconnection logic.
 
-        Backoff starts at 1 s and doubles each retry up to 60 s (T20b).
+        Backoff starts at 1 s and doubles each retry up to 60 s (T20b), with
+        +/-50% jitter on each sleep; a server Retry-After is honoured as-is.
         Sets alerts_paused and dvr_status after every attempt.
         """
         reconnect_delay = (
@@ -172,10 +225,14 @@ class EventMonitor:
             retry_after_delay = self._consume_retry_after_delay()
             if self._attempt_healthy:
                 reconnect_delay = 1
-            sleep_delay = (
-                retry_after_delay if retry_after_delay is not None else reconnect_delay
-            )
-            log(f"[{self.dvr_name}] Reconnecting in {sleep_delay}s")
+            if retry_after_delay is not None:
+                sleep_delay = retry_after_delay
+            else:
+                # Spread reconnects so instances do not stampede a restarted DVR.
+                sleep_delay = min(
+                    max_reconnect_delay, reconnect_delay * (0.5 + random.random())
+                )
+            log(f"[{self.dvr_name}] Reconnecting in {sleep_delay:g}s")
             self._sleep_interruptibly(sleep_delay)
 
             if retry_after_delay is None:
@@ -190,12 +247,9 @@ class EventMonitor:
         return delay
 
     def _sleep_interruptibly(self, delay: float) -> None:
-        deadline = time.monotonic() + max(0.0, delay)
-        while self.running:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
-            time.sleep(min(RECONNECT_SLEEP_SLICE_SECONDS, remaining))
+        """Wait out a reconnect delay, returning as soon as shutdown is requested."""
+        if self.running:
+            self._stop_event.wait(max(0.0, delay))
 
     @staticmethod
     def _parse_retry_after(value: Optional[str]) -> Optional[float]:
@@ -237,8 +291,17 @@ class EventMonitor:
         self.last_freshness_source = source
         if source == "event":
             self.last_event_at = current_time
-        if self.watchdog is not None:
-            self.watchdog.mark_fresh(self, source, timestamp=current_time)
+        if self.watchdog is None:
+            return
+        if source == "event":
+            now = time.monotonic()
+            if (
+                now - self._watchdog_event_marked_at
+                < WATCHDOG_EVENT_MARK_INTERVAL_SECONDS
+            ):
+                return
+            self._watchdog_event_marked_at = now
+        self.watchdog.mark_fresh(self, source, timestamp=current_time)
 
     async def _async_monitor_events(self):
         self._monitor_loop = asyncio.get_running_loop()
@@ -247,12 +310,7 @@ class EventMonitor:
                 "EventMonitor requires an alert manager before monitoring events"
             )
 
-        url = f"{self.base_url}/dvr/events/subscribe"
-        headers = {
-            "Accept": "text/event-stream",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
+        url = f"{self.base_url}{EVENT_STREAM_PATH}"
         timeout = httpx.Timeout(connect=10.0, read=None, write=None, pool=None)
 
         if not self._state_loaded:
@@ -264,10 +322,21 @@ class EventMonitor:
             if hasattr(alert, "create_background_tasks"):
                 background_tasks.extend(alert.create_background_tasks())
 
+        dispatch_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_DISPATCH_QUEUE_SIZE)
+        dispatch_task = asyncio.create_task(
+            self._async_dispatch_loop(dispatch_queue), name="event-dispatch"
+        )
+        self._dispatch_queue = dispatch_queue
+
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            # Scoped to the attempt: each reconnect runs in a fresh event loop.
+            async with httpx.AsyncClient(
+                timeout=timeout, limits=STREAM_CLIENT_LIMITS
+            ) as client:
                 self._active_client = client
-                async with client.stream("GET", url, headers=headers) as response:
+                async with client.stream(
+                    "GET", url, headers=EVENT_STREAM_HEADERS
+                ) as response:
                     self._active_response = response
                     if response.status_code != 200:
                         if response.status_code == 429:
@@ -288,18 +357,24 @@ class EventMonitor:
                     )
 
                     try:
-                        lines = response.aiter_lines()
+                        chunks = response.aiter_bytes()
+                        carry = b""
                         while self.running:
                             try:
-                                line = await lines.__anext__()
+                                chunk = await chunks.__anext__()
                             except StopAsyncIteration:
+                                if carry:
+                                    payloads, carry = split_sse_payloads(
+                                        b"", carry, final=True
+                                    )
+                                    for payload in payloads:
+                                        await self._process_event_payload(payload)
                                 break
                             if not self.running:
                                 break
-                            if not line:
-                                continue
-                            log(f"Event: {line}", level=LOG_VERBOSE)
-                            await self._process_event_line(line)
+                            payloads, carry = split_sse_payloads(chunk, carry)
+                            for payload in payloads:
+                                await self._process_event_payload(payload)
                     except httpx.ReadError:
                         if self.running:
                             raise
@@ -318,6 +393,7 @@ class EventMonitor:
         finally:
             self._active_response = None
             self._active_client = None
+            await self._stop_dispatcher(dispatch_queue, dispatch_task)
             for task in background_tasks:
                 task.cancel()
                 try:
@@ -326,6 +402,53 @@ class EventMonitor:
                     pass
             await self.alert_manager.save_all_state()
 
+    async def _async_dispatch_loop(self, queue: asyncio.Queue) -> None:
+        """Feed queued events to the alert manager off the SSE read path.
+
+        A single consumer keeps events in arrival order, which session
+        start/end handling relies on.
+        """
+        while True:
+            event_type, event_data = await queue.get()
+            try:
+                await self._process_event(event_type, event_data)
+            finally:
+                queue.task_done()
+
+    async def _stop_dispatcher(
+        self, queue: asyncio.Queue, task: "asyncio.Task[None]"
+    ) -> None:
+        self._dispatch_queue = None
+        if self.running:
+            try:
+                await asyncio.wait_for(
+                    queue.join(), timeout=DISPATCH_DRAIN_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                log(
+                    f"[{self.dvr_name}] Dropping {queue.qsize()} undispatched events",
+                    level=LOG_STANDARD,
+                )
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _enqueue_event(
+        self, queue: asyncio.Queue, event_type: Any, event_data: Dict[str, Any]
+    ) -> None:
+        try:
+            queue.put_nowait((event_type, event_data))
+        except asyncio.QueueFull:
+            self._dropped_events += 1
+            if self._dropped_events == 1 or self._dropped_events % 100 == 0:
+                log(
+                    f"[{self.dvr_name}] Alert dispatch backlog full; "
+                    f"{self._dropped_events} events dropped",
+                    level=LOG_STANDARD,
+                )
+
     async def _async_keep_alive(self, client: httpx.AsyncClient):
         while self.running and self.connected:
             try:
@@ -334,20 +457,19 @@ class EventMonitor:
                 if not self.connected:
                     break
 
-                current_time = time.time()
+                now = time.monotonic()
                 response = await client.get(f"{self.base_url}/status", timeout=5)
 
                 should_log = (
                     self.last_keep_alive_log == 0
-                    or (current_time - self.last_keep_alive_log)
-                    >= self.keep_alive_log_interval
+                    or (now - self.last_keep_alive_log) >= self.keep_alive_log_interval
                     or response.status_code != 200
                 )
 
                 if response.status_code == 200:
                     self.keep_alive_success_streak += 1
                     self._connection_status = "online"
-                    self._last_seen = current_time
+                    self._last_seen = time.time()
                     self._mark_fresh("poll")
                     if should_log:
                         if self.keep_alive_success_streak > 10:
@@ -357,20 +479,20 @@ class EventMonitor:
                             )
                         else:
                             log("Keep-alive ping successful", level=LOG_VERBOSE)
-                        self.last_keep_alive_log = current_time
+                        self.last_keep_alive_log = now
                 else:
                     log(
                         f"[{self.dvr_name}] Keep-alive ping failed: HTTP {response.status_code}",
                         level=LOG_VERBOSE,
                     )
-                    self.last_keep_alive_log = current_time
+                    self.last_keep_alive_log = now
                     self.keep_alive_success_streak = 0
                     self.alerts_paused = True
                     self._connection_status = "offline"
                     await self._close_active_stream()
                     break
 
-                self.last_ping = current_time
+                self.last_ping = now
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -386,43 +508,65 @@ class EventMonitor:
 
     # PROCESSING
     async def _process_event_line(self, line: str):
+        payload = line[5:].strip() if line.startswith("data:") else line
+        await self._process_event_payload(payload)
+
+    async def _process_event_payload(self, payload: Union[str, bytes]):
         try:
-            data = json.loads(line)
-            self.stats["total_events"] += 1
+            data = json_loads(payload)
+        except ValueError:
+            # JSONDecodeError, or UnicodeDecodeError from the stdlib fallback.
+            return
+        # Read the routing key once here so the dispatcher never touches the dict.
+        event_type = (
+            intern_event_type(data.get("Type")) if isinstance(data, dict) else None
+        )
+        if self._verbose:
+            self._log_verbose_event(payload, event_type)
+
+        try:
+            self._total_events += 1
             self._mark_fresh("event")
-            await self._process_event(data)
-        except json.JSONDecodeError:
-            if line.startswith("data:"):
-                try:
-                    data = json.loads(line[5:].strip())
-                    self.stats["total_events"] += 1
-                    self._mark_fresh("event")
-                    await self._process_event(data)
-                except Exception:
-                    pass
+            if not isinstance(data, dict):
+                raise TypeError(f"expected a JSON object, got {type(data).__name__}")
+            if event_type == HELLO:
+                self._filtered_events += 1
+                return
+            queue = self._dispatch_queue
+            if queue is None:
+                await self._process_event(event_type, data)
+            else:
+                self._enqueue_event(queue, event_type, data)
         except Exception as e:
             log(f"Event processing error: {e}")
-            self.stats["error_events"] += 1
+            self._error_events += 1
+
+    def _log_verbose_event(self, payload: Union[str, bytes], event_type: Any) -> None:
+        """Log alert-relevant events in full and sample the rest of the stream."""
+        self._verbose_seen += 1
+        if (
+            event_type not in VERBOSE_ALWAYS_LOGGED_TYPES
+            and self._verbose_seen % self._verbose_sample_n
+        ):
+            return
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8", "replace")
+        log(f"Event: {payload}", level=LOG_VERBOSE)
 
-    async def _process_event(self, event_data: Dict[str, Any]):
+    async def _process_event(self, event_type: str, event_data: Dict[str, Any]):
         try:
             if self.alert_manager is None:
                 raise RuntimeError(
                     "EventMonitor requires an alert manager before processing events"
                 )
 
-            event_type = event_data.get("Type")
-
-            if event_type == "hello":
-                return
-
             result = await self.alert_manager.process_event(event_type, event_data)
 
             if result:
-                self.stats["alert_events"] += 1
+                self._alert_events += 1
             else:
-                self.stats["filtered_events"] += 1
+                self._filtered_events += 1
 
         except Exception as e:
-            self.stats["error_events"] += 1
+            self._error_events += 1
             log(f"Event processing error: {e}")
@@ -0,0 +1,38 @@
+"""Incremental splitting of the Channels DVR server-sent event stream."""
+
+from typing import List, Tuple
+
+DATA_PREFIX = b"data:"
+MAX_PENDING_BYTES = 1024 * 1024
+
+
+def split_sse_payloads(
+    chunk: bytes, carry: bytes = b"", final: bool = False
+) -> Tuple[List[bytes], bytes]:
+    """Split raw stream bytes into complete event payloads.
+
+    Returns the payload of every complete non-empty ``data:`` line, with the
+    prefix removed, plus the trailing partial line to pass back as ``carry``
+    with the next chunk. Channels DVR also sends events as bare JSON lines, so
+    those are kept; comments, other SSE fields and anything else are dropped
+    before they reach the JSON decoder. With ``final`` set the stream has
+    ended and the partial line is treated as complete. Payloads stay as bytes
+    so the JSON decoder can read them without a separate UTF-8 decode step.
+    """
+    buffer = carry + chunk if carry else chunk
+    lines = buffer.split(b"\n")
+    carry = b"" if final else lines.pop()
+    if len(carry) > MAX_PENDING_BYTES:
+        raise ValueError(f"SSE line exceeds {MAX_PENDING_BYTES} bytes")
+
+    payloads = []
+    for line in lines:
+        if line.startswith(DATA_PREFIX):
+            line = line[5:].strip()
+        else:
+            line = line.strip()
+            if not line.startswith(b"{"):
+                continue
+        if line:
+            payloads.append(line)
+    return payloads, carry
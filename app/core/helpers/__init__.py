@@ -15,6 +15,7 @@ from .structured_log import set_log_context, clear_log_context, log_context
 from .parsing import (
     extract_channel_number,
     extract_channel_name,
+    extract_channel_details,
     extract_device_name,
     extract_ip_address,
     extract_resolution,
@@ -47,6 +48,7 @@ __all__ = [
     "log_context",
     "extract_channel_number",
     "extract_channel_name",
+    "extract_channel_details",
     "extract_device_name",
     "extract_ip_address",
     "extract_resolution",
@@ -1,23 +1,57 @@
 """Helper module for recording activities directly to the history file."""
 
+import itertools
 import json
 import time
 import datetime
 import os
 import uuid
 import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, List, Optional, Tuple
 
-from .logging import log, LOG_STANDARD, LOG_VERBOSE
-from .atomic_io import atomic_write_json
+from .logging import is_verbose, log, LOG_STANDARD, LOG_VERBOSE
+from .atomic_io import atomic_write_bytes
+from .json_codec import dumps as json_dumps, loads as json_loads
 
 # CONSTANTS
 CONFIG_DIR = os.getenv("CONFIG_PATH", "/config")
 HISTORY_FILE = os.path.join(CONFIG_DIR, "activity_history.json")
+# Recorders queue entries under _pending_history_lock; whichever thread holds
+# _history_file_lock writes every queued entry in one pass, so a burst of
+# events costs one fsync'd rewrite instead of one per event and only the
+# writing thread waits on disk.
 _history_file_lock = threading.Lock()
+_pending_history_lock = threading.Lock()
+_pending_history: List[Dict[str, Any]] = []
+_last_flush_ok = True
 
 COOLDOWN_PERIOD = 5
+MAX_HISTORY_ENTRIES = 500
+NOTIFICATION_HISTORY_TTL = 3600
+MAX_NOTIFICATION_HISTORY = 512
+_DATED_RECORDING_EVENTS = frozenset({"Scheduled", "Cancelled"})
+
+# Random per process, so ids stay unique across restarts without paying for a
+# urandom read on every event. Fits the 36-character activity_event.id column.
+_ACTIVITY_ID_PREFIX = uuid.uuid4().hex[:16]
+_activity_id_sequence = itertools.count()
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp.
+_timestamp_prefix: Tuple[int, str] = (-1, "")
+# (epoch minute, local today, local tomorrow). UTC offsets are whole minutes,
+# so local midnight always falls on a minute boundary and this never lags.
+_date_bounds: Tuple[int, datetime.date, datetime.date] = (
+    -1,
+    datetime.date.min,
+    datetime.date.min,
+)
+
+# Parsed history from our last write, reused while the file on disk still
+# matches the (path, mtime_ns, size) recorded right after that write.
+_history_cache: Optional[Deque[Dict[str, Any]]] = None
+_history_cache_signature: Optional[Tuple[str, int, int]] = None
 
 
 def _history_file_path() -> str:
@@ -28,18 +62,20 @@ def _history_file_path() -> str:
     return HISTORY_FILE
 
 
+_ICON_MAP: Dict[str, str] = {
+    "watching_channel": "tv",
+    "watching_vod": "play",
+    "recording_event": "video",
+    "disk_alert": "alert-circle",
+    "disk_status": "alert-circle",
+    "system": "cpu",
+    "test_event": "bell",
+}
+
+
 def get_icon_for_activity_type(activity_type: str) -> str:
     """Return icon name based on activity type."""
-    icon_map = {
-        "watching_channel": "tv",
-        "watching_vod": "play",
-        "recording_event": "video",
-        "disk_alert": "alert-circle",
-        "disk_status": "alert-circle",
-        "system": "cpu",
-        "test_event": "bell",
-    }
-    return icon_map.get(activity_type, "bell")
+    return _ICON_MAP.get(activity_type, "bell")
 
 
 # FILE OPERATIONS
@@ -50,8 +86,8 @@ def load_history():
         return []
 
     try:
-        with open(history_file, "r") as f:
-            return json.load(f)
+        with open(history_file, "rb") as f:
+            return json_loads(f.read())
     except json.JSONDecodeError:
         quarantined_path = quarantine_malformed_history_file()
         suffix = f"; quarantined at {quarantined_path}" if quarantined_path else ""
@@ -68,13 +104,94 @@ def load_history():
 def save_history(history):
     """Save the activity history to file."""
     try:
-        atomic_write_json(Path(_history_file_path()), history, indent=2)
+        # Compact output: indentation forces the stdlib onto its pure-Python
+        # encoder, which dominated the cost of every recorded event.
+        atomic_write_bytes(Path(_history_file_path()), json_dumps(history))
         return True
     except Exception as e:
         log(f"Error saving activity history: {e}", level=LOG_STANDARD)
         return False
 
 
+def _new_activity_id() -> str:
+    return f"{_ACTIVITY_ID_PREFIX}-{next(_activity_id_sequence):016x}"
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time in ISO 8601 with microseconds.
+
+    Only the date-and-seconds part is formatted through datetime, once per
+    second; entries recorded within the same second keep distinct, ordered
+    timestamps.
+    """
+    global _timestamp_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_prefix
+    if second != cached_second:
+        prefix = datetime.datetime.fromtimestamp(
+            second, datetime.timezone.utc
+        ).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_prefix = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
+
+def _history_signature(path: str) -> Optional[Tuple[str, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _prepend_history(entry: Dict[str, Any]) -> bool:
+    """Insert one entry at the head of the history, keeping the newest records.
+
+    If another thread is already writing, the entry is left for that writer and
+    this call returns without waiting on disk I/O. A writer re-checks the queue
+    after releasing the lock, so an entry queued during its write is never
+    stranded. The file is only re-parsed when something else (the UI clearing
+    history, a DVR purge) has changed it since this process last wrote it.
+    """
+    with _pending_history_lock:
+        _pending_history.append(entry)
+    while True:
+        if not _history_file_lock.acquire(blocking=False):
+            return True
+        try:
+            saved = _flush_pending_history()
+        finally:
+            _history_file_lock.release()
+        with _pending_history_lock:
+            if not _pending_history:
+                return saved
+
+
+def _flush_pending_history() -> bool:
+    global _history_cache, _history_cache_signature, _last_flush_ok, _pending_history
+    with _pending_history_lock:
+        batch, _pending_history = _pending_history, []
+    if not batch:
+        # A concurrent flush already wrote this thread's entry.
+        return _last_flush_ok
+
+    path = _history_file_path()
+    if _history_cache is None or _history_cache_signature != _history_signature(path):
+        history = load_history()
+        if not isinstance(history, list):
+            history = []
+        _history_cache = deque(history, maxlen=MAX_HISTORY_ENTRIES)
+
+    _history_cache.extendleft(batch)
+    _last_flush_ok = save_history(list(_history_cache))
+    if _last_flush_ok:
+        _history_cache_signature = _history_signature(path)
+    else:
+        _history_cache = None
+        _history_cache_signature = None
+    return _last_flush_ok
+
+
 def quarantine_malformed_history_file() -> Optional[str]:
     """Move a malformed legacy activity history file aside without deleting it."""
     try:
@@ -101,40 +218,72 @@ def should_record_activity(
 ) -> bool:
     current_time = time.time()
 
-    if tracking_key in notification_history:
-        last_notification_time = notification_history[tracking_key]
+    last_notification_time = notification_history.get(tracking_key)
+    if last_notification_time is not None:
         time_since_last = current_time - last_notification_time
 
         if time_since_last < COOLDOWN_PERIOD:
-            log(
-                f"Skipping duplicate activity for {tracking_key} (cooldown: {time_since_last:.1f}s < {COOLDOWN_PERIOD}s)",
-                level=LOG_VERBOSE,
-            )
+            if is_verbose():
+                log(
+                    f"Skipping duplicate activity for {tracking_key} (cooldown: {time_since_last:.1f}s < {COOLDOWN_PERIOD}s)",
+                    level=LOG_VERBOSE,
+                )
             return False
+        # Re-insert at the end so the history stays ordered oldest-first.
+        notification_history.pop(tracking_key, None)
 
     notification_history[tracking_key] = current_time
+    _evict_notification_history(notification_history, current_time)
     return True
 
 
-def cleanup_notification_history(
-    notification_history: Dict[str, float],
+def _evict_notification_history(
+    notification_history: Dict[str, float], current_time: float
 ) -> None:
-    current_time = time.time()
-    keys_to_remove = [
-        k for k, ts in notification_history.items() if current_time - ts > 3600
-    ]
+    """Drop expired or excess entries from the oldest end of the history."""
+    while notification_history:
+        oldest_key = next(iter(notification_history))
+        if (
+            len(notification_history) <= MAX_NOTIFICATION_HISTORY
+            and current_time - notification_history[oldest_key]
+            <= NOTIFICATION_HISTORY_TTL
+        ):
+            return
+        notification_history.pop(oldest_key, None)
 
-    for key in keys_to_remove:
-        del notification_history[key]
 
-    if keys_to_remove:
-        log(
-            f"Cleaned up {len(keys_to_remove)} old notification history entries",
-            level=LOG_VERBOSE,
-        )
+# ACTIVITY RECORDING
+def _append_activity(
+    activity_type: str,
+    title: str,
+    message: str,
+    icon: str,
+    tracking_key: str,
+    notification_history: Dict[str, float],
+    fields: Dict[str, Any],
+    label: str,
+) -> bool:
+    """Apply the duplicate cooldown, then prepend one entry to the history."""
+    if not should_record_activity(tracking_key, notification_history):
+        return True
+
+    entry: Dict[str, Any] = {
+        "id": _new_activity_id(),
+        "type": activity_type,
+        "title": title,
+        "message": message,
+        "timestamp": _utc_now_iso(),
+        "icon": icon,
+    }
+    entry.update(fields)
+
+    if not _prepend_history(entry):
+        return False
+    if is_verbose():
+        log(f"{label.capitalize()} recorded: {message}", level=LOG_VERBOSE)
+    return True
 
 
-# ACTIVITY RECORDING
 def record_activity(
     activity_type: str,
     title: str,
@@ -169,51 +318,27 @@ def record_activity(
         else:
             tracking_key = f"{dvr_key}-{activity_type}-{device_identifier}"
 
-        if len(_history) > 100:
-            cleanup_notification_history(_history)
-
-        if not should_record_activity(tracking_key, _history):
-            log(f"Skipping duplicate activity for {tracking_key}", level=LOG_VERBOSE)
-            return True
-
-        activity_id = str(uuid.uuid4())
-
-        new_activity = {
-            "id": activity_id,
-            "type": activity_type,
-            "title": title,
-            "message": message,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "icon": get_icon_for_activity_type(activity_type),
-            "channel_name": channel_name or "",
-            "channel_number": channel_number or "",
-            "device_name": device_name or "",
-            "device_ip": device_ip or "",
-            "program_title": program_title or "",
-            "image_url": image_url or "",
-            "stream_source": stream_source or "",
-            "extra": extra or {},
-            "dvr_id": dvr_id or "",
-            "dvr_name": dvr_name or "",
-        }
-
-        with _history_file_lock:
-            history = load_history()
-            history.insert(0, new_activity)
-
-            if len(history) > 500:
-                history = history[:500]
-
-            saved = save_history(history)
-
-        if saved:
-            log(
-                f"Activity recorded directly to history file: {title} - {message}",
-                level=LOG_VERBOSE,
-            )
-            return True
-        else:
-            return False
+        return _append_activity(
+            activity_type,
+            title,
+            message,
+            get_icon_for_activity_type(activity_type),
+            tracking_key,
+            _history,
+            {
+                "channel_name": channel_name or "",
+                "channel_number": channel_number or "",
+                "device_name": device_name or "",
+                "device_ip": device_ip or "",
+                "program_title": program_title or "",
+                "image_url": image_url or "",
+                "stream_source": stream_source or "",
+                "extra": extra or {},
+                "dvr_id": dvr_id or "",
+                "dvr_name": dvr_name or "",
+            },
+            label="activity",
+        )
 
     except Exception as e:
         log(f"Error recording activity to history file: {e}", level=LOG_STANDARD)
@@ -264,16 +389,20 @@ def record_vod_watching(
 
 def format_scheduled_date(scheduled_datetime: datetime.datetime) -> str:
     """Format a scheduled date into a user-friendly string."""
+    global _date_bounds
     try:
-        now = datetime.datetime.now()
-        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + datetime.timedelta(days=1)
+        minute = int(time.time()) // 60
+        if minute != _date_bounds[0]:
+            today = datetime.date.today()
+            _date_bounds = (minute, today, today + datetime.timedelta(days=1))
+        _, today, tomorrow = _date_bounds
 
         time_str = scheduled_datetime.strftime("%I:%M %p")
 
-        if scheduled_datetime.date() == today.date():
+        scheduled_date = scheduled_datetime.date()
+        if scheduled_date == today:
             return f"Today at {time_str}"
-        elif scheduled_datetime.date() == tomorrow.date():
+        elif scheduled_date == tomorrow:
             return f"Tomorrow at {time_str}"
         else:
             return f"{scheduled_datetime.strftime('%b %d, %Y')} at {time_str}"
@@ -301,7 +430,7 @@ def record_recording_event(
 
         event_type = event_type.strip()
 
-        if event_type in ["Scheduled", "Cancelled"] and scheduled_datetime:
+        if event_type in _DATED_RECORDING_EVENTS and scheduled_datetime:
             formatted_date = format_scheduled_date(scheduled_datetime)
             activity_message = (
                 f"{event_type}: {program_name} on {channel_name} for {formatted_date}"
@@ -314,43 +443,23 @@ def record_recording_event(
             f"{dvr_key}-recording_event-{event_type}-{program_name}-{channel_name}"
         )
 
-        activity_id = str(uuid.uuid4())
-
-        if not should_record_activity(tracking_key, _history):
-            log(
-                f"Skipping duplicate recording event: {tracking_key}", level=LOG_VERBOSE
-            )
-            return True
-
-        new_activity = {
-            "id": activity_id,
-            "type": "recording_event",
-            "title": "Recording Event",
-            "message": activity_message,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "icon": "video",
-            "channel_name": channel_name or "",
-            "program_title": program_name or "",
-            "image_url": image_url or "",
-            "dvr_id": dvr_id or "",
-            "dvr_name": dvr_name or "",
-            "extra": extra or {},
-        }
-
-        with _history_file_lock:
-            history = load_history()
-            history.insert(0, new_activity)
-
-            if len(history) > 500:
-                history = history[:500]
-
-            saved = save_history(history)
-
-        if saved:
-            log(f"Recording event recorded: {activity_message}", level=LOG_VERBOSE)
-            return True
-        else:
-            return False
+        return _append_activity(
+            "recording_event",
+            "Recording Event",
+            activity_message,
+            "video",
+            tracking_key,
+            _history,
+            {
+                "channel_name": channel_name or "",
+                "program_title": program_name or "",
+                "image_url": image_url or "",
+                "dvr_id": dvr_id or "",
+                "dvr_name": dvr_name or "",
+                "extra": extra or {},
+            },
+            label="recording event",
+        )
 
     except Exception as e:
         log(f"Error recording recording event: {e}", level=LOG_STANDARD)
@@ -388,44 +497,24 @@ def record_disk_status(
             f"disk_alert-{dvr_identifier}-{activity_title}-{free_percentage:.1f}"
         )
 
-        activity_id = str(uuid.uuid4())
-
-        if not should_record_activity(tracking_key, _history):
-            log(
-                f"Skipping duplicate disk status alert: {tracking_key}",
-                level=LOG_VERBOSE,
-            )
-            return True
-
-        new_activity: Dict[str, Any] = {
-            "id": activity_id,
-            "type": "disk_alert",
-            "title": activity_title,
-            "message": activity_message,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "icon": "alert-circle",
+        fields: Dict[str, Any] = {
             "extra": extra or {},
             "dvr_id": dvr_id or "",
             "dvr_name": dvr_name or "",
         }
-
         if is_test:
-            new_activity["is_test"] = True
-
-        with _history_file_lock:
-            history = load_history()
-            history.insert(0, new_activity)
-
-            if len(history) > 500:
-                history = history[:500]
-
-            saved = save_history(history)
-
-        if saved:
-            log(f"Disk status alert recorded: {activity_message}", level=LOG_VERBOSE)
-            return True
-        else:
-            return False
+            fields["is_test"] = True
+
+        return _append_activity(
+            "disk_alert",
+            activity_title,
+            activity_message,
+            "alert-circle",
+            tracking_key,
+            _history,
+            fields,
+            label="disk status alert",
+        )
 
     except Exception as e:
         log(f"Error recording disk status alert: {e}", level=LOG_STANDARD)
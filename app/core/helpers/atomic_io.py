@@ -171,7 +171,7 @@ def atomic_write_json(
     path: Path,
     payload: Any,
     *,
-    indent: int = 2,
+    indent: int | None = 2,
     sort_keys: bool = False,
     temp_path: Path | None = None,
 ) -> Path:
@@ -1,12 +1,13 @@
 """Channel information provider for retrieving and caching Channels DVR channel data."""
 
 from typing import Dict, Any, Optional
-import httpx
 import time
 from threading import Lock
 
+from .json_codec import loads as json_loads
 from .logging import log, LOG_STANDARD
 from .dvr_connection import build_dvr_base_url
+from .http_pool import get_client
 # Import channel data extraction utilities
 
 
@@ -28,13 +29,17 @@ class ChannelInfoProvider:
         self.channel_cache = {}
         self.channel_cache_timestamp = 0
         self.cache_lock = Lock()
+        self._client = get_client(self.host, self.port)
 
     # DATA RETRIEVAL
     def get_channel_info(self, channel_number: str) -> Optional[Dict[str, Any]]:
         """Retrieve complete information for a specific channel number."""
         channel_number_str = str(channel_number)
-        if channel_number_str in self.channel_cache:
-            return self.channel_cache[channel_number_str]
+        # cache_channels swaps in a new dict rather than mutating this one, so a
+        # single .get() is safe without the lock.
+        channel = self.channel_cache.get(channel_number_str)
+        if channel is not None:
+            return channel
 
         self.cache_channels()
         return self.channel_cache.get(channel_number_str)
@@ -66,27 +71,24 @@ class ChannelInfoProvider:
             ):
                 return len(self.channel_cache)
 
-            response = httpx.get(f"{self.base_url}/api/v1/channels", timeout=10)
+            response = self._client.get(f"{self.base_url}/api/v1/channels", timeout=10)
             if response.status_code == 200:
-                channels_data = response.json()
+                channels_data = json_loads(response.content)
 
+                # Keep only the fields callers read; the full lineup payload is
+                # large and was otherwise held for the life of the cache.
                 processed_channels = {}
                 for channel in channels_data:
                     number = channel.get("number")
-                    name = channel.get("name")
-                    logo_url = (
-                        channel.get("logo_url")
+                    if not number:
+                        continue
+                    processed_channels[str(number)] = {
+                        "name": channel.get("name") or "Unknown Channel",
+                        "logo_url": channel.get("logo_url")
                         or channel.get("image_url")
                         or channel.get("image")
-                    )
-
-                    if number:
-                        channel_number_str = str(number)
-                        processed_channels[channel_number_str] = {
-                            "name": name or "Unknown Channel",
-                            "logo_url": logo_url or "",
-                            "raw_data": channel,
-                        }
+                        or "",
+                    }
 
                 self.channel_cache = processed_channels
                 self.channel_cache_timestamp = current_time
@@ -0,0 +1,161 @@
+"""Fail-fast circuit breakers for Channels DVR API endpoints."""
+
+import random
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+from .logging import log, LOG_STANDARD, LOG_VERBOSE
+
+
+class Circuit:
+    """Stops calling a DVR endpoint for a while after repeated failures.
+
+    Closed: every call is allowed. After FAILURE_THRESHOLD failures within
+    FAILURE_WINDOW_SECONDS the circuit opens and allow() returns False, so
+    callers fall back to cached data instead of waiting out a timeout. Once
+    OPEN_DURATION_SECONDS pass, up to HALF_OPEN_PROBES calls are let through;
+    a success closes the circuit and a failure opens it again.
+    """
+
+    FAILURE_THRESHOLD = 5
+    FAILURE_WINDOW_SECONDS = 30
+    OPEN_DURATION_SECONDS = 60
+    HALF_OPEN_PROBES = 3
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._window_started_at: Optional[float] = None
+        self._opened_at: Optional[float] = None
+        self._probes = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.OPEN_DURATION_SECONDS:
+                return False
+            if self._probes >= self.HALF_OPEN_PROBES:
+                return False
+            self._probes += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._window_started_at = None
+            self._opened_at = None
+            self._probes = 0
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True when this failure opened the circuit."""
+        now = time.monotonic()
+        with self._lock:
+            if self._opened_at is not None:
+                self._opened_at = now
+                self._probes = 0
+                return False
+            if (
+                self._window_started_at is None
+                or now - self._window_started_at > self.FAILURE_WINDOW_SECONDS
+            ):
+                self._window_started_at = now
+                self._failures = 0
+            self._failures += 1
+            if self._failures >= self.FAILURE_THRESHOLD:
+                self._opened_at = now
+                self._probes = 0
+                return True
+            return False
+
+
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+def circuit_get(
+    circuit: Circuit,
+    client: httpx.Client,
+    url: str,
+    timeout: float,
+    attempts: int = RETRY_ATTEMPTS,
+) -> httpx.Response:
+    """GET through a circuit; transport errors and 5xx responses count as failures.
+
+    Dropped connections and 502/503/504 answers are retried with exponential
+    backoff and full jitter, honouring Retry-After, for up to `attempts` tries.
+    All attempts share the `timeout` budget, and only the final outcome is
+    counted against the circuit. Callers check circuit.allow() first and serve
+    their fallback when it is closed to them.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        attempt += 1
+        remaining = max(deadline - time.monotonic(), 0.1)
+        try:
+            response = client.get(url, timeout=remaining)
+        except httpx.TimeoutException:
+            _record_failure(circuit)
+            raise
+        except httpx.TransportError as e:
+            if _sleep_before_retry(url, attempt, attempts, deadline, None, e):
+                continue
+            _record_failure(circuit)
+            raise
+
+        if response.status_code in _RETRY_STATUSES and _sleep_before_retry(
+            url, attempt, attempts, deadline, response, response.status_code
+        ):
+            response.close()
+            continue
+        if response.status_code >= 500:
+            _record_failure(circuit)
+        else:
+            circuit.record_success()
+        return response
+
+
+def _sleep_before_retry(
+    url: str,
+    attempt: int,
+    attempts: int,
+    deadline: float,
+    response: Optional[httpx.Response],
+    reason: object,
+) -> bool:
+    """Wait out the backoff for another attempt; False when none is left."""
+    if attempt >= attempts:
+        return False
+    delay = random.uniform(0, RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after and retry_after.isdigit():
+        delay = float(retry_after)
+    if time.monotonic() + delay >= deadline:
+        return False
+    log(
+        f"Retrying {url} in {delay:.2f}s after {reason} "
+        f"(attempt {attempt + 1}/{attempts})",
+        level=LOG_VERBOSE,
+    )
+    time.sleep(delay)
+    return True
+
+
+def _record_failure(circuit: Circuit) -> None:
+    if circuit.record_failure():
+        log(
+            f"DVR {circuit.name} endpoint keeps failing; skipping requests for "
+            f"{circuit.OPEN_DURATION_SECONDS}s",
+            level=LOG_STANDARD,
+        )
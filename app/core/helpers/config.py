@@ -3,7 +3,7 @@ import json
 import os
 from pathlib import Path
 from dataclasses import dataclass, fields, field
-from typing import Optional, Any
+from typing import Any, ClassVar, Optional
 from threading import Lock
 
 # Import custom logger
@@ -60,7 +60,10 @@ def _coerce_dvr_servers(value: Any) -> list[dict[str, Any]]:
 
 
 # SETTINGS
-@dataclass
+# slots: one instance per DVR copy is read on every alert path and never
+# grows attributes beyond its fields. Not frozen: per-DVR overrides are applied
+# to a copy() with setattr.
+@dataclass(slots=True)
 class CoreSettings:
     # DVR Servers
     dvr_servers: list[dict[str, Any]] = field(default_factory=list)
@@ -197,6 +200,8 @@ class CoreSettings:
 
     # Singleton
     _instance = None
+    # Populated once below the class body; fields() introspection is not free.
+    _FIELD_NAMES: ClassVar[frozenset[str]] = frozenset()
 
     def __post_init__(self):
         self._load_and_override()
@@ -420,10 +425,8 @@ class CoreSettings:
             key_file,
         )
 
-        cls_fields = {f.name: f for f in fields(self)}
-        for key, value in persisted_merged.items():
-            if key in cls_fields:
-                setattr(self, key, value)
+        for key in persisted_merged.keys() & self._FIELD_NAMES:
+            setattr(self, key, persisted_merged[key])
 
         self._override_from_env()
         self._warn_if_dvr_soft_limit_exceeded()
@@ -446,13 +449,19 @@ class CoreSettings:
     @classmethod
     def get(cls) -> "CoreSettings":
         """Retrieve singleton settings instance, initializing on first call."""
-        if cls._instance is None:
+        # Read once: callers reset _instance to force a reload, and a second
+        # read could observe that reset and return None.
+        instance = cls._instance
+        if instance is None:
             with _lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+                instance = cls._instance
+                if instance is None:
+                    instance = cls._instance = cls()
+        return instance
 
 
+CoreSettings._FIELD_NAMES = frozenset(f.name for f in fields(CoreSettings))
+
 _lock = Lock()
 
 
@@ -3,6 +3,16 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+EVENT_STREAM_PATH = "/dvr/events/subscribe"
+EVENT_STREAM_HEADERS = {
+    "Accept": "text/event-stream",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    # A compressed event stream can be buffered server-side until a gzip block
+    # fills, delaying events; ask for it uncompressed.
+    "Accept-Encoding": "identity",
+}
+
 
 def format_dvr_http_host(host: Any) -> str:
     """Format a DVR host for use in an HTTP origin."""
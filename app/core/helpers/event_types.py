@@ -0,0 +1,16 @@
+"""Channels DVR event-stream type names, interned for identity-fast comparisons."""
+
+import sys
+
+HELLO = sys.intern("hello")
+ACTIVITIES_SET = sys.intern("activities.set")
+JOBS_CREATED = sys.intern("jobs.created")
+JOBS_DELETED = sys.intern("jobs.deleted")
+PROGRAMS_SET = sys.intern("programs.set")
+
+
+def intern_event_type(event_type):
+    """Intern an event type parsed off the wire so equality hits the identity fast path."""
+    if type(event_type) is str:
+        return sys.intern(event_type)
+    return event_type
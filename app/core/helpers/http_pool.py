@@ -0,0 +1,46 @@
+"""Shared keep-alive HTTP clients, one per Channels DVR server."""
+
+import atexit
+import threading
+from typing import Dict, Tuple
+
+import httpx
+
+_LIMITS = httpx.Limits(max_keepalive_connections=16)
+# Guide XML and job/recording JSON compress well; httpx decodes transparently,
+# and a DVR without gzip support simply answers uncompressed.
+_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+_clients: Dict[Tuple[str, int], httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(host: str, port: int) -> httpx.Client:
+    """Return the shared client for a DVR so its providers reuse connections.
+
+    Guide, job, recording and channel lookups against the same server all draw
+    from one connection pool. Callers pass per-request timeouts and must not
+    close the returned client.
+    """
+    key = (host, int(port))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(limits=_LIMITS, headers=_HEADERS)
+            _clients[key] = client
+        return client
+
+
+def close_all() -> None:
+    """Close every pooled client; later get_client() calls open fresh ones."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_all)
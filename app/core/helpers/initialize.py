@@ -14,6 +14,15 @@ from .config import CoreSettings
 from ..dvr_client import check_version_compatibility
 
 
+# (settings toggle, registered alert type), in registration order.
+ALERT_SETTINGS = (
+    ("alert_channel_watching", "Channel-Watching"),
+    ("alert_disk_space", "Disk-Space"),
+    ("alert_vod_watching", "VOD-Watching"),
+    ("alert_recording_events", "Recording-Events"),
+)
+
+
 # CONNECTION
 def check_server_connectivity(host: str, port: int) -> bool:
     """Verify connection to Channels DVR server and report version information."""
@@ -119,30 +128,23 @@ def initialize_alerts(
         )
     alert_manager = AlertManager(notification_manager, settings, dvr=dvr)
     registered_alerts = []
+    enabled_alerts = []
 
-    alert_mapping = {
-        "alert_channel_watching": "Channel-Watching",
-        "alert_disk_space": "Disk-Space",
-        "alert_vod_watching": "VOD-Watching",
-        "alert_recording_events": "Recording-Events",
-    }
-
-    for setting_attr, alert_type in alert_mapping.items():
+    for setting_attr, alert_type in ALERT_SETTINGS:
         if not getattr(settings, setting_attr, False):
             continue
+        enabled_alerts.append(alert_type)
         if alert_manager.register_alert(alert_type):
             registered_alerts.append(alert_type)
+    alert_manager.finalize_registration()
 
     if registered_alerts and not test_mode:
         has_providers = (
             notification_manager and notification_manager.get_active_providers()
         )
-        notification_types = [
-            t for attr, t in alert_mapping.items() if getattr(settings, attr, False)
-        ]
         log(f"Monitoring: {', '.join(registered_alerts)}")
-        if has_providers and notification_types:
-            log(f"Notifications enabled: {', '.join(notification_types)}")
+        if has_providers and enabled_alerts:
+            log(f"Notifications enabled: {', '.join(enabled_alerts)}")
 
     return alert_manager
 
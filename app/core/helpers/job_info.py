@@ -2,12 +2,14 @@
 
 import time
 import threading
-import json
 import httpx
 from typing import Dict, Any, List, Optional
 
-from .logging import log, LOG_STANDARD, LOG_VERBOSE
+from .logging import is_verbose, log, LOG_STANDARD, LOG_VERBOSE
 from .dvr_connection import build_dvr_base_url
+from .circuit import Circuit, circuit_get
+from .http_pool import get_client
+from .json_codec import JSONDecodeError, loads as json_loads
 
 
 # JOB INFO
@@ -28,6 +30,12 @@ class JobInfoProvider:
         self._jobs_cache_time = 0
         self._cache_ttl = cache_ttl
         self._lock = threading.Lock()
+        self._refreshing = False
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        self._client = get_client(self.host, self.port)
+        self._jobs_circuit = Circuit("jobs")
+        self._recordings_circuit = Circuit("recordings")
 
     def _get_base_url(self) -> str:
         """Generate base URL for API requests to Channels DVR server."""
@@ -37,17 +45,14 @@ class JobInfoProvider:
     def cache_jobs(self) -> int:
         """Fetch and store all active recording jobs from the server."""
         url = f"{self._get_base_url()}/api/v1/jobs"
+        if not self._jobs_circuit.allow():
+            return 0
         try:
-            response = httpx.get(url, timeout=15)
+            response = circuit_get(self._jobs_circuit, self._client, url, timeout=15)
             response.raise_for_status()
 
-            jobs = response.json()
-
-            new_cache = {}
-            for job in jobs:
-                job_id = job.get("id")
-                if job_id:
-                    new_cache[job_id] = job
+            jobs = json_loads(response.content)
+            new_cache = {job["id"]: job for job in jobs if job.get("id")}
 
             with self._lock:
                 self._jobs_cache = new_cache
@@ -66,7 +71,7 @@ class JobInfoProvider:
                 level=LOG_STANDARD,
             )
             return 0
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             log(
                 f"Error caching jobs: Failed to decode JSON response from {url}: {e}",
                 level=LOG_STANDARD,
@@ -78,105 +83,168 @@ class JobInfoProvider:
 
     # JOB RETRIEVAL
     def get_all_jobs(self) -> List[Dict[str, Any]]:
-        """Retrieve all active recording jobs, refreshing cache if needed."""
+        """Retrieve all active recording jobs, refreshing cache if needed.
+
+        An expired cache is returned as-is while a background thread refreshes
+        it; only a cache that has never loaded makes the caller wait. A fresh
+        cache is read without taking the lock: writers publish a new dict
+        rather than mutating the one readers may hold.
+        """
+        jobs_cache = self._jobs_cache
+        if (
+            self._jobs_cache_time
+            and time.time() - self._jobs_cache_time <= self._cache_ttl
+        ):
+            return list(jobs_cache.values())
+
         with self._lock:
-            current_time = time.time()
-            cache_expired = current_time - self._jobs_cache_time > self._cache_ttl
+            never_loaded = self._jobs_cache_time == 0
+            cache_expired = time.time() - self._jobs_cache_time > self._cache_ttl
+            refresh_in_background = (
+                cache_expired and not never_loaded and not self._refreshing
+            )
+            if refresh_in_background:
+                self._refreshing = True
 
-        if cache_expired:
+        if never_loaded:
             self.cache_jobs()
+        elif refresh_in_background:
+            threading.Thread(
+                target=self._refresh_jobs, name="job-cache-refresh", daemon=True
+            ).start()
 
         with self._lock:
             return list(self._jobs_cache.values())
 
+    def _refresh_jobs(self) -> None:
+        try:
+            self.cache_jobs()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
     def get_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve specific recording job by ID, with fallback to direct API query."""
-        log(f"Retrieving job by ID: {job_id}", level=LOG_VERBOSE)
+        # Runs for every recording event; skip building verbose messages
+        # unless they will be written.
+        verbose = is_verbose()
+        if verbose:
+            log(f"Retrieving job by ID: {job_id}", level=LOG_VERBOSE)
         try:
             with self._lock:
                 current_time = time.time()
                 cache_expired = current_time - self._jobs_cache_time > self._cache_ttl
 
             if cache_expired:
-                log(
-                    f"Cache expired, refreshing before job lookup for {job_id}",
-                    level=LOG_VERBOSE,
-                )
+                if verbose:
+                    log(
+                        f"Cache expired, refreshing before job lookup for {job_id}",
+                        level=LOG_VERBOSE,
+                    )
                 self.cache_jobs()
 
             with self._lock:
                 job = self._jobs_cache.get(job_id)
-                if job:
+            if job:
+                if verbose:
                     log(f"Job {job_id} found in cache", level=LOG_VERBOSE)
-                    return job
+                return job
+            if verbose:
                 log(
                     f"Job {job_id} not found in cache, querying API directly",
                     level=LOG_VERBOSE,
                 )
 
+            with self._inflight_lock:
+                inflight = self._inflight.get(job_id)
+                if inflight is None:
+                    self._inflight[job_id] = threading.Event()
+            if inflight is not None:
+                # Another thread is already fetching this job; reuse its result
+                # instead of pulling the full job list again.
+                inflight.wait(timeout=5.0)
+                with self._lock:
+                    return self._jobs_cache.get(job_id)
+
             try:
-                url = f"{self._get_base_url()}/api/v1/jobs"
+                return self._fetch_job(job_id)
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(job_id).set()
+        except Exception as e:
+            log(
+                f"Critical error in get_job_by_id for job {job_id}: {e}",
+                level=LOG_STANDARD,
+            )
+            return None
+
+    def _fetch_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Query the jobs API for one job and add it to the cache if present."""
+        if not self._jobs_circuit.allow():
+            return None
+        try:
+            url = f"{self._get_base_url()}/api/v1/jobs"
+            if is_verbose():
                 log(f"Fetching job from API: {url}", level=LOG_VERBOSE)
 
-                start_time = time.time()
-                response = httpx.get(url, timeout=5.0)
-                fetch_time = time.time() - start_time
+            start_time = time.time()
+            response = circuit_get(self._jobs_circuit, self._client, url, timeout=5.0)
+            fetch_time = time.time() - start_time
 
-                if fetch_time > 2.0:
-                    log(
-                        f"Slow job API call for {job_id}: {fetch_time:.2f}s",
-                        level=LOG_VERBOSE,
-                    )
+            if fetch_time > 2.0:
+                log(
+                    f"Slow job API call for {job_id}: {fetch_time:.2f}s",
+                    level=LOG_VERBOSE,
+                )
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                jobs = response.json()
-                found_job = None
-                for j in jobs:
-                    if j.get("id") == job_id:
-                        found_job = j
-                        break
+            jobs = json_loads(response.content)
+            found_job = None
+            for j in jobs:
+                if j.get("id") == job_id:
+                    found_job = j
+                    break
 
-                if found_job:
+            if found_job:
+                if is_verbose():
                     log(f"Job {job_id} found from API", level=LOG_VERBOSE)
-                    with self._lock:
-                        self._jobs_cache[job_id] = found_job
-                    return found_job
+                with self._lock:
+                    self._jobs_cache = {**self._jobs_cache, job_id: found_job}
+                return found_job
 
-                log(f"Job {job_id} not found in API response", level=LOG_STANDARD)
-                return None
+            log(f"Job {job_id} not found in API response", level=LOG_STANDARD)
+            return None
 
-            except httpx.TimeoutException:
-                log(
-                    f"Timeout error fetching job {job_id} (5.0s timeout exceeded)",
-                    level=LOG_STANDARD,
-                )
-                return None
-            except httpx.RequestError as e:
-                log(f"Network error fetching job {job_id}: {e}", level=LOG_STANDARD)
-                return None
-            except json.JSONDecodeError as e:
-                log(f"JSON decode error fetching job {job_id}: {e}", level=LOG_STANDARD)
-                return None
-            except Exception as e:
-                log(f"Unexpected error fetching job {job_id}: {e}", level=LOG_STANDARD)
-                return None
-        except Exception as e:
+        except httpx.TimeoutException:
             log(
-                f"Critical error in get_job_by_id for job {job_id}: {e}",
+                f"Timeout error fetching job {job_id} (5.0s timeout exceeded)",
                 level=LOG_STANDARD,
             )
             return None
+        except httpx.RequestError as e:
+            log(f"Network error fetching job {job_id}: {e}", level=LOG_STANDARD)
+            return None
+        except JSONDecodeError as e:
+            log(f"JSON decode error fetching job {job_id}: {e}", level=LOG_STANDARD)
+            return None
+        except Exception as e:
+            log(f"Unexpected error fetching job {job_id}: {e}", level=LOG_STANDARD)
+            return None
 
     # RECORDING RETRIEVAL
     def get_recording_by_id(self, file_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve completed recording by file ID with fallback to alternative endpoint."""
+        if not self._recordings_circuit.allow():
+            return None
         try:
             url = f"{self._get_base_url()}/api/v1/recordings/{file_id}"
-            response = httpx.get(url, timeout=15)
+            response = circuit_get(
+                self._recordings_circuit, self._client, url, timeout=15
+            )
 
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             elif response.status_code != 404:
                 log(
                     f"HTTP {response.status_code} fetching recording {file_id}",
@@ -184,10 +252,12 @@ class JobInfoProvider:
                 )
 
             url = f"{self._get_base_url()}/api/v1/all?id={file_id}"
-            response = httpx.get(url, timeout=15)
+            response = circuit_get(
+                self._recordings_circuit, self._client, url, timeout=15
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             if data and len(data) > 0:
                 return data[0]
             else:
@@ -205,7 +275,7 @@ class JobInfoProvider:
                 level=LOG_STANDARD,
             )
             return None
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             log(
                 f"Error fetching recording {file_id}: Failed to decode JSON response: {e}",
                 level=LOG_STANDARD,
@@ -220,12 +290,16 @@ class JobInfoProvider:
 
     def get_all_recordings(self) -> List[Dict[str, Any]]:
         """Retrieve all completed recordings with fallback to alternative endpoint."""
+        if not self._recordings_circuit.allow():
+            return []
         try:
             url = f"{self._get_base_url()}/api/v1/recordings"
-            response = httpx.get(url, timeout=20)
+            response = circuit_get(
+                self._recordings_circuit, self._client, url, timeout=20
+            )
 
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             elif response.status_code != 404:
                 log(
                     f"HTTP {response.status_code} fetching all recordings",
@@ -233,10 +307,12 @@ class JobInfoProvider:
                 )
 
             url = f"{self._get_base_url()}/api/v1/all"
-            response = httpx.get(url, timeout=30)
+            response = circuit_get(
+                self._recordings_circuit, self._client, url, timeout=30
+            )
             response.raise_for_status()
 
-            return response.json()
+            return json_loads(response.content)
 
         except httpx.TimeoutException:
             log("Error fetching all recordings: Timeout occurred.", level=LOG_STANDARD)
@@ -246,7 +322,7 @@ class JobInfoProvider:
                 f"Error fetching all recordings: Network error: {e}", level=LOG_STANDARD
             )
             return []
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             log(
                 f"Error fetching all recordings: Failed to decode JSON response: {e}",
                 level=LOG_STANDARD,
@@ -272,3 +348,36 @@ class JobInfoProvider:
         start_time = job.get("start_time", 0)
 
         return (start_time - current_time) > 30
+
+    def is_jobs_active_bulk(self, job_ids: List[str]) -> Dict[str, bool]:
+        """Check many jobs against one jobs-list fetch instead of one per ID."""
+        jobs = self._get_jobs_bulk(job_ids)
+        return {job_id: job_id in jobs for job_id in job_ids}
+
+    def is_recordings_scheduled_bulk(
+        self, job_ids: List[str], now: Optional[float] = None
+    ) -> Dict[str, bool]:
+        """Bulk form of is_recording_scheduled() sharing a single jobs fetch."""
+        jobs = self._get_jobs_bulk(job_ids)
+        current_time = time.time() if now is None else now
+        return {
+            job_id: job_id in jobs
+            and (jobs[job_id].get("start_time", 0) - current_time) > 30
+            for job_id in job_ids
+        }
+
+    def _get_jobs_bulk(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the cached jobs among job_ids, refreshing the cache at most once."""
+        with self._lock:
+            cache_expired = time.time() - self._jobs_cache_time > self._cache_ttl
+            missing = any(job_id not in self._jobs_cache for job_id in job_ids)
+
+        if cache_expired or missing:
+            self.cache_jobs()
+
+        with self._lock:
+            return {
+                job_id: self._jobs_cache[job_id]
+                for job_id in job_ids
+                if job_id in self._jobs_cache
+            }
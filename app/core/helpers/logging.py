@@ -2,6 +2,7 @@
 
 import os
 import sys
+import time
 import logging
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
@@ -18,6 +19,46 @@ log_handler = None
 _log_format = "text"
 
 
+class _ReopeningRotatingFileHandler(TimedRotatingFileHandler):
+    """Daily rotation that also follows a log file moved by another process.
+
+    The core and the Web UI both write channelwatch.log; once either rotates
+    it, the other would keep appending to the renamed backup. At most every
+    REOPEN_CHECK_SECONDS the path is compared with the open file and reopened
+    when they no longer match.
+    """
+
+    REOPEN_CHECK_SECONDS = 5.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._next_reopen_check = 0.0
+
+    def emit(self, record):
+        now = time.monotonic()
+        if now >= self._next_reopen_check:
+            self._next_reopen_check = now + self.REOPEN_CHECK_SECONDS
+            self._reopen_if_moved()
+        super().emit(record)
+
+    def _reopen_if_moved(self):
+        if self.stream is None:
+            return
+        try:
+            path_stat = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            path_stat = None
+        except OSError:
+            return
+        if path_stat is not None and os.path.samestat(
+            path_stat, os.fstat(self.stream.fileno())
+        ):
+            return
+        self.stream.flush()
+        self.stream.close()
+        self.stream = self._open()
+
+
 # SETUP
 def setup_logging(config_path: str, retention_days: int = 7, test_mode: bool = False):
     """Configure file-based logging with daily rotation, retention policy, and optional JSON format."""
@@ -49,7 +90,7 @@ def setup_logging(config_path: str, retention_days: int = 7, test_mode: bool = F
             "[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
         )
 
-    log_handler = TimedRotatingFileHandler(
+    log_handler = _ReopeningRotatingFileHandler(
         log_file,
         when="midnight",
         interval=1,
@@ -66,6 +107,11 @@ def set_log_level(level: int, test_mode: bool = False):
     log_level = level
 
 
+def is_verbose() -> bool:
+    """Return True when verbose messages will be emitted, so callers can skip building them."""
+    return log_level >= LOG_VERBOSE
+
+
 # LOGGING
 def log(
     message: str, level: int = LOG_STANDARD, extra: Optional[Dict[str, Any]] = None
@@ -5,16 +5,43 @@ Event and data parsing helper functions for channel activity monitoring.
 import re
 import json
 import ipaddress
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 
+from .event_types import ACTIVITIES_SET
 from .logging import log, LOG_VERBOSE
 
+_RE_CHANNEL_NUMBER = re.compile(r"ch(?:annel)?\s*(\d+\.\d+|\d+)", re.IGNORECASE)
+_RE_CHANNEL_NAME = re.compile(
+    r"ch(?:annel)?\s*(?:\d+\.\d+|\d+)\s+([^()]+?)(?:\s+from)", re.IGNORECASE
+)
+# Number, name and device in one scan. The trailing part is optional so the
+# number always matches at the same position as _RE_CHANNEL_NUMBER.
+_RE_CHANNEL_DETAILS = re.compile(
+    r"ch(?:annel)?\s*(\d+\.\d+|\d+)(?:(?:\s+([^()]+?))?\s+(?-i:from)\s+([^:()]+))?",
+    re.IGNORECASE,
+)
+_RE_RESOLUTION = re.compile(r"(\d+[pi])")
+_RE_FROM_SOURCE = re.compile(r"from\s+([^:()]+)")
+_RE_PAREN_IP = re.compile(r"\(([\d\.]+)\)")
+_RE_IPV4_SHAPE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+_HEX_CHARS = frozenset("0123456789ABCDEFabcdef")
+
 
 # IP VALIDATION
 def is_valid_ip_address(text: str) -> bool:
     """Validates if a string matches IPv4 or IPv6 address format."""
     if not text:
         return False
+    # Most values checked here are device names; reject anything that is not
+    # shaped like an address before building an ipaddress object.
+    if ":" not in text and not _RE_IPV4_SHAPE.match(text):
+        return False
+    return _is_ip_literal(text)
+
+
+@lru_cache(maxsize=1024)
+def _is_ip_literal(text: str) -> bool:
     try:
         ipaddress.ip_address(text)
         return True
@@ -33,7 +60,7 @@ def parse_event_data(data: str) -> Optional[Dict[str, Any]]:
 
 def is_watching_event(event_type: str, event_data: Dict[str, Any]) -> bool:
     """Determines if an event represents active channel viewing."""
-    if event_type != "activities.set":
+    if event_type != ACTIVITIES_SET:
         return False
     value = event_data.get("Value", "")
     if not value:
@@ -44,15 +71,52 @@ def is_watching_event(event_type: str, event_data: Dict[str, Any]) -> bool:
 # CHANNEL INFO
 def extract_session_info(value: str) -> Tuple[Optional[str], Optional[str]]:
     """Retrieves channel number and device name from activity value."""
-    channel_number = extract_channel_number(value)
-    device_name = extract_device_name(value)
+    channel_number, _, device_name = extract_channel_details(value)
     return channel_number, device_name
 
 
+def extract_channel_details(
+    value: str,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extracts channel number, channel name and device name in a single pass.
+
+    Returns the same values as calling extract_channel_number,
+    extract_channel_name and extract_device_name separately; the standalone
+    patterns are only rerun when the value does not follow the usual
+    "ch<number> <name> from <device>" shape.
+    """
+    try:
+        match = _RE_CHANNEL_DETAILS.search(value)
+    except Exception as e:
+        log(f"Error extracting channel details: {e}", level=LOG_VERBOSE)
+        return None, None, None
+    if match is None:
+        return None, None, extract_device_name(value)
+
+    channel_number, raw_name, raw_device = match.groups()
+    # The standalone patterns each pick their own "from" (case-insensitively
+    # for the name), so the fused match is only trusted when the value holds
+    # exactly one "from" and it follows the channel number and name.
+    lowered = value.lower()
+    first_from = lowered.find("from")
+    if (
+        raw_device is None
+        or first_from < match.end(2 if raw_name else 1)
+        or lowered.find("from", first_from + 1) != -1
+    ):
+        return channel_number, extract_channel_name(value), extract_device_name(value)
+
+    channel_name = raw_name.strip() if raw_name else None
+    device_name = raw_device.strip()
+    if is_valid_ip_address(device_name):
+        device_name = None
+    return channel_number, channel_name or None, device_name
+
+
 def extract_channel_number(value: str) -> Optional[str]:
     """Extracts channel number from event value, supporting decimal formats."""
     try:
-        match = re.search(r"ch(?:annel)?\s*(\d+\.\d+|\d+)", value, re.IGNORECASE)
+        match = _RE_CHANNEL_NUMBER.search(value)
         if match:
             channel = match.group(1)
             return channel
@@ -65,11 +129,7 @@ def extract_channel_number(value: str) -> Optional[str]:
 def extract_channel_name(value: str) -> Optional[str]:
     """Extracts channel name from event value between channel number and 'from'."""
     try:
-        match = re.search(
-            r"ch(?:annel)?\s*(?:\d+\.\d+|\d+)\s+([^()]+?)(?:\s+from)",
-            value,
-            re.IGNORECASE,
-        )
+        match = _RE_CHANNEL_NAME.search(value)
         if match and match.group(1).strip():
             name = match.group(1).strip()
             return name
@@ -82,7 +142,7 @@ def extract_channel_name(value: str) -> Optional[str]:
 def extract_resolution(value: str) -> Optional[str]:
     """Extracts video resolution information from event value."""
     try:
-        match = re.search(r"(\d+[pi])", value)
+        match = _RE_RESOLUTION.search(value)
         return match.group(1) if match else None
     except Exception:
         return None
@@ -92,7 +152,7 @@ def extract_resolution(value: str) -> Optional[str]:
 def extract_device_name(value: str) -> Optional[str]:
     """Extracts device name from event value, excluding IP addresses."""
     try:
-        match = re.search(r"from\s+([^:()]+)", value)
+        match = _RE_FROM_SOURCE.search(value)
         if match:
             potential_name = match.group(1).strip()
             if not is_valid_ip_address(potential_name):
@@ -107,12 +167,12 @@ def extract_device_name(value: str) -> Optional[str]:
 def extract_ip_address(value: str) -> Optional[str]:
     """Extracts IP address from event value, prioritizing parenthetical format."""
     try:
-        match_paren = re.search(r"\(([\d\.]+)\)", value)
+        match_paren = _RE_PAREN_IP.search(value)
         if match_paren:
             potential_ip_paren = match_paren.group(1).strip()
             if is_valid_ip_address(potential_ip_paren):
                 return potential_ip_paren
-        match_direct = re.search(r"from\s+([^:()]+)", value)
+        match_direct = _RE_FROM_SOURCE.search(value)
         if match_direct:
             potential_ip_direct = match_direct.group(1).strip()
             if is_valid_ip_address(potential_ip_direct):
@@ -139,7 +199,7 @@ def extract_source_from_session_id(session_id: str) -> Optional[str]:
                     provider = parts[3].split("_")[0].capitalize()
                     return f"TVE ({provider})"
                 return "TVE"
-            elif re.match(r"^[0-9A-F]+$", source_type, re.IGNORECASE):
+            elif source_type and _HEX_CHARS.issuperset(source_type):
                 return f"Tuner ({source_type})"
             else:
                 return source_type
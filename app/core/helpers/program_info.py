@@ -2,17 +2,137 @@
 Program information provider for Channels DVR XMLTV API integration.
 """
 
-import httpx
+import calendar
+import io
+import sys
 import xml.etree.ElementTree as ET
 import time
 import threading
 import pytz
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
-from .logging import log, LOG_STANDARD, LOG_VERBOSE
+from .logging import is_verbose, log, LOG_STANDARD, LOG_VERBOSE
 from .type_utils import ensure_str
 from .dvr_connection import build_dvr_base_url
+from .circuit import Circuit, circuit_get
+from .http_pool import get_client
+
+try:
+    from lxml import etree as lxml_etree  # type: ignore[import-not-found]
+
+    _LXML_AVAILABLE = True
+except ImportError:
+    lxml_etree = None  # type: ignore[assignment]
+    _LXML_AVAILABLE = False
+
+_GUIDE_TAGS = ("channel", "programme")
+
+
+@lru_cache(maxsize=16384)
+def _xmltv_timestamp(time_str: str) -> int:
+    """Parse an XMLTV time as UTC, ignoring any offset suffix.
+
+    A guide repeats the same few dozen boundaries across every channel, so
+    results are memoised. The epoch value does not depend on the display
+    timezone, so the time string alone is the cache key.
+    """
+    dt = datetime.strptime(time_str.split(" ")[0], "%Y%m%d%H%M%S")
+    return calendar.timegm(dt.timetuple())
+
+
+# (start_time, stop_time, title, description, icon_url) for one <programme>.
+_ProgramRow = Tuple[int, int, str, str, Optional[str]]
+
+
+@dataclass(slots=True)
+class _ChannelGuide:
+    """One channel's programs as parallel columns, sorted by start time.
+
+    Holding the times in int64 arrays instead of one dict per program keeps a
+    full guide compact; get_current_program bisects start_times directly and
+    only builds a dict for the program it returns.
+    """
+
+    start_times: array
+    stop_times: array
+    titles: List[str]
+    descriptions: List[str]
+    icon_urls: List[Optional[str]]
+
+    @classmethod
+    def from_rows(cls, rows: List[_ProgramRow]) -> "_ChannelGuide":
+        rows.sort(key=itemgetter(0))
+        starts, stops, titles, descriptions, icon_urls = zip(*rows)
+        return cls(
+            array("q", starts),
+            array("q", stops),
+            list(titles),
+            list(descriptions),
+            list(icon_urls),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_times)
+
+    def program_covering(
+        self, timestamp: int, channel_id: str
+    ) -> Optional[Dict[str, Any]]:
+        index = bisect_right(self.start_times, timestamp) - 1
+        if index >= 0 and timestamp < self.stop_times[index]:
+            return self.program_at(index, channel_id)
+        return None
+
+    def program_at(self, index: int, channel_id: str) -> Dict[str, Any]:
+        return {
+            "channel_id": channel_id,
+            "start_time": self.start_times[index],
+            "stop_time": self.stop_times[index],
+            "title": self.titles[index],
+            "description": self.descriptions[index],
+            "icon_url": self.icon_urls[index],
+        }
+
+
+_Guide = Tuple[Dict[str, str], Dict[str, _ChannelGuide]]
+
+
+def _iter_guide_elements(xml_data: bytes) -> Iterator[Any]:
+    """Yield each <channel> and <programme> element, discarding it once handled.
+
+    lxml filters tags in C so the loop only wakes for guide entries; the
+    stdlib parser is the fallback when lxml is not installed.
+    """
+    if _LXML_AVAILABLE:
+        for _, elem in lxml_etree.iterparse(
+            io.BytesIO(xml_data),
+            events=("end",),
+            tag=_GUIDE_TAGS,
+            resolve_entities=False,
+            no_network=True,
+        ):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    root = None
+    for event, elem in ET.iterparse(io.BytesIO(xml_data), events=("start", "end")):
+        if root is None:
+            root = elem
+        elif event == "end" and elem.tag in _GUIDE_TAGS:
+            yield elem
+            root.clear()
+
+
+def _program_count(program_cache: Dict[str, _ChannelGuide]) -> int:
+    return sum(len(guide) for guide in program_cache.values())
 
 
 # PROGRAM INFO
@@ -40,20 +160,33 @@ class ProgramInfoProvider:
         self.timezone = timezone
         self.local_tz = pytz.timezone(timezone)
 
-        self.program_cache = {}
-        self.channel_map = {}
+        # (channel_map, program_cache), replaced as a whole on refresh so
+        # lookups never need the lock or see half of a new guide.
+        self._guide: _Guide = ({}, {})
         self.cache_timestamp = 0
         self.cache_lock = threading.Lock()
+        self._client = get_client(self.host, self.port)
+        self._guide_circuit = Circuit("guide")
+
+    @property
+    def channel_map(self) -> Dict[str, str]:
+        return self._guide[0]
+
+    @property
+    def program_cache(self) -> Dict[str, _ChannelGuide]:
+        return self._guide[1]
 
     # DATA FETCHING
-    def _fetch_xmltv_data(self, duration: int = 86400) -> Optional[str]:
+    def _fetch_xmltv_data(self, duration: int = 86400) -> Optional[bytes]:
         """Retrieves XMLTV program guide data from Channels DVR API."""
+        if not self._guide_circuit.allow():
+            return None
         try:
             url = f"{self.base_url}/devices/ANY/guide/xmltv"
-            response = httpx.get(url, timeout=30)
+            response = circuit_get(self._guide_circuit, self._client, url, timeout=30)
 
             if response.status_code == 200:
-                return response.text
+                return response.content
             else:
                 log(
                     f"Failed to fetch XMLTV data: HTTP {response.status_code}",
@@ -64,118 +197,116 @@ class ProgramInfoProvider:
             log(f"Error fetching XMLTV data: {e}", level=LOG_STANDARD)
             return None
 
-    def _parse_xmltv_data(self, xml_data: str) -> bool:
-        """Processes XMLTV data and updates program and channel caches."""
-        try:
-            root = ET.fromstring(xml_data)
-
-            channels_count = 0
-            for channel in root.findall("./channel"):
-                channel_id = channel.get("id")
-                lcn = channel.find("lcn")
-
-                if lcn is not None and lcn.text:
-                    self.channel_map[lcn.text] = channel_id
-                    channels_count += 1
-
-            programs_count = 0
-            time_conversions = 0
-
-            for program in root.findall("./programme"):
-                channel_id = program.get("channel")
-                start_attr = program.get("start")
-                start_time = (
-                    self._parse_xmltv_time(ensure_str(start_attr))
-                    if start_attr
-                    else None
-                )
-                if start_time:
-                    time_conversions += 1
-
-                stop_attr = program.get("stop")
-                stop_time = (
-                    self._parse_xmltv_time(ensure_str(stop_attr)) if stop_attr else None
-                )
-                if stop_time:
-                    time_conversions += 1
-
-                if not channel_id or not start_time or not stop_time:
-                    continue
-
-                title_elem = program.find("title")
-                desc_elem = program.find("desc")
-                icon_elem = program.find("icon")
-
-                program_info = {
-                    "channel_id": channel_id,
-                    "start_time": start_time,
-                    "stop_time": stop_time,
-                    "title": title_elem.text
-                    if title_elem is not None
-                    else "Unknown Program",
-                    "description": desc_elem.text if desc_elem is not None else "",
-                    "icon_url": icon_elem.get("src") if icon_elem is not None else None,
-                }
-
-                if channel_id not in self.program_cache:
-                    self.program_cache[channel_id] = []
+    def _parse_xmltv_data(self, xml_data: bytes) -> Optional[_Guide]:
+        """Processes XMLTV data into a new (channel_map, program_cache) pair.
 
-                self.program_cache[channel_id].append(program_info)
-                programs_count += 1
-
-            if time_conversions > 0:
-                pass
-
-            return True
+        The guide is streamed and each top-level element is dropped once read,
+        so the full document tree is never held in memory.
+        """
+        try:
+            channel_map: Dict[str, str] = {}
+            rows: Dict[str, List[_ProgramRow]] = {}
+            for elem in _iter_guide_elements(xml_data):
+                if elem.tag == "channel":
+                    lcn = elem.find("lcn")
+                    channel_id = elem.get("id")
+                    if lcn is not None and lcn.text and channel_id:
+                        channel_map[lcn.text] = sys.intern(channel_id)
+                else:
+                    self._add_program(rows, elem)
+
+            program_cache = {
+                channel_id: _ChannelGuide.from_rows(channel_rows)
+                for channel_id, channel_rows in rows.items()
+            }
+            return channel_map, program_cache
         except Exception as e:
             log(f"Error parsing XMLTV data: {e}", level=LOG_STANDARD)
-            return False
+            return None
+
+    def _add_program(
+        self, rows: Dict[str, List[_ProgramRow]], program: ET.Element
+    ) -> None:
+        """Collects one <programme> element if it has a channel and valid times."""
+        channel_id = program.get("channel")
+        start_attr = program.get("start")
+        start_time = (
+            self._parse_xmltv_time(ensure_str(start_attr)) if start_attr else None
+        )
+        stop_attr = program.get("stop")
+        stop_time = self._parse_xmltv_time(ensure_str(stop_attr)) if stop_attr else None
+
+        if not channel_id or not start_time or not stop_time:
+            return
+
+        title_elem = program.find("title")
+        desc_elem = program.find("desc")
+        icon_elem = program.find("icon")
+        icon_url = icon_elem.get("src") if icon_elem is not None else None
+
+        # Series titles and artwork URLs repeat across many airings; interning
+        # keeps one copy of each in the guide.
+        rows.setdefault(sys.intern(channel_id), []).append(
+            (
+                start_time,
+                stop_time,
+                (
+                    sys.intern(title_elem.text)
+                    if title_elem is not None and title_elem.text
+                    else "Unknown Program"
+                ),
+                desc_elem.text if desc_elem is not None else "",
+                sys.intern(icon_url) if icon_url else icon_url,
+            )
+        )
 
     def _parse_xmltv_time(self, time_str: str) -> Optional[int]:
-        """Converts XMLTV time format to Unix timestamp in local timezone."""
+        """Converts XMLTV time format to Unix timestamp."""
         try:
-            parts = time_str.split(" ")
-            time_part = parts[0]
-            dt_utc = datetime.strptime(time_part, "%Y%m%d%H%M%S")
-            from pytz import UTC
-
-            dt_utc = UTC.localize(dt_utc)
-            dt_local = dt_utc.astimezone(self.local_tz)
-
-            return int(dt_local.timestamp())
+            return _xmltv_timestamp(time_str)
         except Exception as e:
-            log(f"Error parsing XMLTV time: {e}", level=LOG_VERBOSE)
+            if is_verbose():
+                log(f"Error parsing XMLTV time: {e}", level=LOG_VERBOSE)
             return None
 
     # CACHE MANAGEMENT
     def cache_program_data(self) -> int:
-        """Updates program guide cache with fresh data from XMLTV API. Returns program count."""
-        with self.cache_lock:
+        """Updates program guide cache with fresh data from XMLTV API. Returns program count.
+
+        The fetch and parse run outside any lookup path: one thread refreshes
+        while others keep reading the current guide, and the result is
+        published with a single assignment. Callers only wait when there is no
+        guide yet.
+        """
+        program_cache = self.program_cache
+        if program_cache and time.time() - self.cache_timestamp < self.cache_ttl:
+            return _program_count(program_cache)
+
+        if not self.cache_lock.acquire(blocking=not program_cache):
+            return _program_count(program_cache)
+        try:
             current_time = time.time()
-            if (
-                self.program_cache
-                and (current_time - self.cache_timestamp) < self.cache_ttl
-            ):
-                return sum(len(programs) for programs in self.program_cache.values())
+            program_cache = self.program_cache
+            if program_cache and current_time - self.cache_timestamp < self.cache_ttl:
+                return _program_count(program_cache)
 
             xml_data = self._fetch_xmltv_data()
             if not xml_data:
+                # While the guide endpoint is failing, keep serving the last
+                # guide rather than reporting no program at all.
+                if self._guide_circuit.is_open and program_cache:
+                    return _program_count(program_cache)
                 return 0
 
-            self.program_cache = {}
-            self.channel_map = {}
-
-            success = self._parse_xmltv_data(xml_data)
-
-            if success:
-                self.cache_timestamp = current_time
-                program_count = sum(
-                    len(programs) for programs in self.program_cache.values()
-                )
-
-                return program_count
+            guide = self._parse_xmltv_data(xml_data)
+            if guide is None:
+                return 0
 
-            return 0
+            self._guide = guide
+            self.cache_timestamp = current_time
+            return _program_count(guide[1])
+        finally:
+            self.cache_lock.release()
 
     # PROGRAM LOOKUP
     def get_current_program(
@@ -190,7 +321,8 @@ class ProgramInfoProvider:
         if timestamp is None:
             timestamp = int(time.time())
 
-        channel_id = self.channel_map.get(channel_number)
+        channel_map, program_cache = self._guide
+        channel_id = channel_map.get(channel_number)
         if not channel_id:
             log(
                 f"Channel ID not found for channel number: {channel_number}",
@@ -198,13 +330,32 @@ class ProgramInfoProvider:
             )
             return None
 
-        programs = self.program_cache.get(channel_id, [])
+        guide = program_cache.get(channel_id)
+        if not guide:
+            return None
+        return guide.program_covering(timestamp, channel_id)
+
+    def get_current_programs(
+        self, channel_numbers: Iterable[str], timestamp: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Looks up the current program for several channels against one guide snapshot.
 
-        for program in programs:
-            start_time = program["start_time"]
-            stop_time = program["stop_time"]
+        Returns only the channels that have a program airing at the given time.
+        """
+        if not self.cache_program_data():
+            log("Failed to cache program data", level=LOG_VERBOSE)
+            return {}
 
-            if start_time <= timestamp < stop_time:
-                return program
+        if timestamp is None:
+            timestamp = int(time.time())
 
-        return None
+        channel_map, program_cache = self._guide
+        programs = {}
+        for channel_number in channel_numbers:
+            channel_id = channel_map.get(channel_number)
+            guide = program_cache.get(channel_id) if channel_id else None
+            if guide:
+                program = guide.program_covering(timestamp, channel_id)
+                if program is not None:
+                    programs[channel_number] = program
+        return programs
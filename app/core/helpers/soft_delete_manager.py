@@ -3,6 +3,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .atomic_io import atomic_write_json
 from .logging import log, LOG_STANDARD, LOG_VERBOSE
 
 SOFT_DELETE_RETENTION_DAYS = 30
@@ -47,7 +48,7 @@ def _remove_dvr_history_rows(config_dir: Path, dvr_id: str) -> int:
     if not history_file.is_file():
         return 0
     try:
-        raw = json.loads(history_file.read_text())
+        raw = json.loads(history_file.read_text(encoding="utf-8"))
         if not isinstance(raw, list):
             return 0
         before = len(raw)
@@ -56,7 +57,7 @@ def _remove_dvr_history_rows(config_dir: Path, dvr_id: str) -> int:
         ]
         removed = before - len(kept)
         if removed > 0:
-            history_file.write_text(json.dumps(kept, indent=2))
+            atomic_write_json(history_file, kept, indent=None)
             log(f"Removed {removed} history rows for DVR {dvr_id}", level=LOG_STANDARD)
         return removed
     except (json.JSONDecodeError, OSError) as e:
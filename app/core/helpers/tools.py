@@ -6,7 +6,8 @@ import time
 import httpx
 
 from .logging import log
-from .dvr_connection import build_dvr_base_url
+from .dvr_connection import EVENT_STREAM_HEADERS, EVENT_STREAM_PATH, build_dvr_base_url
+from ..engine.sse import split_sse_payloads
 
 
 # EVENT STREAM
@@ -15,7 +16,7 @@ def monitor_event_stream(host: str, port: int, duration: int = 30) -> bool:
     import threading
 
     base_url = build_dvr_base_url(host, port)
-    url = f"{base_url}/dvr/events/subscribe"
+    url = f"{base_url}{EVENT_STREAM_PATH}"
 
     log(f"Monitoring events for {duration} seconds")
 
@@ -23,18 +24,12 @@ def monitor_event_stream(host: str, port: int, duration: int = 30) -> bool:
 
     def monitoring_thread():
         try:
-            headers = {
-                "Accept": "text/event-stream",
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-            }
-
             log("Connecting to event stream...")
             timeout = httpx.Timeout(10.0, read=duration + 30)
 
             with httpx.Client() as client:
                 with client.stream(
-                    "GET", url, headers=headers, timeout=timeout
+                    "GET", url, headers=EVENT_STREAM_HEADERS, timeout=timeout
                 ) as response:
                     if response.status_code != 200:
                         log(f"Connection failed - HTTP {response.status_code}")
@@ -43,13 +38,25 @@ def monitor_event_stream(host: str, port: int, duration: int = 30) -> bool:
                     log("Connected to event stream")
                     monitor_data["success"] = True
 
-                    for line in response.iter_lines():
+                    # Take whatever each socket read returns (up to 64 KiB)
+                    # rather than re-chunking, which held events back until
+                    # 8 KiB had arrived. Split as bytes and only decode what
+                    # gets logged.
+                    carry = b""
+                    for chunk in response.iter_bytes():
                         if not monitor_data["running"]:
                             break
 
-                        if line:
+                        payloads, carry = split_sse_payloads(chunk, carry)
+                        for payload in payloads:
+                            monitor_data["event_count"] += 1
+                            log(f"Event: {payload.decode('utf-8', 'replace')}")
+
+                    if carry and monitor_data["running"]:
+                        payloads, carry = split_sse_payloads(b"", carry, final=True)
+                        for payload in payloads:
                             monitor_data["event_count"] += 1
-                            log(f"Event: {line}")
+                            log(f"Event: {payload.decode('utf-8', 'replace')}")
 
         except Exception as e:
             if not monitor_data["success"] or monitor_data["event_count"] == 0:
@@ -2,13 +2,16 @@
 VOD metadata provider for Channels DVR content management.
 """
 
+import hashlib
+import threading
 import time
-import httpx
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .logging import log, LOG_VERBOSE
 from .config import CoreSettings
 from .dvr_connection import build_dvr_base_url
+from .http_pool import get_client
+from .json_codec import loads as json_loads
 
 
 def _metadata_value(metadata: Dict[str, Any], *keys: str, default: Any = "") -> Any:
@@ -24,10 +27,82 @@ def _metadata_id(metadata: Dict[str, Any]) -> Optional[str]:
     return str(value) if value not in (None, "") else None
 
 
+def _format_duration(duration_seconds: float) -> str:
+    """Converts duration in seconds to human-readable time format."""
+    hours, remainder = divmod(int(float(duration_seconds or 0)), 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours}h {minutes:02d}m {seconds:02d}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds:02d}s"
+    else:
+        return f"{seconds}s"
+
+
+# (settings flag, output key, extractor, keep empty values) in output order.
+_FORMAT_FIELDS: Tuple[Tuple[str, str, Callable[[Dict[str, Any]], Any], bool], ...] = (
+    ("vod_title", "title", lambda m: _metadata_value(m, "title", "Title"), True),
+    (
+        "vod_episode_title",
+        "episode_title",
+        lambda m: _metadata_value(m, "episode_title", "EpisodeTitle"),
+        False,
+    ),
+    (
+        "vod_summary",
+        "summary",
+        lambda m: _metadata_value(m, "summary", "Summary"),
+        True,
+    ),
+    (
+        "vod_duration",
+        "duration",
+        lambda m: _format_duration(
+            _metadata_value(m, "duration", "Duration", default=0)
+        ),
+        True,
+    ),
+    (
+        "vod_image",
+        "image_url",
+        lambda m: _metadata_value(m, "image_url", "Image", "image"),
+        True,
+    ),
+    (
+        "vod_rating",
+        "rating",
+        lambda m: _metadata_value(m, "content_rating", "ContentRating"),
+        True,
+    ),
+    (
+        "vod_genres",
+        "genres",
+        lambda m: _metadata_value(m, "genres", "Genres", default=[]),
+        True,
+    ),
+    (
+        "vod_cast",
+        "cast",
+        lambda m: _metadata_value(m, "cast", "Cast", default=[]),
+        False,
+    ),
+)
+
+
+# Returned by _fetch_metadata() for a failed request, unlike None ("unchanged").
+_FETCH_FAILED: Any = object()
+
+
 # VOD INFO
+
+
 class VODInfoProvider:
     """Manages VOD content metadata retrieval and caching from Channels DVR."""
 
+    # How long an id that a fresh list did not contain is answered from memory.
+    MISS_TTL_SECONDS = 60
+
     def __init__(
         self,
         host: str = "",
@@ -47,39 +122,117 @@ class VODInfoProvider:
         self.settings = settings
         self.cache_ttl = settings.vod_cache_ttl if settings else 86400
         self.metadata_url = f"{self.base_url}/api/v1/all"
+        self._client = get_client(self.host, self.port)
+
+        # Settings are fixed for the provider's lifetime, so resolve which
+        # fields format_metadata() emits once.
+        self._format_fields = [
+            (key, extract, keep_empty)
+            for flag, key, extract, keep_empty in _FORMAT_FIELDS
+            if settings is not None and getattr(settings, flag)
+        ]
+        self._format_progress = bool(settings is not None and settings.vod_progress)
 
         self.metadata_cache: Dict[str, Dict[str, Any]] = {}
         self.last_fetch: float = 0
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._content_digest: Optional[bytes] = None
+        # Oldest-first, so expired misses are dropped from the front.
+        self._misses: Dict[str, float] = {}
+        self._refreshing = False
+        self._refresh_lock = threading.Lock()
 
     # METADATA MANAGEMENT
-    def _fetch_metadata(self) -> List[Dict[str, Any]]:
-        """Retrieves VOD metadata from Channels DVR API endpoint."""
+    def _fetch_metadata(self) -> Any:
+        """Retrieves VOD metadata from Channels DVR API endpoint.
+
+        While a cached copy exists the request is conditional; None means the
+        cached copy is still current, either because the server answered 304
+        or because it sent the same body again. A failed request returns
+        _FETCH_FAILED so callers keep what they have.
+        """
+        headers = {}
+        if self.metadata_cache:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
         try:
-            response = httpx.get(self.metadata_url, timeout=10)
+            response = self._client.get(self.metadata_url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                return None
             response.raise_for_status()
-            return response.json()
+            content = response.content
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            if self.metadata_cache and digest == self._content_digest:
+                return None
+            metadata = json_loads(content)
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._content_digest = digest
+            return metadata
         except Exception as e:
             log(f"Error fetching VOD metadata: {e}")
-            return []
-
-    def _update_cache(self):
-        """Updates local metadata cache if cache TTL has expired."""
-        current_time = time.time()
-
-        if current_time - self.last_fetch >= self.cache_ttl:
-            log("Updating VOD metadata cache", level=LOG_VERBOSE)
-            metadata = self._fetch_metadata()
+            return _FETCH_FAILED
+
+    def _update_cache(self) -> Optional[bool]:
+        """Refreshes the metadata cache once its TTL has expired.
+
+        Only the first load blocks the caller; it returns whether that load
+        succeeded, and None means nothing was fetched by this call. An expired
+        cache keeps being served while a background thread refetches it.
+        """
+        if time.time() - self.last_fetch < self.cache_ttl:
+            return None
+        if not self.last_fetch:
+            return self._refresh_cache()
+
+        with self._refresh_lock:
+            if self._refreshing:
+                return None
+            self._refreshing = True
+        threading.Thread(
+            target=self._background_refresh, name="vod-cache-refresh", daemon=True
+        ).start()
+        return None
 
+    def _background_refresh(self) -> None:
+        try:
+            self._refresh_cache()
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+    def _refresh_cache(self) -> bool:
+        """Refetches the metadata list and publishes it as a new dict.
+
+        A failed fetch leaves the cache and its age untouched and returns False.
+        """
+        log("Updating VOD metadata cache", level=LOG_VERBOSE)
+        fetched_at = time.time()
+        metadata = self._fetch_metadata()
+
+        if metadata is _FETCH_FAILED:
+            return False
+        if metadata is None:
+            log("VOD metadata unchanged since last fetch", level=LOG_VERBOSE)
+        else:
             self.metadata_cache = {
                 item_id: item
                 for item in metadata
                 if (item_id := _metadata_id(item)) is not None
             }
-            self.last_fetch = current_time
+        self.last_fetch = fetched_at
+        return True
+
+    def _force_refresh(self) -> bool:
+        """Refetches the whole metadata list regardless of cache age."""
+        return self._refresh_cache()
 
     def get_metadata(self, file_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieves metadata for specified VOD file ID from cache, with fallback to update cache and search list."""
-        self._update_cache()
+        """Retrieves metadata for specified VOD file ID from cache, refetching the list once on a miss."""
+        loaded = self._update_cache()
         file_id_str = str(file_id)
 
         metadata = self.metadata_cache.get(file_id_str)
@@ -87,78 +240,55 @@ class VODInfoProvider:
             log(f"VOD Cache hit for file ID: {file_id_str}", level=LOG_VERBOSE)
             return metadata
 
-        all_metadata = self._fetch_metadata()
-        for item in all_metadata:
-            if _metadata_id(item) == file_id_str:
+        now = time.time()
+        missed_at = self._misses.get(file_id_str)
+        if missed_at is not None and now - missed_at < self.MISS_TTL_SECONDS:
+            return None
+
+        # A file added since the last fetch is only found by refetching; skip
+        # that when the cache was filled by this very call or a background
+        # refresh is already fetching the list. Nothing is remembered as
+        # missing unless a fetch actually completed without it.
+        if loaded is False:
+            return None
+        if loaded is None:
+            if self._refreshing:
+                return None
+            if not self._force_refresh():
+                return None
+            metadata = self.metadata_cache.get(file_id_str)
+            if metadata:
                 log(
-                    f"Found VOD {file_id_str} in metadata list. Updating cache.",
+                    f"Found VOD {file_id_str} after refreshing metadata cache",
                     level=LOG_VERBOSE,
                 )
-                self.metadata_cache[file_id_str] = item
-                return item
+                return metadata
 
         log(f"No VOD metadata found for file ID: {file_id_str}", level=LOG_VERBOSE)
+        self._record_miss(file_id_str, now)
         return None
 
+    def _record_miss(self, file_id: str, now: float) -> None:
+        """Remembers an unknown id and forgets misses older than the TTL."""
+        misses = self._misses
+        while misses:
+            oldest_id = next(iter(misses))
+            if now - misses[oldest_id] < self.MISS_TTL_SECONDS:
+                break
+            del misses[oldest_id]
+        misses.pop(file_id, None)
+        misses[file_id] = now
+
     # METADATA FORMATTING
     def format_metadata(
         self, metadata: Dict[str, Any], current_time: Optional[str] = None
     ) -> Dict[str, Any]:
         """Formats VOD metadata according to configuration settings."""
-        formatted = {}
-
-        settings = self.settings
-        if settings is None:
-            return formatted
-
-        if settings.vod_title:
-            formatted["title"] = _metadata_value(metadata, "title", "Title")
-
-        episode_title = _metadata_value(metadata, "episode_title", "EpisodeTitle")
-        if settings.vod_episode_title and episode_title:
-            formatted["episode_title"] = episode_title
-
-        if settings.vod_summary:
-            formatted["summary"] = _metadata_value(metadata, "summary", "Summary")
-
-        if settings.vod_duration:
-            duration = _metadata_value(metadata, "duration", "Duration", default=0)
-            formatted["duration"] = self._format_duration(duration)
-
-        if settings.vod_progress and current_time:
+        formatted = {
+            key: value
+            for key, extract, keep_empty in self._format_fields
+            if (value := extract(metadata)) or keep_empty
+        }
+        if self._format_progress and current_time:
             formatted["progress"] = current_time
-
-        if settings.vod_image:
-            formatted["image_url"] = _metadata_value(
-                metadata, "image_url", "Image", "image"
-            )
-
-        if settings.vod_rating:
-            formatted["rating"] = _metadata_value(
-                metadata, "content_rating", "ContentRating"
-            )
-
-        if settings.vod_genres:
-            formatted["genres"] = _metadata_value(
-                metadata, "genres", "Genres", default=[]
-            )
-
-        cast = _metadata_value(metadata, "cast", "Cast", default=[])
-        if settings.vod_cast and cast:
-            formatted["cast"] = cast
-
         return formatted
-
-    def _format_duration(self, duration_seconds: float) -> str:
-        """Converts duration in seconds to human-readable time format."""
-        duration_seconds = float(duration_seconds or 0)
-        hours = int(duration_seconds // 3600)
-        minutes = int((duration_seconds % 3600) // 60)
-        seconds = int(duration_seconds % 60)
-
-        if hours > 0:
-            return f"{hours}h {minutes:02d}m {seconds:02d}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds:02d}s"
-        else:
-            return f"{seconds}s"
@@ -3,12 +3,14 @@
 
 import signal
 import asyncio
+import contextvars
 import hashlib
 import json
 import os
 import sys
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .helpers.config import get_settings, CONFIG_FILE
@@ -21,14 +23,6 @@ from .watchdog import (
 
 from . import __version__, __app_name__
 from .helpers.logging import log, set_log_level, setup_logging
-from .helpers.initialize import (
-    check_server_connectivity,
-    initialize_notifications,
-    initialize_alerts,
-    initialize_event_monitor,
-)
-from .diagnostics import run_test
-from .helpers.channel_info import ChannelInfoProvider
 
 SIGHUP = getattr(signal, "SIGHUP", None)
 
@@ -71,6 +65,14 @@ async def _read_config_snapshot_async() -> tuple[bytes | None, str]:
     return await asyncio.to_thread(_read_config_snapshot)
 
 
+def _config_signature() -> tuple[int, int, int] | None:
+    try:
+        stat = CONFIG_FILE.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
 async def _persist_watchdog_async(*, force: bool = True) -> None:
     if _watchdog is None:
         return
@@ -99,6 +101,14 @@ def _request_monitor_stop(monitor) -> None:
 def _init_dvr_monitor_sync(dvr, settings, test_mode: bool = False):
     from copy import copy
 
+    from .helpers.channel_info import ChannelInfoProvider
+    from .helpers.initialize import (
+        check_server_connectivity,
+        initialize_alerts,
+        initialize_event_monitor,
+        initialize_notifications,
+    )
+
     _dvr_id = getattr(dvr, "id", None)
     log(
         f"--- Initializing DVR: {dvr.name} ({dvr.host}:{dvr.port}) ---",
@@ -146,32 +156,43 @@ def _init_dvr_monitor_sync(dvr, settings, test_mode: bool = False):
         if hasattr(disk_space_alert, "_start_health_checker"):
             disk_space_alert._start_health_checker()
 
-    channel_count = 0
-    channel_alert = alert_manager.alert_instances.get("Channel-Watching")
-    if channel_alert is not None and hasattr(channel_alert, "channel_provider"):
+    def _preload_channels() -> int:
+        channel_alert = alert_manager.alert_instances.get("Channel-Watching")
+        if channel_alert is None or not hasattr(channel_alert, "channel_provider"):
+            return ChannelInfoProvider(dvr=dvr).cache_channels()
         try:
-            channel_count = channel_alert.channel_provider.cache_channels()
+            return channel_alert.channel_provider.cache_channels()
         except Exception as exc:
             log(
                 f"[{dvr.name}] Channel metadata preload failed: {exc}",
                 extra={"dvr_id": _dvr_id},
             )
-    else:
-        channel_provider = ChannelInfoProvider(dvr=dvr)
-        channel_count = channel_provider.cache_channels()
-
-    if channel_count:
-        log(f"[{dvr.name}] Channels: {channel_count}", extra={"dvr_id": _dvr_id})
+            return 0
 
-    vod_count = 0
-    recording_count = 0
+    preloads = {"Channels": _preload_channels}
     for alert_type, alert in alert_manager.alert_instances.items():
         if alert_type == "VOD-Watching" and hasattr(alert, "_cache_vod_metadata"):
-            vod_count = alert._cache_vod_metadata()
-        elif alert_type == "Recording-Events" and hasattr(alert, "_cache_channels"):
-            recording_count = alert._cache_channels()
+            preloads[alert_type] = alert._cache_vod_metadata
         elif alert_type != "Channel-Watching" and hasattr(alert, "_cache_channels"):
-            alert._cache_channels()
+            preloads[alert_type] = alert._cache_channels
+
+    # Each preload is its own round trip to the DVR, so run them side by side;
+    # each runs in a copy of this context so log context vars carry over.
+    with ThreadPoolExecutor(
+        max_workers=len(preloads), thread_name_prefix="preload"
+    ) as executor:
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, fill)
+            for name, fill in preloads.items()
+        }
+    counts = {name: future.result() for name, future in futures.items()}
+
+    channel_count = counts["Channels"]
+    if channel_count:
+        log(f"[{dvr.name}] Channels: {channel_count}", extra={"dvr_id": _dvr_id})
+
+    vod_count = counts.get("VOD-Watching", 0)
+    recording_count = counts.get("Recording-Events", 0)
     log(
         f"[{dvr.name}] VOD library: {vod_count} items | Recordings: {recording_count} scheduled",
         extra={"dvr_id": _dvr_id},
@@ -379,24 +400,41 @@ async def _watch_config_and_reload(
     reload_event: asyncio.Event,
     settings,
     test_mode: bool = False,
+    baseline_hash: str | None = None,
 ) -> None:
-    last_hash = ""
-    try:
-        _content, last_hash = await _read_config_snapshot_async()
-    except OSError:
-        pass
+    if baseline_hash is None:
+        last_hash = ""
+        last_signature = await asyncio.to_thread(_config_signature)
+        try:
+            _content, last_hash = await _read_config_snapshot_async()
+        except OSError:
+            pass
+    else:
+        # The caller already loaded _last_settings_raw from a snapshot with
+        # this hash; the first tick compares against it so a write that lands
+        # before this task starts is applied, not taken as the baseline.
+        last_hash = baseline_hash
+        last_signature = None
 
     while not shutdown_event.is_set():
         try:
             await asyncio.wait_for(reload_event.wait(), timeout=2.0)
             reload_event.clear()
+            forced = True
         except asyncio.TimeoutError:
-            pass
+            forced = False
 
         if shutdown_event.is_set():
             break
 
         try:
+            # A periodic check only stats the file; it is read and hashed when
+            # the stat changes or a SIGHUP asks for a reload.
+            signature = await asyncio.to_thread(_config_signature)
+            if not forced and signature == last_signature:
+                continue
+            last_signature = signature
+
             content, current_hash = await _read_config_snapshot_async()
             if content is None:
                 continue
@@ -424,7 +462,14 @@ async def _run_monitors_dynamic(
     shutdown_event: asyncio.Event,
     reload_event: asyncio.Event,
     test_mode: bool = False,
+    config_snapshot: tuple[bytes | None, str] | None = None,
 ) -> None:
+    """Run DVR monitors and apply config changes until shutdown.
+
+    config_snapshot is the settings file as it was when `settings` was loaded;
+    changes made since then are applied on the watcher's first tick. Without
+    it the file is read here, so earlier changes become the baseline.
+    """
     global _dvr_tasks, _dvr_monitors, _last_settings_raw, _watchdog
 
     _dvr_tasks = {}
@@ -435,10 +480,14 @@ async def _run_monitors_dynamic(
         ),
     )
 
+    baseline_hash = None
     try:
-        content, _hash = await _read_config_snapshot_async()
+        if config_snapshot is None:
+            config_snapshot = await _read_config_snapshot_async()
+        content, snapshot_hash = config_snapshot
         if content is not None:
             _last_settings_raw = json.loads(content.decode())
+            baseline_hash = snapshot_hash
     except Exception:
         _last_settings_raw = {}
 
@@ -452,7 +501,9 @@ async def _run_monitors_dynamic(
     await _persist_watchdog_async(force=True)
 
     watcher_task = asyncio.create_task(
-        _watch_config_and_reload(shutdown_event, reload_event, settings, test_mode),
+        _watch_config_and_reload(
+            shutdown_event, reload_event, settings, test_mode, baseline_hash
+        ),
         name="config-watcher",
     )
     watchdog_task = asyncio.create_task(
@@ -526,6 +577,12 @@ async def main() -> None:
     # INITIALIZATION
     bootstrap_encryption_key()
     settings = get_settings()
+    # The hot-reload watcher diffs later edits against the file these
+    # settings came from, so edits made during startup are not lost.
+    try:
+        config_snapshot = await _read_config_snapshot_async()
+    except OSError:
+        config_snapshot = None
 
     parser = argparse.ArgumentParser(
         description=f"{__app_name__} - Channels DVR monitoring tool"
@@ -581,24 +638,51 @@ async def main() -> None:
         log_level = 1
     set_log_level(log_level, test_mode=test_mode)
 
+    # SHUTDOWN SIGNAL WIRING
+    # Installed before any DVR work so a stop request during startup or while
+    # waiting for configuration exits cleanly. Test modes run blocking checks
+    # and keep the default handlers so Ctrl-C still interrupts them.
+    shutdown_event = asyncio.Event()
+    reload_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def _request_shutdown() -> None:
+        log("Received shutdown signal, stopping...")
+        shutdown_event.set()
+
+    if not test_mode:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            _install_signal_handler(loop, sig, _request_shutdown)
+        if SIGHUP is not None:
+            _install_signal_handler(loop, SIGHUP, lambda: reload_event.set())
+
     # DVR CONNECTIONS
     dvr_connections = settings.get_dvr_connections()
 
     if not dvr_connections:
+        if test_mode:
+            log("No DVR server configured; nothing to test.")
+            sys.exit(1)
         log(
             "Waiting for DVR server configuration. Set it in the Web UI at http://localhost:8501"
         )
-        while True:
-            await asyncio.sleep(3600)
-            settings = get_settings()
-            dvr_connections = settings.get_dvr_connections()
-            if dvr_connections:
-                log(
-                    "Configuration detected! DVR servers configured. Please restart ChannelWatch to apply."
-                )
+        # The config watcher starts DVRs as soon as they are added.
+        await _run_monitors_dynamic(
+            [],
+            settings,
+            shutdown_event,
+            reload_event,
+            test_mode=False,
+            config_snapshot=config_snapshot,
+        )
+        return
 
     # TEST MODE (use first DVR)
     first_dvr = dvr_connections[0]
+    # Diagnostics are imported only by the modes that run them, keeping the
+    # daemon's startup free of their dependencies.
+    if test_mode:
+        from .diagnostics import run_test
     if args.test_connectivity:
         sys.exit(0 if run_test("connectivity", first_dvr.host, first_dvr.port) else 1)
     if args.test_api:
@@ -615,6 +699,8 @@ async def main() -> None:
     if args.test_alert:
         from copy import copy as _copy
 
+        from .helpers.initialize import initialize_alerts, initialize_notifications
+
         _test_settings = _copy(settings)
         if first_dvr and first_dvr.overrides:
             for key, val in first_dvr.overrides.items():
@@ -637,39 +723,37 @@ async def main() -> None:
             else 1
         )
 
-    # SHUTDOWN SIGNAL WIRING
-    shutdown_event = asyncio.Event()
-    reload_event = asyncio.Event()
-    loop = asyncio.get_running_loop()
-
-    def _request_shutdown() -> None:
-        log("Received shutdown signal, stopping...")
-        shutdown_event.set()
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        _install_signal_handler(loop, sig, _request_shutdown)
-    if SIGHUP is not None:
-        _install_signal_handler(loop, SIGHUP, lambda: reload_event.set())
-
     # PER-DVR MONITORING SETUP
     global event_monitors
     event_monitors.clear()
 
+    # Each DVR is set up off the event loop so a stop signal is handled while
+    # a slow DVR is still being probed; startup ends after the DVR in progress.
     for dvr in dvr_connections:
-        monitor = _init_dvr_monitor_sync(dvr, settings, test_mode=test_mode)
+        if shutdown_event.is_set():
+            break
+        monitor = await asyncio.to_thread(
+            _init_dvr_monitor_sync, dvr, settings, test_mode
+        )
         if monitor:
             event_monitors.append(monitor)
 
+    if shutdown_event.is_set():
+        log("Shutdown requested during startup; not starting monitors.")
+        return
+
     if not event_monitors:
         log("No DVR servers could be connected. Waiting for configuration.")
-        while not shutdown_event.is_set():
-            await asyncio.sleep(3600)
-        return
 
     for monitor in event_monitors:
         log(f"[{monitor.dvr_name}] Monitoring started")
     await _run_monitors_dynamic(
-        event_monitors, settings, shutdown_event, reload_event, test_mode=False
+        event_monitors,
+        settings,
+        shutdown_event,
+        reload_event,
+        test_mode=False,
+        config_snapshot=config_snapshot,
     )
 
 
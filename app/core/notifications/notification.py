@@ -6,11 +6,12 @@ delivery for each alert notification.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ..helpers.logging import log, LOG_STANDARD
+from ..helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
 from .providers.base import NotificationProvider
-from .rate_limiter import RateLimiter
+from .rate_limiter import DuplicateFilter, RateLimiter
 from .delivery import CircuitBreaker, deliver_with_retry, estimate_payload_size
 
 APPRISE_DEST_KEYS = (
@@ -28,6 +29,19 @@ SINGLE_ATTEMPT_APPRISE_EVENT_TYPES = {"channel", "vod"}
 
 _ALL_ENABLED: Dict[str, bool] = {k: True for k in ALL_DEST_KEYS}
 
+# (provider type to log, or None for webhooks; deliver_with_retry kwargs)
+_Delivery = Tuple[Optional[str], Dict[str, Any]]
+
+
+def _duplicate_key(title: str, message: str, kwargs: Dict[str, Any]) -> Tuple[str, ...]:
+    """Identical text from different DVRs or event types is not a duplicate."""
+    return (
+        kwargs.get("dvr_id", ""),
+        kwargs.get("event_type", ""),
+        title,
+        message,
+    )
+
 
 def _resolve_routing(
     dvr_id: str, event_type: str, routing_config: Dict[str, Any]
@@ -80,6 +94,7 @@ class NotificationManager:
             max_notifications=rate_limit,
             window_seconds=rate_window,
         )
+        self.duplicate_filter = DuplicateFilter()
         self.circuit_breaker = CircuitBreaker()
         self.db_engine = db_engine
 
@@ -123,31 +138,111 @@ class NotificationManager:
 
         The title, message, DVR id, event type, and optional activity metadata
         are checked against rate limits and routing settings before delivery.
-        The return value is ``True`` if any configured destination succeeds.
+        Destinations are delivered concurrently, so the call takes as long as
+        the slowest one rather than their sum. The return value is ``True`` if
+        any configured destination succeeds, or if the same notification for
+        the same DVR and event type went out moments ago and this copy was
+        dropped.
+        """
+        key = _duplicate_key(title, message, kwargs)
+        if self._is_duplicate(key, title):
+            return True
+        plan = self._plan_deliveries(title, message, kwargs)
+        if plan is None:
+            return False
+        deliveries, has_webhooks = plan
+
+        if len(deliveries) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(deliveries), thread_name_prefix="notify"
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda delivery: deliver_with_retry(**delivery[1]), deliveries
+                    )
+                )
+        else:
+            results = [deliver_with_retry(**delivery) for _, delivery in deliveries]
+
+        return self._finish(key, title, deliveries, results, has_webhooks)
+
+    async def send_notification_async(self, title: str, message: str, **kwargs) -> bool:
+        """Send one notification without blocking the asyncio event loop."""
+        key = _duplicate_key(title, message, kwargs)
+        if self._is_duplicate(key, title):
+            return True
+        plan = self._plan_deliveries(title, message, kwargs)
+        if plan is None:
+            return False
+        deliveries, has_webhooks = plan
+
+        # Providers are intentionally sync for plugin compatibility; run each
+        # destination's retry/delivery loop in its own worker thread.
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(deliver_with_retry, **delivery)
+                for _, delivery in deliveries
+            )
+        )
+
+        return self._finish(key, title, deliveries, results, has_webhooks)
+
+    def _is_duplicate(self, key: Tuple[str, ...], title: str) -> bool:
+        if not self.duplicate_filter.is_duplicate(*key):
+            return False
+        log(f"Duplicate notification suppressed: {title}", level=LOG_VERBOSE)
+        return True
+
+    def _finish(
+        self,
+        key: Tuple[str, ...],
+        title: str,
+        deliveries: List[_Delivery],
+        results: List[bool],
+        has_webhooks: bool,
+    ) -> bool:
+        """Report the outcome; only a delivered notification suppresses repeats."""
+        delivered = self._report_deliveries(title, deliveries, results, has_webhooks)
+        if delivered:
+            self.duplicate_filter.record(*key)
+        return delivered
+
+    def _plan_deliveries(
+        self, title: str, message: str, kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[List[_Delivery], bool]]:
+        """Apply rate limiting and routing, returning one delivery per destination.
+
+        Each delivery pairs the provider type to log (``None`` for webhooks)
+        with the keyword arguments for ``deliver_with_retry``. Returns ``None``
+        when nothing is configured or the rate limiter suppresses the alert.
         """
         has_webhooks = bool(
             self.webhook_manager and self.webhook_manager.is_configured()
         )
         if not self.providers and not has_webhooks:
-            return False
+            return None
 
         if not self.rate_limiter.allow():
             log(f"Notification suppressed by rate limiter: {title}", level=LOG_STANDARD)
-            return False
+            return None
 
         dvr_id = kwargs.get("dvr_id", "")
         event_type = kwargs.get("event_type", "")
         routing = _resolve_routing(dvr_id, event_type, _load_routing_config())
-        activity_event_id = kwargs.get("activity_event_id")
+        common = {
+            "dvr_id": dvr_id,
+            "event_type": event_type,
+            "payload_size": estimate_payload_size(title, message, **kwargs),
+            "circuit_breaker": self.circuit_breaker,
+            "db_engine": self.db_engine,
+            "activity_event_id": kwargs.get("activity_event_id"),
+        }
 
         allowed_apprise: Optional[Set[str]] = None
         if dvr_id and event_type:
             allowed_apprise = {k for k in APPRISE_DEST_KEYS if routing.get(k, True)}
 
-        payload_size = estimate_payload_size(title, message, **kwargs)
-
-        overall_success = False
-
+        deliveries: List[_Delivery] = []
         for provider_type, provider in self.providers.items():
             if not provider.is_configured():
                 continue
@@ -158,30 +253,19 @@ class NotificationManager:
             def _call(p=provider, sk=send_kwargs):
                 return p.send_notification(title, message, **sk)
 
-            success = deliver_with_retry(
-                dvr_id=dvr_id,
-                channel="apprise",
-                event_type=event_type,
-                provider_type=provider_type,
-                channel_id="apprise",
-                payload_size=payload_size,
-                deliver_fn=_call,
-                circuit_breaker=self.circuit_breaker,
-                db_engine=self.db_engine,
-                activity_event_id=activity_event_id,
-                with_retry=_should_retry_apprise(event_type),
-            )
-            if success:
-                log(
-                    f"Notification sent via {provider_type}: {title}",
-                    level=LOG_STANDARD,
-                )
-                overall_success = True
-            else:
-                log(
-                    f"Notification failed via {provider_type}: {title}",
-                    level=LOG_STANDARD,
+            deliveries.append(
+                (
+                    provider_type,
+                    dict(
+                        common,
+                        channel="apprise",
+                        provider_type=provider_type,
+                        channel_id="apprise",
+                        deliver_fn=_call,
+                        with_retry=_should_retry_apprise(event_type),
+                    ),
                 )
+            )
 
         wm = self.webhook_manager
         if wm is not None and has_webhooks and routing.get("webhook", True):
@@ -189,129 +273,52 @@ class NotificationManager:
             def _webhook_call(w=wm):
                 return w.send_notification(title, message, **kwargs)
 
-            success = deliver_with_retry(
-                dvr_id=dvr_id,
-                channel="webhook",
-                event_type=event_type,
-                provider_type="webhook",
-                channel_id="",
-                payload_size=payload_size,
-                deliver_fn=_webhook_call,
-                circuit_breaker=self.circuit_breaker,
-                db_engine=self.db_engine,
-                activity_event_id=activity_event_id,
-                with_retry=False,
+            deliveries.append(
+                (
+                    None,
+                    dict(
+                        common,
+                        channel="webhook",
+                        provider_type="webhook",
+                        channel_id="",
+                        deliver_fn=_webhook_call,
+                        with_retry=False,
+                    ),
+                )
             )
-            if success:
-                overall_success = True
         elif has_webhooks and dvr_id and event_type:
             log(
                 f"Notification skipped (routing): {dvr_id}/{event_type} → webhook disabled",
                 level=LOG_STANDARD,
             )
 
-        active_destinations = len(self.get_active_providers()) + (
-            1 if has_webhooks else 0
-        )
-        if not overall_success and active_destinations > 0:
-            log(
-                f"Notification failed for all configured providers (Title: {title}).",
-                level=LOG_STANDARD,
-            )
-
-        return overall_success
-
-    async def send_notification_async(self, title: str, message: str, **kwargs) -> bool:
-        """Send one notification without blocking the asyncio event loop."""
-        has_webhooks = bool(
-            self.webhook_manager and self.webhook_manager.is_configured()
-        )
-        if not self.providers and not has_webhooks:
-            return False
-
-        if not self.rate_limiter.allow():
-            log(f"Notification suppressed by rate limiter: {title}", level=LOG_STANDARD)
-            return False
-
-        dvr_id = kwargs.get("dvr_id", "")
-        event_type = kwargs.get("event_type", "")
-        routing = _resolve_routing(dvr_id, event_type, _load_routing_config())
-        activity_event_id = kwargs.get("activity_event_id")
-
-        allowed_apprise: Optional[Set[str]] = None
-        if dvr_id and event_type:
-            allowed_apprise = {k for k in APPRISE_DEST_KEYS if routing.get(k, True)}
-
-        payload_size = estimate_payload_size(title, message, **kwargs)
+        return deliveries, has_webhooks
 
+    def _report_deliveries(
+        self,
+        title: str,
+        deliveries: List[_Delivery],
+        results: List[bool],
+        has_webhooks: bool,
+    ) -> bool:
+        """Log per-provider outcomes and return whether any delivery succeeded."""
         overall_success = False
-
-        for provider_type, provider in self.providers.items():
-            if not provider.is_configured():
+        for (provider_type, _), success in zip(deliveries, results):
+            if success:
+                overall_success = True
+            if provider_type is None:
                 continue
-            send_kwargs = dict(kwargs)
-            if allowed_apprise is not None:
-                send_kwargs["allowed_apprise_destinations"] = allowed_apprise
-
-            def _call(p=provider, sk=send_kwargs):
-                return p.send_notification(title, message, **sk)
-
-            # Providers are intentionally sync for plugin compatibility; run
-            # the existing retry/delivery loop in a worker thread.
-            success = await asyncio.to_thread(
-                deliver_with_retry,
-                dvr_id=dvr_id,
-                channel="apprise",
-                event_type=event_type,
-                provider_type=provider_type,
-                channel_id="apprise",
-                payload_size=payload_size,
-                deliver_fn=_call,
-                circuit_breaker=self.circuit_breaker,
-                db_engine=self.db_engine,
-                activity_event_id=activity_event_id,
-                with_retry=_should_retry_apprise(event_type),
-            )
             if success:
                 log(
                     f"Notification sent via {provider_type}: {title}",
                     level=LOG_STANDARD,
                 )
-                overall_success = True
             else:
                 log(
                     f"Notification failed via {provider_type}: {title}",
                     level=LOG_STANDARD,
                 )
 
-        wm = self.webhook_manager
-        if wm is not None and has_webhooks and routing.get("webhook", True):
-
-            def _webhook_call(w=wm):
-                return w.send_notification(title, message, **kwargs)
-
-            success = await asyncio.to_thread(
-                deliver_with_retry,
-                dvr_id=dvr_id,
-                channel="webhook",
-                event_type=event_type,
-                provider_type="webhook",
-                channel_id="",
-                payload_size=payload_size,
-                deliver_fn=_webhook_call,
-                circuit_breaker=self.circuit_breaker,
-                db_engine=self.db_engine,
-                activity_event_id=activity_event_id,
-                with_retry=False,
-            )
-            if success:
-                overall_success = True
-        elif has_webhooks and dvr_id and event_type:
-            log(
-                f"Notification skipped (routing): {dvr_id}/{event_type} → webhook disabled",
-                level=LOG_STANDARD,
-            )
-
         active_destinations = len(self.get_active_providers()) + (
             1 if has_webhooks else 0
         )
@@ -1,8 +1,14 @@
 """Multi-platform notification provider using Apprise library for service integration."""
 
+import atexit
+import contextvars
+import functools
 import importlib
 import ipaddress
-from typing import Any, Optional, List
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from ...helpers.logging import log, LOG_STANDARD, LOG_VERBOSE
@@ -15,6 +21,222 @@ from ...helpers.trusted_destinations import (
 from .base import NotificationProvider
 from ...helpers.config import CoreSettings
 
+_DISCORD_SCHEME = "discord://"
+_DISCORD_WEBHOOK_BASE = "https://discord.com/api/webhooks/"
+_DISCORD_USERNAME = "ChannelWatch Bot"
+_DISCORD_EMBED_COLOR = 3447003
+_DISCORD_WEBHOOK_PATH = "/api/webhooks/"
+_DISCORD_WEBHOOK_HOSTS = ("discord.com/api/webhooks/", "discordapp.com/api/webhooks/")
+# Bare key=value email settings ("user=...&pass=...") rather than a URL.
+_EMAIL_PARAM_RE = re.compile(r"user=|pass=|smtp=|port=")
+
+_discord_http: Any = None
+_discord_http_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _discord_webhook_url(discord_url: str) -> Optional[str]:
+    """Turns discord://id/token into its webhook URL; None when malformed."""
+    webhook_id, sep, webhook_token = discord_url[len(_DISCORD_SCHEME) :].partition("/")
+    if not sep:
+        return None
+    return f"{_DISCORD_WEBHOOK_BASE}{webhook_id}/{webhook_token}"
+
+
+def _discord_client() -> Any:
+    """Returns the shared keep-alive client so webhooks reuse one TLS connection.
+
+    Failed connects are retried by the transport; POSTs that reached Discord
+    are never replayed.
+    """
+    global _discord_http
+    with _discord_http_lock:
+        if _discord_http is None or _discord_http.is_closed:
+            import httpx
+
+            _discord_http = httpx.Client(
+                timeout=httpx.Timeout(10, connect=3.05),
+                transport=httpx.HTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=16),
+                ),
+            )
+        return _discord_http
+
+
+def _close_discord_client() -> None:
+    with _discord_http_lock:
+        if _discord_http is not None:
+            _discord_http.close()
+
+
+atexit.register(_close_discord_client)
+
+# Posts to several webhooks, and Discord alongside the other Apprise services,
+# run side by side, so latency is the slowest one rather than the sum.
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cw-notify")
+
+
+def _post_discord_webhook(webhook_url: str, payload: Dict[str, Any]) -> bool:
+    """Posts one Discord webhook; returns True when Discord accepted it."""
+    import httpx
+
+    log("Sending Discord notification", level=LOG_VERBOSE)
+    try:
+        response = _discord_client().post(webhook_url, json=payload)
+    except (httpx.RequestError, httpx.TimeoutException) as e:
+        log(
+            f"Error sending Discord notification to {redact_url(webhook_url)}: {type(e).__name__}",
+            level=LOG_STANDARD,
+        )
+        return False
+    except Exception as e:
+        log(
+            f"Error sending Discord notification: {type(e).__name__}",
+            level=LOG_STANDARD,
+        )
+        return False
+
+    if response.status_code == 204:
+        log("Discord notification sent successfully", level=LOG_VERBOSE)
+        return True
+    log(
+        f"Discord notification failed: {response.status_code} {response.text}",
+        level=LOG_STANDARD,
+    )
+    return False
+
+
+class _PendingEmbed:
+    """One caller's embed waiting for the POST that carries it."""
+
+    __slots__ = ("embed", "size", "ok", "lead", "done")
+
+    def __init__(self, embed: Dict[str, Any]) -> None:
+        self.embed = embed
+        self.size = len(embed.get("title") or "") + len(embed.get("description") or "")
+        self.ok = False
+        self.lead = False
+        self.done = threading.Event()
+
+
+class _DiscordBatcher:
+    """Coalesces embeds bound for one Discord webhook into shared POSTs.
+
+    A caller that finds the webhook idle posts straight away. Embeds that
+    arrive while a POST is in flight queue up, and when it returns the oldest
+    waiter takes the lead and posts them together, up to Discord's per-message
+    limits, so a burst of alerts costs a few round-trips instead of one each.
+    Every caller returns once its own embed has been delivered or has failed;
+    a batch Discord rejects is resent one embed at a time so each caller gets
+    its own result.
+    """
+
+    MAX_EMBEDS = 10
+    MAX_CHARS = 6000
+
+    def __init__(self, webhook_url: str) -> None:
+        self.webhook_url = webhook_url
+        self._lock = threading.Lock()
+        self._pending: List[_PendingEmbed] = []
+        self._busy = False
+
+    def send(self, embed: Dict[str, Any]) -> bool:
+        item = _PendingEmbed(embed)
+        with self._lock:
+            self._pending.append(item)
+            item.lead = not self._busy
+            self._busy = True
+        # A waiter wakes either with its result or with the lead handed over.
+        if not item.lead:
+            item.done.wait()
+        if item.lead:
+            self._drain()
+        return item.ok
+
+    def _next_batch(self) -> List[_PendingEmbed]:
+        with self._lock:
+            batch: List[_PendingEmbed] = []
+            chars = 0
+            for item in self._pending:
+                if batch and (
+                    len(batch) == self.MAX_EMBEDS or chars + item.size > self.MAX_CHARS
+                ):
+                    break
+                batch.append(item)
+                chars += item.size
+            del self._pending[: len(batch)]
+            return batch
+
+    def _drain(self) -> None:
+        """Posts the batch holding the leader's embed, then passes the lead on."""
+        batch = self._next_batch()
+        try:
+            if len(batch) > 1:
+                log(
+                    f"Combining {len(batch)} Discord notifications into one request",
+                    level=LOG_VERBOSE,
+                )
+            if self._post(batch):
+                _finish(batch, True)
+            elif len(batch) == 1:
+                _finish(batch, False)
+            else:
+                log(
+                    "Combined Discord notification failed, resending individually",
+                    level=LOG_VERBOSE,
+                )
+                for item in batch:
+                    _finish([item], self._post([item]))
+        except BaseException:
+            for item in batch:
+                item.done.set()
+            raise
+        finally:
+            self._hand_off()
+
+    def _post(self, batch: List[_PendingEmbed]) -> bool:
+        payload = {
+            "username": _DISCORD_USERNAME,
+            "content": "",
+            "embeds": [item.embed for item in batch],
+        }
+        return _post_discord_webhook(self.webhook_url, payload)
+
+    def _hand_off(self) -> None:
+        with self._lock:
+            if not self._pending:
+                self._busy = False
+                return
+            successor = self._pending[0]
+            successor.lead = True
+        successor.done.set()
+
+
+def _finish(batch: List[_PendingEmbed], ok: bool) -> None:
+    for item in batch:
+        item.ok = ok
+        item.done.set()
+
+
+_discord_batchers: Dict[str, _DiscordBatcher] = {}
+_discord_batchers_lock = threading.Lock()
+
+
+def _send_discord_embed(webhook_url: str, embed: Dict[str, Any]) -> bool:
+    """Delivers an embed through the webhook's batcher; True when accepted."""
+    with _discord_batchers_lock:
+        batcher = _discord_batchers.get(webhook_url)
+        if batcher is None:
+            batcher = _discord_batchers[webhook_url] = _DiscordBatcher(webhook_url)
+    return batcher.send(embed)
+
+
+# Apprise objects are not safe to notify() from several threads at once, so
+# each cached instance is paired with a lock held around its sends.
+_apprise_instances_lock = threading.Lock()
+
+
 # APPRISE PROVIDER
 
 
@@ -35,6 +257,12 @@ class AppriseProvider(NotificationProvider):
         "apprise_custom": "{}",
     }
 
+    # Filled in on first use by _load_apprise() and _apprise_for().
+    _apprise_module: Any = None
+    _html_format: Any = None
+    _text_format: Any = None
+    _apprise_instances: Optional[Dict[Tuple[str, ...], Tuple[Any, Any]]] = None
+
     def __init__(self):
         """Initializes Apprise provider with empty configuration."""
         self.apprise = None
@@ -42,13 +270,43 @@ class AppriseProvider(NotificationProvider):
         self.url_entries: List[tuple] = []
         self.settings: Optional[CoreSettings] = None
 
+    def _load_apprise(self) -> Any:
+        """Imports apprise once per provider and resolves its body formats."""
+        if self._apprise_module is None:
+            apprise_module = importlib.import_module("apprise")
+            notify_format = getattr(apprise_module, "NotifyFormat", None)
+            self._html_format = getattr(notify_format, "HTML", None)
+            self._text_format = getattr(notify_format, "TEXT", None)
+            self._apprise_module = apprise_module
+        return self._apprise_module
+
+    def _apprise_for(self, urls: List[str]) -> Tuple[Any, Any]:
+        """Returns an Apprise instance for these URLs and the lock for its sends.
+
+        Routing and the SSRF checks still run per send; only parsing the
+        surviving URLs into Apprise services happens once per distinct set.
+        """
+        key = tuple(urls)
+        with _apprise_instances_lock:
+            instances = self._apprise_instances
+            if instances is None:
+                instances = self._apprise_instances = {}
+            entry = instances.get(key)
+            if entry is None:
+                instance = self._load_apprise().Apprise()
+                for url in urls:
+                    instance.add(url)
+                entry = instances[key] = (instance, threading.Lock())
+        return entry
+
     # CONFIGURATION
 
     def initialize(self, settings: CoreSettings, **kwargs) -> bool:
         """Configures Apprise with service URLs from application settings."""
         self.settings = settings
+        self._apprise_instances = None
         try:
-            apprise_module = importlib.import_module("apprise")
+            apprise_module = self._load_apprise()
             self.apprise = apprise_module.Apprise()
 
             self.url_entries = self._collect_url_entries_from_settings()
@@ -102,49 +360,25 @@ class AppriseProvider(NotificationProvider):
             if value and isinstance(value, str):
                 if (
                     setting_attr == "apprise_email"
-                    and "=" in value
                     and "://" not in value
-                    and (
-                        value.strip().startswith(("user=", "pass=", "smtp=", "port="))
-                        or any(
-                            param in value
-                            for param in ["user=", "pass=", "smtp=", "port="]
-                        )
-                    )
+                    and _EMAIL_PARAM_RE.search(value)
                 ):
                     if "from=" not in value:
                         url = f"mailtos://_?{value}&from=ChannelWatch"
                     else:
                         url = f"mailtos://_?{value}"
 
-                elif setting_attr == "apprise_discord" and (
-                    "discord.com/api/webhooks/" in value
-                    or "discordapp.com/api/webhooks/" in value
+                elif setting_attr == "apprise_discord" and any(
+                    host in value for host in _DISCORD_WEBHOOK_HOSTS
                 ):
-                    try:
-                        parts = value.split("/api/webhooks/")
-                        if len(parts) == 2 and "/" in parts[1]:
-                            webhook_parts = parts[1].split("/", 1)
-                            if len(webhook_parts) >= 2:
-                                webhook_id, webhook_token = (
-                                    webhook_parts[0],
-                                    webhook_parts[1],
-                                )
-                                if "?" in webhook_token:
-                                    webhook_token = webhook_token.split("?", 1)[0]
-                                url = f"discord://{webhook_id}/{webhook_token}"
-                            else:
-                                url = url_template.format(value)
-                                log(
-                                    "Could not extract token from Discord webhook URL",
-                                    LOG_STANDARD,
-                                )
-                        else:
-                            url = url_template.format(value)
-                            log("Invalid Discord webhook URL format", LOG_STANDARD)
-                    except Exception as e:
-                        log(f"Error parsing Discord webhook URL: {e}", LOG_STANDARD)
+                    _, _, tail = value.partition(_DISCORD_WEBHOOK_PATH)
+                    webhook_id, sep, webhook_token = tail.partition("/")
+                    if sep and _DISCORD_WEBHOOK_PATH not in tail:
+                        webhook_token = webhook_token.partition("?")[0]
+                        url = f"discord://{webhook_id}/{webhook_token}"
+                    else:
                         url = url_template.format(value)
+                        log("Invalid Discord webhook URL format", LOG_STANDARD)
                 elif setting_attr == "apprise_custom" and "://" in value:
                     url = value
                 else:
@@ -292,165 +526,36 @@ class AppriseProvider(NotificationProvider):
             for dest_key, url in active_entries:
                 if not self._is_safe_custom_destination(dest_key, url):
                     continue
-                if url.startswith("discord://"):
+                if url.startswith(_DISCORD_SCHEME):
                     discord_urls.append(url)
                 else:
                     other_urls.append(url)
 
-            apprise_module = importlib.import_module("apprise")
-            discord_success = False
-            other_success = False
-            if discord_urls:
-                try:
-                    try:
-                        import httpx
-                    except ImportError:
-                        log(
-                            "httpx library not available, using Apprise fallback for Discord",
-                            level=LOG_STANDARD,
-                        )
-                        discord_message = message
-                        discord_apprise = apprise_module.Apprise()
-                        for url in discord_urls:
-                            discord_apprise.add(url)
-
-                        try:
-                            body_format = (
-                                apprise_module.NotifyFormat.TEXT
-                                if hasattr(apprise_module, "NotifyFormat")
-                                else None
-                            )
-                        except (ImportError, AttributeError):
-                            body_format = None
-                        apprise_image_url = self._apprise_attach_url(image_url)
-                        discord_success = discord_apprise.notify(
-                            title=title,
-                            body=discord_message,
-                            body_format=body_format,
-                            attach=[apprise_image_url] if apprise_image_url else None,
-                        )
-                        if discord_success:
-                            log(
-                                "Discord notification sent via Apprise fallback",
-                                level=LOG_VERBOSE,
-                            )
-                    else:
-                        for discord_url in discord_urls:
-                            if (
-                                discord_url.startswith("discord://")
-                                and "/" in discord_url[10:]
-                            ):
-                                parts = discord_url[10:].split("/", 1)
-                                if len(parts) == 2:
-                                    webhook_id, webhook_token = parts
-                                    webhook_url = f"https://discord.com/api/webhooks/{webhook_id}/{webhook_token}"
-                                    embed: dict[str, Any] = {
-                                        "title": title,
-                                        "description": message,
-                                        "color": 3447003,
-                                    }
-                                    if image_url and not is_safe_url(image_url):
-                                        log(
-                                            f"SSRF: dropping image_url from notification: {redact_url(image_url)} (reason: blocked by delivery-time is_safe_url policy)",
-                                            LOG_STANDARD,
-                                        )
-                                        image_url = None
-                                    if image_url:
-                                        embed["image"] = {"url": image_url}
-
-                                    payload = {
-                                        "username": "ChannelWatch Bot",
-                                        "content": "",
-                                        "embeds": [embed],
-                                    }
-
-                                    log(
-                                        "Sending Discord notification",
-                                        level=LOG_VERBOSE,
-                                    )
-                                    try:
-                                        response = httpx.post(
-                                            webhook_url, json=payload, timeout=10
-                                        )
-                                    except (
-                                        httpx.RequestError,
-                                        httpx.TimeoutException,
-                                    ) as e:
-                                        log(
-                                            f"Error sending Discord notification to {redact_url(webhook_url)}: {type(e).__name__}",
-                                            level=LOG_STANDARD,
-                                        )
-                                        continue
-                                    except Exception as e:
-                                        log(
-                                            f"Error sending Discord notification: {type(e).__name__}",
-                                            level=LOG_STANDARD,
-                                        )
-                                        continue
-
-                                    if response.status_code == 204:
-                                        discord_success = True
-                                        log(
-                                            "Discord notification sent successfully",
-                                            level=LOG_VERBOSE,
-                                        )
-                                    else:
-                                        log(
-                                            f"Discord notification failed: {response.status_code} {response.text}",
-                                            level=LOG_STANDARD,
-                                        )
-                except Exception as e:
-                    log(
-                        f"Discord notification error: {type(e).__name__}",
-                        level=LOG_STANDARD,
-                    )
-                    discord_success = False
-            if other_urls:
-                try:
-                    try:
-                        body_format = (
-                            apprise_module.NotifyFormat.HTML
-                            if "NotifyFormat" in dir(apprise_module)
-                            else None
-                        )
-                        html_message = message.replace("\n", "<br />")
-                    except (ImportError, AttributeError):
-                        body_format = None
-                        html_message = message
-                    other_apprise = apprise_module.Apprise()
-                    for url in other_urls:
-                        other_apprise.add(url)
-                    if image_url and not is_safe_url(image_url):
-                        log(
-                            f"SSRF: dropping image_url from notification: {redact_url(image_url)} (reason: blocked by delivery-time is_safe_url policy)",
-                            LOG_STANDARD,
-                        )
-                        image_url = None
-                    apprise_image_url = self._apprise_attach_url(image_url)
-                    attach = [apprise_image_url] if apprise_image_url else None
-                    other_success = other_apprise.notify(
-                        title=title,
-                        body=html_message,
-                        attach=attach,
-                        body_format=body_format,
-                    )
-                    if other_success:
-                        log(
-                            "Other notification services: delivery successful",
-                            level=LOG_VERBOSE,
-                        )
-                    else:
-                        log(
-                            "Other notification services: delivery failed",
-                            level=LOG_STANDARD,
-                        )
-                except Exception as e:
-                    destination_summary = self._destination_summary(other_urls)
-                    log(
-                        f"Error with other notification services ({destination_summary}): {type(e).__name__}",
-                        level=LOG_STANDARD,
-                    )
-                    other_success = False
+            # The Apprise services run on the pool while Discord is posted
+            # here, so the send takes as long as the slower of the two.
+            other_future = None
+            if other_urls and discord_urls:
+                other_future = _NOTIFY_POOL.submit(
+                    contextvars.copy_context().run,
+                    self._deliver_other,
+                    title,
+                    message,
+                    other_urls,
+                    image_url,
+                )
+            elif other_urls:
+                other_success = self._deliver_other(
+                    title, message, other_urls, image_url
+                )
+            else:
+                other_success = False
+            discord_success = (
+                self._deliver_discord(title, message, discord_urls, image_url)
+                if discord_urls
+                else False
+            )
+            if other_future is not None:
+                other_success = other_future.result()
             success = discord_success or other_success
 
             if success:
@@ -463,3 +568,119 @@ class AppriseProvider(NotificationProvider):
             success = False
 
         return success
+
+    def _deliver_discord(
+        self,
+        title: str,
+        message: str,
+        discord_urls: List[str],
+        image_url: Optional[str],
+    ) -> bool:
+        try:
+            try:
+                import httpx  # noqa: F401
+            except ImportError:
+                log(
+                    "httpx library not available, using Apprise fallback for Discord",
+                    level=LOG_STANDARD,
+                )
+                discord_apprise, notify_lock = self._apprise_for(discord_urls)
+
+                apprise_image_url = self._apprise_attach_url(image_url)
+                with notify_lock:
+                    discord_success = discord_apprise.notify(
+                        title=title,
+                        body=message,
+                        body_format=self._text_format,
+                        attach=[apprise_image_url] if apprise_image_url else None,
+                    )
+                if discord_success:
+                    log(
+                        "Discord notification sent via Apprise fallback",
+                        level=LOG_VERBOSE,
+                    )
+                return discord_success
+
+            webhook_urls = [
+                webhook_url
+                for webhook_url in map(_discord_webhook_url, discord_urls)
+                if webhook_url
+            ]
+            if webhook_urls and image_url and not is_safe_url(image_url):
+                log(
+                    f"SSRF: dropping image_url from notification: {redact_url(image_url)} (reason: blocked by delivery-time is_safe_url policy)",
+                    LOG_STANDARD,
+                )
+                image_url = None
+            embed: dict[str, Any] = {
+                "title": title,
+                "description": message,
+                "color": _DISCORD_EMBED_COLOR,
+            }
+            if image_url:
+                embed["image"] = {"url": image_url}
+
+            if len(webhook_urls) == 1:
+                results = [_send_discord_embed(webhook_urls[0], embed)]
+            else:
+                futures = [
+                    _NOTIFY_POOL.submit(
+                        contextvars.copy_context().run,
+                        _send_discord_embed,
+                        webhook_url,
+                        embed,
+                    )
+                    for webhook_url in webhook_urls
+                ]
+                results = [future.result() for future in futures]
+            return any(results)
+        except Exception as e:
+            log(
+                f"Discord notification error: {type(e).__name__}",
+                level=LOG_STANDARD,
+            )
+            return False
+
+    def _deliver_other(
+        self,
+        title: str,
+        message: str,
+        other_urls: List[str],
+        image_url: Optional[str],
+    ) -> bool:
+        try:
+            html_message = message.replace("\n", "<br />")
+            other_apprise, notify_lock = self._apprise_for(other_urls)
+            if image_url and not is_safe_url(image_url):
+                log(
+                    f"SSRF: dropping image_url from notification: {redact_url(image_url)} (reason: blocked by delivery-time is_safe_url policy)",
+                    LOG_STANDARD,
+                )
+                image_url = None
+            apprise_image_url = self._apprise_attach_url(image_url)
+            attach = [apprise_image_url] if apprise_image_url else None
+            with notify_lock:
+                other_success = other_apprise.notify(
+                    title=title,
+                    body=html_message,
+                    attach=attach,
+                    body_format=self._html_format,
+                )
+            if other_success:
+                log(
+                    "Other notification services: delivery successful",
+                    level=LOG_VERBOSE,
+                )
+            else:
+                log(
+                    "Other notification services: delivery failed",
+                    level=LOG_STANDARD,
+                )
+            return other_success
+        except Exception as e:
+            destination_summary = self._destination_summary(other_urls)
+            log(
+                f"Error with other notification services ({destination_summary}): {type(e).__name__}",
+                level=LOG_STANDARD,
+            )
+            return False
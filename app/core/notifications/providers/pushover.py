@@ -1,10 +1,29 @@
 """Pushover API integration for mobile and desktop notifications."""
+import threading
+import time
+from collections import OrderedDict
+
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Tuple
+from urllib3.util.retry import Retry
 
 from ...helpers.logging import log, LOG_VERBOSE
 from .base import NotificationProvider
 
+# (connect, read) timeouts: fail fast on an unreachable API, allow slow uploads.
+_TIMEOUT = (3.05, 10)
+# POSTs are not replayed on 5xx (Retry skips non-idempotent methods); only
+# failed connects and the image GET are retried.
+_RETRY = Retry(
+    total=2, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504)
+)
+
+# Alerts keep attaching the same channel logos and artwork; keep recent
+# downloads so a repeat costs a dict lookup instead of an HTTPS GET.
+IMAGE_CACHE_TTL_SECONDS = 3600
+IMAGE_CACHE_MAX_ENTRIES = 32
+
 # PUSHOVER PROVIDER
 
 class PushoverProvider(NotificationProvider):
@@ -18,6 +37,14 @@ class PushoverProvider(NotificationProvider):
         self.user_key = None
         self.api_token = None
         self.api_url = "https://api.pushover.net/1/messages.json"
+        # Reuse the TLS connection to the Pushover API across notifications.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_maxsize=16, max_retries=_RETRY)
+        )
+        # url -> (fetched_at, attachment), oldest first.
+        self._image_cache: OrderedDict = OrderedDict()
+        self._image_cache_lock = threading.Lock()
     
     # CONFIGURATION
     
@@ -51,25 +78,23 @@ class PushoverProvider(NotificationProvider):
         attachment = None
         try:
             if image_url:
-                img_resp = requests.get(image_url, timeout=5)
-                if img_resp.status_code == 200:
-                    attachment = ("image.jpg", img_resp.content, "image/jpeg")
+                attachment = self._fetch_image(image_url)
         except Exception as e:
             log(f"Error downloading image: {e}", LOG_VERBOSE)
         
         try:
             if attachment:
-                response = requests.post(
+                response = self._session.post(
                     self.api_url,
                     data=payload,
                     files={"attachment": attachment},
-                    timeout=10
+                    timeout=_TIMEOUT
                 )
             else:
-                response = requests.post(
+                response = self._session.post(
                     self.api_url,
                     data=payload,
-                    timeout=10
+                    timeout=_TIMEOUT
                 )
             
             if response.status_code == 200:
@@ -80,4 +105,25 @@ class PushoverProvider(NotificationProvider):
                 
         except Exception as e:
             log(f"Error sending notification: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def _fetch_image(self, image_url: str) -> Optional[Tuple[str, bytes, str]]:
+        """Returns the attachment for an image URL, downloading it at most once an hour."""
+        now = time.monotonic()
+        with self._image_cache_lock:
+            cached = self._image_cache.get(image_url)
+        if cached is not None and now - cached[0] < IMAGE_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        img_resp = self._session.get(image_url, timeout=5)
+        if img_resp.status_code != 200:
+            return None
+        content_type = img_resp.headers.get("Content-Type", "image/jpeg")
+        attachment = ("image.jpg", img_resp.content, content_type)
+
+        with self._image_cache_lock:
+            self._image_cache.pop(image_url, None)
+            self._image_cache[image_url] = (now, attachment)
+            while len(self._image_cache) > IMAGE_CACHE_MAX_ENTRIES:
+                self._image_cache.popitem(last=False)
+        return attachment
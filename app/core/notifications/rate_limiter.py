@@ -2,7 +2,8 @@
 
 import time
 import threading
-from collections import deque
+from collections import OrderedDict, deque
+from typing import Hashable, Tuple
 
 from ..helpers.logging import log, LOG_STANDARD
 
@@ -66,3 +67,51 @@ class RateLimiter:
         with self._lock:
             self._timestamps.clear()
             self._suppressed_count = 0
+
+
+class DuplicateFilter:
+    """Drops a notification identical to one delivered moments ago.
+
+    A burst of events that all render to the same notification would
+    otherwise reach every provider once per event. Callers check a key with
+    is_duplicate() and record() it only once the notification went out, so
+    a copy that was rate limited or failed is not mistaken for a sent one.
+    Recent keys are kept oldest-first, capped at max_entries.
+    """
+
+    def __init__(self, window_seconds: float = 5, max_entries: int = 256):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._recent: "OrderedDict[Tuple[Hashable, ...], float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_duplicate(self, *key: Hashable) -> bool:
+        """Return True if this key was recorded within the window."""
+        with self._lock:
+            self._prune(time.time())
+            return key in self._recent
+
+    def record(self, *key: Hashable) -> None:
+        """Remember this key as delivered now."""
+        with self._lock:
+            now = time.time()
+            self._prune(now)
+            recent = self._recent
+            recent.pop(key, None)
+            recent[key] = now
+            if len(recent) > self.max_entries:
+                recent.popitem(last=False)
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        recent = self._recent
+        while recent:
+            oldest_key, oldest_at = next(iter(recent.items()))
+            if oldest_at > cutoff:
+                break
+            del recent[oldest_key]
+
+    def reset(self):
+        """Clear all state. Useful for testing or reconfiguration."""
+        with self._lock:
+            self._recent.clear()
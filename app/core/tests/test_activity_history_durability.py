@@ -77,3 +77,176 @@ async def test_clear_activity_history_offloads_legacy_file_truncation(tmp_path):
     assert "cleared" in result["message"].lower()
     assert calls == ["_clear_legacy_history_file"]
     assert json.loads(history_file.read_text(encoding="utf-8")) == []
+
+
+def test_activity_recorder_keeps_newest_entries_up_to_cap(tmp_path):
+    from core.helpers import activity_recorder as recorder
+
+    history_file = tmp_path / "activity_history.json"
+    history_file.write_text(
+        json.dumps([{"id": str(i)} for i in range(recorder.MAX_HISTORY_ENTRIES)]),
+        encoding="utf-8",
+    )
+
+    with patch.object(recorder, "HISTORY_FILE", str(history_file)):
+        assert recorder.record_disk_status(
+            free_space="1 GB",
+            total_space="10 GB",
+            used_space="9 GB",
+            free_percentage=10.0,
+            notification_history={},
+        )
+
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert len(history) == recorder.MAX_HISTORY_ENTRIES
+    assert history[0]["type"] == "disk_alert"
+    assert history[1]["id"] == "0"
+    assert history[-1]["id"] == str(recorder.MAX_HISTORY_ENTRIES - 2)
+
+
+def test_activity_recorder_reuses_cached_history_until_file_changes(tmp_path):
+    from core.helpers import activity_recorder as recorder
+
+    history_file = tmp_path / "activity_history.json"
+    history_file.write_text("[]", encoding="utf-8")
+
+    def record(name):
+        return recorder.record_activity(
+            activity_type="watching_channel",
+            title="Watching TV",
+            message=f"Watching {name}",
+            channel_name=name,
+            notification_history={},
+        )
+
+    with patch.object(recorder, "HISTORY_FILE", str(history_file)):
+        assert record("Channel 1")
+        with patch.object(
+            recorder, "load_history", side_effect=AssertionError("re-parsed")
+        ):
+            assert record("Channel 2")
+
+        history_file.write_text("[]", encoding="utf-8")
+        assert record("Channel 3")
+
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert [item["channel_name"] for item in history] == ["Channel 3"]
+
+
+def test_activity_recorder_keeps_every_concurrent_entry(tmp_path):
+    import threading
+
+    from core.helpers import activity_recorder as recorder
+
+    history_file = tmp_path / "activity_history.json"
+    results = []
+
+    def record(i):
+        results.append(
+            recorder.record_activity(
+                activity_type="watching_channel",
+                title="Watching TV",
+                message=f"Watching {i}",
+                channel_name=f"Channel {i}",
+                notification_history={},
+            )
+        )
+
+    with patch.object(recorder, "HISTORY_FILE", str(history_file)):
+        threads = [threading.Thread(target=record, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert all(results)
+    assert sorted(item["channel_name"] for item in history) == sorted(
+        f"Channel {i}" for i in range(20)
+    )
+
+
+def test_activity_ids_are_unique_and_fit_the_database_column():
+    from core.helpers import activity_recorder as recorder
+
+    ids = {recorder._new_activity_id() for _ in range(1000)}
+
+    assert len(ids) == 1000
+    assert all(len(activity_id) <= 36 for activity_id in ids)
+
+
+def test_activity_recorder_hands_entry_to_the_active_writer(tmp_path):
+    import threading
+
+    from core.helpers import activity_recorder as recorder
+
+    history_file = tmp_path / "activity_history.json"
+    writing = threading.Event()
+    release = threading.Event()
+    real_save = recorder.save_history
+
+    def slow_save(history):
+        writing.set()
+        release.wait(timeout=5)
+        return real_save(history)
+
+    def record(name):
+        return recorder.record_activity(
+            activity_type="watching_channel",
+            title="Watching TV",
+            message=f"Watching {name}",
+            channel_name=name,
+            notification_history={},
+        )
+
+    with (
+        patch.object(recorder, "HISTORY_FILE", str(history_file)),
+        patch.object(recorder, "save_history", side_effect=slow_save),
+    ):
+        writer = threading.Thread(target=record, args=("Channel 1",))
+        writer.start()
+        assert writing.wait(timeout=5)
+
+        assert record("Channel 2")
+        assert writer.is_alive()
+
+        release.set()
+        writer.join(timeout=5)
+
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert [item["channel_name"] for item in history] == ["Channel 2", "Channel 1"]
+
+
+def test_activity_timestamps_are_utc_iso_with_microseconds():
+    from datetime import timedelta
+
+    from core.helpers import activity_recorder as recorder
+
+    before = datetime.now(timezone.utc)
+    first = recorder._utc_now_iso()
+    second = recorder._utc_now_iso()
+    after = datetime.now(timezone.utc)
+
+    parsed_first = datetime.fromisoformat(first)
+    parsed_second = datetime.fromisoformat(second)
+    assert parsed_first.utcoffset() == timedelta(0)
+    assert before - timedelta(milliseconds=1) <= parsed_first <= parsed_second
+    assert parsed_second <= after + timedelta(milliseconds=1)
+
+
+def test_format_scheduled_date_labels_today_tomorrow_and_later():
+    from datetime import timedelta
+
+    from core.helpers import activity_recorder as recorder
+
+    now = datetime.now().replace(hour=20, minute=30, second=0, microsecond=0)
+
+    assert recorder.format_scheduled_date(now) == "Today at 08:30 PM"
+    assert (
+        recorder.format_scheduled_date(now + timedelta(days=1))
+        == "Tomorrow at 08:30 PM"
+    )
+    later = now + timedelta(days=3)
+    assert recorder.format_scheduled_date(later) == (
+        f"{later.strftime('%b %d, %Y')} at 08:30 PM"
+    )
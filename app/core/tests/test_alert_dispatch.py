@@ -0,0 +1,238 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.engine.alert_manager import AlertManager
+from core.helpers.logging import LOG_VERBOSE
+
+
+def _make_dvr(dvr_id="dvr_dispatch01"):
+    return SimpleNamespace(
+        id=dvr_id, name="Test DVR", host="192.168.1.1", port=8089, overrides={}
+    )
+
+
+def _make_alert_class(supported, calls, result=False):
+    class _Alert:
+        SUPPORTED_EVENT_TYPES = supported
+
+        def __init__(self, alert_manager):
+            self.alert_manager = alert_manager
+
+        async def process_event(self, event_type, event_data):
+            calls.append((self, event_type))
+            return result
+
+    return _Alert
+
+
+def _register(manager, alert_type, alert_class):
+    with patch("core.engine.alert_manager.get_alert_class", return_value=alert_class):
+        assert manager.register_alert(alert_type)
+    return manager.alert_instances[alert_type]
+
+
+class TestEventTypeDispatch:
+    @pytest.mark.asyncio
+    async def test_only_subscribed_alerts_receive_event(self):
+        calls = []
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        watching = _register(
+            am, "watching", _make_alert_class(frozenset({"activities.set"}), calls)
+        )
+        _register(am, "jobs", _make_alert_class(frozenset({"jobs.created"}), calls))
+
+        await am.process_event("activities.set", {"Name": "x", "Value": "y"})
+
+        assert calls == [(watching, "activities.set")]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_event_type_skips_all_alerts(self):
+        calls = []
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        _register(am, "disk", _make_alert_class(frozenset(), calls))
+
+        assert await am.process_event("jobs.created", {"Name": "1"}) is None
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_wildcard_alert_receives_every_type_in_registration_order(self):
+        calls = []
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        wildcard = _register(am, "wildcard", _make_alert_class(None, calls))
+        watching = _register(
+            am, "watching", _make_alert_class(frozenset({"activities.set"}), calls)
+        )
+
+        await am.process_event("activities.set", {})
+        await am.process_event("custom.event", {})
+
+        assert calls == [
+            (wildcard, "activities.set"),
+            (watching, "activities.set"),
+            (wildcard, "custom.event"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hello_never_reaches_alerts(self):
+        calls = []
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        _register(am, "wildcard", _make_alert_class(None, calls))
+
+        assert await am.process_event("hello", {}) is None
+        assert calls == []
+
+    def test_builtin_alerts_declare_supported_event_types(self):
+        from core.alerts.channel_watching import ChannelWatchingAlert
+        from core.alerts.disk_space import DiskSpaceAlert
+        from core.alerts.recording_events import RecordingEventsAlert
+        from core.alerts.vod_watching import VODWatchingAlert
+
+        assert ChannelWatchingAlert.SUPPORTED_EVENT_TYPES == {"activities.set"}
+        assert VODWatchingAlert.SUPPORTED_EVENT_TYPES == {"activities.set"}
+        assert DiskSpaceAlert.SUPPORTED_EVENT_TYPES == frozenset()
+        assert RecordingEventsAlert.SUPPORTED_EVENT_TYPES == {
+            "jobs.created",
+            "jobs.deleted",
+            "programs.set",
+        }
+
+
+class TestAlertProcessingErrors:
+    @pytest.mark.asyncio
+    async def test_runtime_error_is_logged_once_per_interval_and_skipped(self):
+        calls = []
+
+        class _Failing:
+            SUPPORTED_EVENT_TYPES = None
+
+            def __init__(self, alert_manager):
+                pass
+
+            async def process_event(self, event_type, event_data):
+                raise KeyError("Value")
+
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        _register(am, "failing", _Failing)
+        healthy = _register(am, "healthy", _make_alert_class(None, calls))
+
+        with patch("core.engine.alert_manager.log") as log:
+            await am.process_event("activities.set", {})
+            await am.process_event("activities.set", {})
+
+        assert calls == [(healthy, "activities.set")] * 2
+        error_logs = [c for c in log.call_args_list if "Error processing" in c.args[0]]
+        assert len(error_logs) == 1
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_does_not_skip_later_alerts(self):
+        calls = []
+
+        class _Broken:
+            SUPPORTED_EVENT_TYPES = None
+
+            def __init__(self, alert_manager):
+                pass
+
+            async def process_event(self, event_type, event_data):
+                raise ZeroDivisionError("bug")
+
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        _register(am, "broken", _Broken)
+        healthy = _register(am, "healthy", _make_alert_class(None, calls, True))
+
+        format_exception = MagicMock(
+            return_value=["Traceback (most recent call last):\n"]
+        )
+        with patch("core.engine.alert_manager.log") as log, patch(
+            "core.engine.alert_manager.traceback.format_exception", format_exception
+        ):
+            assert await am.process_event("activities.set", {}) == "healthy"
+            assert await am.process_event("activities.set", {}) == "healthy"
+
+        assert calls == [(healthy, "activities.set")] * 2
+        format_exception.assert_called_once()
+        messages = [c.args[0] for c in log.call_args_list]
+        assert [m for m in messages if "Unexpected error processing broken" in m] == [
+            "Unexpected error processing broken: ZeroDivisionError: bug"
+        ]
+        tracebacks = [
+            c for c in log.call_args_list if c.args[0].startswith("Traceback")
+        ]
+        assert len(tracebacks) == 1
+        assert tracebacks[0].kwargs["level"] == LOG_VERBOSE
+
+
+class TestBackgroundShutdown:
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_background_loops_without_waiting(self):
+        import asyncio
+
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        am.cleanup_check_interval = 3600
+        am._save_interval = 3600
+        tasks = am.create_background_tasks()
+        await asyncio.sleep(0)
+
+        am.shutdown()
+        done, pending = await asyncio.wait(tasks, timeout=1.0)
+
+        assert not pending
+        assert all(task.exception() is None for task in done)
+
+    @pytest.mark.asyncio
+    async def test_cleanup_loop_runs_cleanup_when_interval_elapsed(self):
+        import asyncio
+
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        am.cleanup_check_interval = 0.01
+        am.cleanup_interval = 0
+        ran = asyncio.Event()
+
+        async def fake_cleanup():
+            ran.set()
+
+        am._run_cleanup = fake_cleanup
+        tasks = am.create_background_tasks()
+        await asyncio.wait_for(ran.wait(), timeout=1.0)
+        am.shutdown()
+        await asyncio.wait(tasks, timeout=1.0)
+
+
+class TestFinalizeRegistration:
+    def test_register_alert_defers_table_build(self):
+        calls = []
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        _register(am, "watching", _make_alert_class(frozenset({"a.b"}), calls))
+
+        assert am._by_type == {}
+
+        am.finalize_registration()
+
+        assert [name for name, _ in am._by_type["a.b"]] == ["watching"]
+
+    @pytest.mark.asyncio
+    async def test_late_registration_is_picked_up_by_process_event(self):
+        calls = []
+        am = AlertManager(MagicMock(), MagicMock(), dvr=_make_dvr())
+        _register(am, "first", _make_alert_class(frozenset({"a.b"}), calls))
+        am.finalize_registration()
+        second = _register(am, "second", _make_alert_class(frozenset({"c.d"}), calls))
+
+        await am.process_event("c.d", {})
+
+        assert calls == [(second, "c.d")]
+
+    def test_initialize_alerts_finalizes_dispatch_table(self):
+        from core.helpers.initialize import initialize_alerts
+
+        settings = MagicMock()
+        settings.alert_channel_watching = False
+        settings.alert_disk_space = False
+        settings.alert_vod_watching = False
+        settings.alert_recording_events = False
+
+        am = initialize_alerts(MagicMock(), settings, test_mode=True, dvr=_make_dvr())
+
+        assert am._dispatch_ready is True
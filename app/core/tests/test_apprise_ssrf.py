@@ -4,6 +4,7 @@ Private-network image URLs must be dropped before notification delivery, and
 logs should report the rejection without exposing the raw private host.
 """
 
+import threading
 from typing import Any, cast
 from unittest.mock import patch, MagicMock
 
@@ -46,7 +47,7 @@ def _ok_response() -> MagicMock:
 
 
 class TestAppriseSSRFImageDrop:
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_private_ip_image_dropped_notification_delivered(
         self, mock_post: MagicMock
     ) -> None:
@@ -64,7 +65,7 @@ class TestAppriseSSRFImageDrop:
         embed = _get_discord_embed(mock_post)
         assert "image" not in embed
 
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_metadata_endpoint_image_dropped(self, mock_post: MagicMock) -> None:
         mock_post.return_value = _ok_response()
 
@@ -80,7 +81,7 @@ class TestAppriseSSRFImageDrop:
         embed = _get_discord_embed(mock_post)
         assert "image" not in embed
 
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_localhost_image_dropped(self, mock_post: MagicMock) -> None:
         mock_post.return_value = _ok_response()
 
@@ -98,7 +99,7 @@ class TestAppriseSSRFImageDrop:
 
 
 class TestAppriseSSRFRegression:
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_public_image_delivered_unchanged(self, mock_post: MagicMock) -> None:
         mock_post.return_value = _ok_response()
 
@@ -128,7 +129,7 @@ class TestAppriseSSRFRegression:
         assert "image" in embed
         assert embed["image"]["url"] == public_url
 
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_discord_image_dropped_when_delivery_revalidation_fails(
         self, mock_post: MagicMock
     ) -> None:
@@ -332,7 +333,7 @@ class TestAppriseSSRFRegression:
 
 
 class TestAppriseSSRFLogging:
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_log_message_redacts_and_includes_reason(
         self,
         mock_post: MagicMock,
@@ -356,7 +357,7 @@ class TestAppriseSSRFLogging:
         assert "is_safe_url" in ssrf_log
         assert "192.168.1.1" not in ssrf_log
 
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_discord_request_error_does_not_log_webhook_token(
         self,
         mock_post: MagicMock,
@@ -463,7 +464,7 @@ class TestAppriseDeliverySuccessSemantics:
         fake_apprise.add.assert_called_once_with("pover://abc")
         fake_apprise.notify.assert_called_once()
 
-    @patch("httpx.post")
+    @patch("httpx.Client.post")
     def test_mixed_destinations_succeed_when_one_attempt_succeeds(
         self, mock_post: MagicMock
     ) -> None:
@@ -485,3 +486,347 @@ class TestAppriseDeliverySuccessSemantics:
         assert result is True
         assert mock_post.called
         fake_apprise.notify.assert_called_once()
+
+
+class TestAppriseModuleCache:
+    def test_apprise_is_imported_once_per_provider(self) -> None:
+        provider = _make_provider([("pushover", "pover://abc")])
+        apprise_mod = MagicMock()
+        apprise_mod.Apprise.return_value.notify.return_value = True
+
+        with patch("importlib.import_module", return_value=apprise_mod) as importer:
+            assert provider.send_notification("One", "Body") is True
+            assert provider.send_notification("Two", "Body") is True
+
+        importer.assert_called_once_with("apprise")
+        notify_kwargs = apprise_mod.Apprise.return_value.notify.call_args.kwargs
+        assert notify_kwargs["body_format"] is apprise_mod.NotifyFormat.HTML
+
+    def test_apprise_instance_is_reused_for_the_same_destinations(self) -> None:
+        provider = _make_provider([("pushover", "pover://abc")])
+        apprise_mod = MagicMock()
+        apprise_mod.Apprise.return_value.notify.return_value = True
+
+        with patch("importlib.import_module", return_value=apprise_mod):
+            assert provider.send_notification("One", "Body") is True
+            assert provider.send_notification("Two", "Body") is True
+
+        apprise_mod.Apprise.assert_called_once_with()
+        apprise_mod.Apprise.return_value.add.assert_called_once_with("pover://abc")
+        assert apprise_mod.Apprise.return_value.notify.call_count == 2
+
+    def test_shared_apprise_instance_is_not_notified_concurrently(self) -> None:
+        import time
+
+        provider = _make_provider([("pushover", "pover://abc")])
+        apprise_mod = MagicMock()
+        active = []
+        overlaps = []
+
+        def notify(**kwargs):
+            active.append(1)
+            overlaps.append(len(active) > 1)
+            time.sleep(0.01)
+            active.pop()
+            return True
+
+        apprise_mod.Apprise.return_value.notify.side_effect = notify
+
+        with patch("importlib.import_module", return_value=apprise_mod):
+            threads = [
+                threading.Thread(
+                    target=provider.send_notification, args=(str(i), "Body")
+                )
+                for i in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        apprise_mod.Apprise.assert_called_once_with()
+        assert overlaps == [False] * 4
+
+
+class TestDiscordWebhookParsing:
+    def test_webhook_url_is_built_from_id_and_token(self) -> None:
+        from core.notifications.providers.apprise import _discord_webhook_url
+
+        assert (
+            _discord_webhook_url("discord://123/abc/def")
+            == "https://discord.com/api/webhooks/123/abc/def"
+        )
+        assert _discord_webhook_url("discord://123") is None
+
+    @patch("httpx.Client.post")
+    def test_embed_is_built_once_for_all_webhooks(
+        self, mock_post: MagicMock
+    ) -> None:
+        mock_post.return_value = _ok_response()
+        provider = _make_provider(
+            [("discord", "discord://1/a"), ("custom", "discord://2/b")]
+        )
+
+        with patch(
+            "core.notifications.providers.apprise.is_safe_url", return_value=True
+        ) as safe:
+            assert provider.send_notification(
+                "Title", "Body", image_url="https://cdn.example.com/a.png"
+            )
+
+        assert sorted(c.args[0] for c in mock_post.call_args_list) == [
+            "https://discord.com/api/webhooks/1/a",
+            "https://discord.com/api/webhooks/2/b",
+        ]
+        payloads = [c.kwargs["json"] for c in mock_post.call_args_list]
+        assert payloads[0]["embeds"][0] is payloads[1]["embeds"][0]
+        assert payloads[0]["username"] == "ChannelWatch Bot"
+        assert safe.call_count == 2
+
+    def test_discord_posts_share_one_keep_alive_client(self) -> None:
+        from core.notifications.providers.apprise import _discord_client
+
+        client = _discord_client()
+        assert _discord_client() is client
+        assert client.timeout.connect == 3.05
+
+    @patch("httpx.Client.post")
+    def test_webhooks_are_posted_concurrently(self, mock_post: MagicMock) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def post(url, json):
+            barrier.wait()
+            return _ok_response()
+
+        mock_post.side_effect = post
+        provider = _make_provider(
+            [("discord", "discord://1/a"), ("custom", "discord://2/b")]
+        )
+
+        assert provider.send_notification("Title", "Body") is True
+        assert mock_post.call_count == 2
+
+    @patch("httpx.Client.post")
+    def test_one_failed_webhook_does_not_fail_the_others(
+        self, mock_post: MagicMock
+    ) -> None:
+        failed = MagicMock(status_code=500, text="boom")
+        mock_post.side_effect = lambda url, json: (
+            failed if url.endswith("/1/a") else _ok_response()
+        )
+        provider = _make_provider(
+            [("discord", "discord://1/a"), ("custom", "discord://2/b")]
+        )
+
+        assert provider.send_notification("Title", "Body") is True
+
+
+class TestDiscordBatching:
+    @patch("httpx.Client.post")
+    def test_embeds_queued_behind_an_inflight_post_share_one_request(
+        self, mock_post: MagicMock
+    ) -> None:
+        from core.notifications.providers.apprise import _DiscordBatcher
+
+        first_posted = threading.Event()
+        release = threading.Event()
+
+        def post(url, json):
+            if not first_posted.is_set():
+                first_posted.set()
+                release.wait(5)
+            return _ok_response()
+
+        mock_post.side_effect = post
+        batcher = _DiscordBatcher("https://discord.com/api/webhooks/9/z")
+        results: list = []
+
+        def send(name):
+            results.append(batcher.send({"title": name, "description": ""}))
+
+        leader = threading.Thread(target=send, args=("a",))
+        leader.start()
+        assert first_posted.wait(5)
+        followers = [threading.Thread(target=send, args=(n,)) for n in ("b", "c")]
+        for t in followers:
+            t.start()
+        while len(batcher._pending) < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(5)
+
+        assert results == [True, True, True]
+        embeds = [c.kwargs["json"]["embeds"] for c in mock_post.call_args_list]
+        assert len(embeds) == 2
+        assert sorted(e["title"] for e in embeds[1]) == ["b", "c"]
+
+    def test_batches_respect_discord_message_limits(self) -> None:
+        from core.notifications.providers.apprise import (
+            _DiscordBatcher,
+            _PendingEmbed,
+        )
+
+        batcher = _DiscordBatcher("https://discord.com/api/webhooks/9/z")
+        batcher._pending = [
+            _PendingEmbed({"title": "t", "description": "x" * 2500}) for _ in range(3)
+        ] + [_PendingEmbed({"title": "t", "description": ""}) for _ in range(12)]
+
+        sizes = []
+        while batch := batcher._next_batch():
+            sizes.append(len(batch))
+
+        assert sizes == [2, 10, 3]
+
+    @patch("httpx.Client.post")
+    def test_leader_returns_once_its_own_embed_is_sent(
+        self, mock_post: MagicMock
+    ) -> None:
+        from core.notifications.providers.apprise import _DiscordBatcher
+
+        posted = [threading.Event(), threading.Event()]
+        releases = [threading.Event(), threading.Event()]
+
+        def post(url, json):
+            index = mock_post.call_count - 1
+            posted[index].set()
+            releases[index].wait(5)
+            return _ok_response()
+
+        mock_post.side_effect = post
+        batcher = _DiscordBatcher("https://discord.com/api/webhooks/9/z")
+        results: dict = {}
+
+        def send(name):
+            results[name] = batcher.send({"title": name, "description": ""})
+
+        leader = threading.Thread(target=send, args=("a",))
+        leader.start()
+        assert posted[0].wait(5)
+        follower = threading.Thread(target=send, args=("b",))
+        follower.start()
+        while not batcher._pending:
+            threading.Event().wait(0.01)
+        releases[0].set()
+
+        assert posted[1].wait(5)
+        leader.join(5)
+        assert not leader.is_alive()
+        assert results == {"a": True}
+
+        releases[1].set()
+        follower.join(5)
+        assert results == {"a": True, "b": True}
+        assert batcher._busy is False
+
+    @patch("httpx.Client.post")
+    def test_rejected_batch_is_resent_one_embed_at_a_time(
+        self, mock_post: MagicMock
+    ) -> None:
+        from core.notifications.providers.apprise import (
+            _DiscordBatcher,
+            _PendingEmbed,
+        )
+
+        def post(url, json):
+            titles = [embed["title"] for embed in json["embeds"]]
+            response = _ok_response()
+            if "bad" in titles:
+                response.status_code = 400
+            return response
+
+        mock_post.side_effect = post
+        batcher = _DiscordBatcher("https://discord.com/api/webhooks/9/z")
+        good = _PendingEmbed({"title": "good", "description": ""})
+        bad = _PendingEmbed({"title": "bad", "description": ""})
+        batcher._pending = [good, bad]
+        batcher._busy = True
+
+        batcher._drain()
+
+        assert (good.ok, bad.ok) == (True, False)
+        assert good.done.is_set() and bad.done.is_set()
+        assert mock_post.call_count == 3
+        assert batcher._busy is False
+
+
+class TestCollectUrlEntries:
+    @staticmethod
+    def _entries(**values: str) -> list:
+        fields = {attr: "" for attr in AppriseProvider.SERVICE_MAP}
+        fields["apprise_email_to"] = ""
+        fields.update(values)
+        provider = AppriseProvider()
+        provider.settings = cast(Any, type("Settings", (), fields)())
+        return provider._collect_url_entries_from_settings()
+
+    @pytest.mark.parametrize(
+        "webhook",
+        [
+            "https://discord.com/api/webhooks/123/tok?wait=true",
+            "https://discordapp.com/api/webhooks/123/tok",
+        ],
+    )
+    def test_discord_webhook_url_becomes_discord_scheme(self, webhook: str) -> None:
+        assert self._entries(apprise_discord=webhook) == [
+            ("discord", "discord://123/tok")
+        ]
+
+    def test_discord_webhook_without_token_is_passed_through(self) -> None:
+        webhook = "https://discord.com/api/webhooks/123"
+        assert self._entries(apprise_discord=webhook) == [
+            ("discord", f"discord://{webhook}")
+        ]
+
+    def test_email_parameters_become_mailtos_url(self) -> None:
+        assert self._entries(apprise_email="smtp=mail.example.com&user=me") == [
+            ("email", "mailtos://_?smtp=mail.example.com&user=me&from=ChannelWatch")
+        ]
+
+    def test_plain_email_address_keeps_mailto_template(self) -> None:
+        assert self._entries(apprise_email="me:pw@example.com") == [
+            ("email", "mailto://me:pw@example.com?from=ChannelWatch")
+        ]
+
+
+class TestConcurrentServices:
+    @patch("httpx.Client.post")
+    def test_discord_and_other_services_are_delivered_concurrently(
+        self, mock_post: MagicMock
+    ) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def post(url, json):
+            barrier.wait()
+            return _ok_response()
+
+        def notify(**kwargs):
+            barrier.wait()
+            return True
+
+        mock_post.side_effect = post
+        apprise_mod = MagicMock()
+        apprise_mod.Apprise.return_value.notify.side_effect = notify
+        provider = _make_provider(
+            [("discord", "discord://1/a"), ("pushover", "pover://abc")]
+        )
+
+        with patch("importlib.import_module", return_value=apprise_mod):
+            assert provider.send_notification("Title", "Body") is True
+
+        assert mock_post.call_count == 1
+        apprise_mod.Apprise.return_value.notify.assert_called_once()
+
+    @patch("httpx.Client.post")
+    def test_other_services_failure_does_not_hide_discord_success(
+        self, mock_post: MagicMock
+    ) -> None:
+        mock_post.return_value = _ok_response()
+        apprise_mod = MagicMock()
+        apprise_mod.Apprise.return_value.notify.side_effect = RuntimeError("down")
+        provider = _make_provider(
+            [("discord", "discord://1/a"), ("pushover", "pover://abc")]
+        )
+
+        with patch("importlib.import_module", return_value=apprise_mod):
+            assert provider.send_notification("Title", "Body") is True
@@ -0,0 +1,64 @@
+"""Tests for ChannelInfoProvider caching."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from core.helpers.channel_info import ChannelInfoProvider
+
+
+def _channels_response(channels):
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps(channels).encode()
+    return response
+
+
+class TestGetChannelInfo:
+    def test_cached_channel_is_served_without_refresh(self):
+        provider = ChannelInfoProvider("127.0.0.1", 8089)
+        provider.channel_cache = {"5": {"name": "KTVU", "logo_url": ""}}
+
+        with patch.object(provider, "cache_channels") as refresh:
+            assert provider.get_channel_name("5") == "KTVU"
+
+        refresh.assert_not_called()
+
+    def test_miss_fetches_once_and_serves_from_cache(self):
+        provider = ChannelInfoProvider("127.0.0.1", 8089)
+        response = _channels_response(
+            [{"number": "7", "name": "KGO", "logo_url": "http://logo/7.png"}]
+        )
+
+        provider._client = MagicMock()
+        provider._client.get.return_value = response
+
+        assert provider.get_channel_name("7") == "KGO"
+        assert provider.get_channel_logo_url("7") == "http://logo/7.png"
+        assert provider._client.get.call_count == 1
+
+    def test_uses_the_shared_client_for_its_dvr(self):
+        from core.helpers.http_pool import get_client
+
+        provider = ChannelInfoProvider("127.0.0.1", 8089)
+
+        assert provider._client is get_client("127.0.0.1", 8089)
+
+
+class TestCacheChannels:
+    def test_cache_keeps_only_name_and_logo(self):
+        provider = ChannelInfoProvider("127.0.0.1", 8089)
+        response = _channels_response(
+            [
+                {"number": "9", "name": "", "image_url": "http://img/9.png", "x": 1},
+                {"number": "", "name": "No Number"},
+            ]
+        )
+
+        provider._client = MagicMock()
+        provider._client.get.return_value = response
+
+        assert provider.cache_channels() == 1
+
+        assert provider.channel_cache == {
+            "9": {"name": "Unknown Channel", "logo_url": "http://img/9.png"}
+        }
@@ -0,0 +1,172 @@
+"""Tests for the DVR endpoint circuit breaker."""
+
+import httpx
+import pytest
+
+from core.helpers import circuit as circuit_module
+from core.helpers.circuit import Circuit, circuit_get
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(circuit_module.time, "monotonic", clock)
+    return clock
+
+
+def _trip(circuit):
+    for _ in range(Circuit.FAILURE_THRESHOLD):
+        circuit.record_failure()
+
+
+class TestCircuit:
+    def test_opens_after_threshold_failures_in_window(self, clock):
+        circuit = Circuit("jobs")
+
+        for _ in range(Circuit.FAILURE_THRESHOLD - 1):
+            assert circuit.record_failure() is False
+        assert circuit.allow()
+        assert circuit.record_failure() is True
+
+        assert circuit.is_open
+        assert not circuit.allow()
+
+    def test_failures_outside_window_do_not_accumulate(self, clock):
+        circuit = Circuit("jobs")
+
+        for _ in range(Circuit.FAILURE_THRESHOLD - 1):
+            circuit.record_failure()
+        clock.now += Circuit.FAILURE_WINDOW_SECONDS + 1
+        circuit.record_failure()
+
+        assert not circuit.is_open
+
+    def test_half_open_allows_limited_probes_then_success_closes(self, clock):
+        circuit = Circuit("guide")
+        _trip(circuit)
+        clock.now += Circuit.OPEN_DURATION_SECONDS
+
+        probes = [circuit.allow() for _ in range(Circuit.HALF_OPEN_PROBES + 1)]
+        assert probes == [True] * Circuit.HALF_OPEN_PROBES + [False]
+
+        circuit.record_success()
+        assert not circuit.is_open
+        assert circuit.allow()
+
+    def test_failed_probe_reopens_for_full_duration(self, clock):
+        circuit = Circuit("guide")
+        _trip(circuit)
+        clock.now += Circuit.OPEN_DURATION_SECONDS
+        assert circuit.allow()
+
+        circuit.record_failure()
+        clock.now += Circuit.OPEN_DURATION_SECONDS - 1
+
+        assert not circuit.allow()
+
+
+class _Client:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(circuit_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+class TestCircuitGet:
+    def test_transport_errors_and_server_errors_count_as_failures(self, clock, sleeps):
+        circuit = Circuit("recordings")
+        error = httpx.ConnectError("refused")
+
+        with pytest.raises(httpx.ConnectError):
+            circuit_get(circuit, _Client(error), "http://dvr/api", timeout=1)
+        for _ in range(Circuit.FAILURE_THRESHOLD - 1):
+            circuit_get(
+                circuit, _Client(httpx.Response(503)), "http://dvr/api", timeout=1
+            )
+
+        assert circuit.is_open
+
+    def test_client_errors_close_the_circuit(self, clock):
+        circuit = Circuit("recordings")
+        circuit.record_failure()
+
+        circuit_get(circuit, _Client(httpx.Response(404)), "http://dvr/api", timeout=1)
+
+        for _ in range(Circuit.FAILURE_THRESHOLD - 1):
+            circuit.record_failure()
+        assert not circuit.is_open
+
+    def test_transient_failures_are_retried_with_growing_backoff(
+        self, clock, sleeps, monkeypatch
+    ):
+        monkeypatch.setattr(circuit_module.random, "uniform", lambda low, high: high)
+        circuit = Circuit("jobs")
+        client = _Client(
+            httpx.ConnectError("reset"), httpx.Response(503), httpx.Response(200)
+        )
+
+        response = circuit_get(circuit, client, "http://dvr/api", timeout=5)
+
+        assert response.status_code == 200
+        assert client.calls == 3
+        assert sleeps == [
+            circuit_module.RETRY_BACKOFF_SECONDS,
+            circuit_module.RETRY_BACKOFF_SECONDS * 2,
+        ]
+        assert circuit._failures == 0
+
+    def test_exhausted_retries_count_as_one_failure(self, clock, sleeps):
+        circuit = Circuit("jobs")
+        client = _Client(httpx.Response(502))
+
+        response = circuit_get(circuit, client, "http://dvr/api", timeout=5)
+
+        assert response.status_code == 502
+        assert client.calls == circuit_module.RETRY_ATTEMPTS
+        assert circuit._failures == 1
+
+    def test_timeouts_and_plain_server_errors_are_not_retried(self, clock, sleeps):
+        circuit = Circuit("guide")
+
+        with pytest.raises(httpx.ReadTimeout):
+            circuit_get(
+                circuit, _Client(httpx.ReadTimeout("slow")), "http://dvr", timeout=5
+            )
+        client = _Client(httpx.Response(500))
+        circuit_get(circuit, client, "http://dvr", timeout=5)
+
+        assert client.calls == 1
+        assert sleeps == []
+
+    def test_retry_after_beyond_the_timeout_budget_is_not_waited_out(
+        self, clock, sleeps
+    ):
+        circuit = Circuit("guide")
+        client = _Client(httpx.Response(503, headers={"Retry-After": "120"}))
+
+        response = circuit_get(circuit, client, "http://dvr", timeout=30)
+
+        assert response.status_code == 503
+        assert client.calls == 1
+        assert sleeps == []
@@ -113,6 +113,36 @@ def test_core_settings_preserves_persisted_rbac_enabled(tmp_path):
     assert persisted["rbac_enabled"] is True
 
 
+def test_core_settings_ignores_unknown_persisted_keys(tmp_path):
+    from dataclasses import fields
+
+    from core.helpers.config import CoreSettings
+
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(
+        json.dumps(
+            {
+                "_version": CURRENT_SCHEMA_VERSION,
+                "tz": "UTC",
+                "dvr_servers": [],
+                "not_a_setting": "ignored",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    with (
+        patch("core.helpers.config.CONFIG_FILE", settings_file),
+        patch("core.helpers.config.CONFIG_DIR", tmp_path),
+    ):
+        CoreSettings._instance = None
+        settings = CoreSettings()
+
+    assert CoreSettings._FIELD_NAMES == {f.name for f in fields(CoreSettings)}
+    assert settings.tz == "UTC"
+    assert not hasattr(settings, "not_a_setting")
+
+
 def test_core_settings_skips_malformed_dvr_server_entries(tmp_path):
     from core.helpers.config import CoreSettings
 
@@ -428,3 +458,42 @@ def test_db_migration_integrity_failure_does_not_swap_existing_db(tmp_path):
 
     assert [row.id for row in rows] == ["existing-row"]
     assert not (tmp_path / "channelwatch.db.new").exists()
+
+
+def test_core_settings_get_survives_reset_after_fast_path_check():
+    from core.helpers.config import CoreSettings
+
+    sentinel = object()
+    reads = []
+
+    class _ResetAfterFirstRead:
+        @property
+        def _instance(self):
+            reads.append(1)
+            return sentinel if len(reads) == 1 else None
+
+    assert CoreSettings.get.__func__(_ResetAfterFirstRead()) is sentinel
+
+
+def test_core_settings_copy_accepts_per_dvr_overrides(tmp_path):
+    from copy import copy
+
+    from core.helpers.config import CoreSettings
+
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(
+        json.dumps({"_version": CURRENT_SCHEMA_VERSION, "tz": "UTC"}),
+        encoding="utf-8",
+    )
+    with (
+        patch("core.helpers.config.CONFIG_FILE", settings_file),
+        patch("core.helpers.config.CONFIG_DIR", tmp_path),
+    ):
+        settings = CoreSettings()
+
+    dvr_settings = copy(settings)
+    dvr_settings.tz = "America/New_York"
+
+    assert settings.tz == "UTC"
+    assert dvr_settings.tz == "America/New_York"
+    assert not hasattr(settings, "__dict__")
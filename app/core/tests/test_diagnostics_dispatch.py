@@ -0,0 +1,72 @@
+"""Tests for routing diagnostic names to their test functions."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import core.diagnostics as diagnostics
+
+_APP_DIR = Path(__file__).resolve().parents[2]
+
+
+class TestRunTest:
+    def test_server_tests_receive_host_port_and_duration(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            diagnostics, "test_connectivity", lambda h, p: calls.append((h, p)) or True
+        )
+        monkeypatch.setattr(
+            diagnostics,
+            "test_event_stream",
+            lambda h, p, d: calls.append((h, p, d)) or True,
+        )
+
+        assert diagnostics.run_test("connectivity", "dvr", 8089) is True
+        assert diagnostics.run_test("event_stream", "dvr", 8089, duration=5) is True
+        assert calls == [("dvr", 8089), ("dvr", 8089, 5)]
+
+    def test_alert_aliases_share_one_test(self, monkeypatch):
+        alert_test = MagicMock(return_value=True)
+        manager = object()
+        monkeypatch.setattr(diagnostics, "test_disk_space_alert", alert_test)
+
+        assert diagnostics.run_test("Disk-Space", "dvr", 8089, manager) is True
+        assert diagnostics.run_test("ALERT_DISK_SPACE", "dvr", 8089, manager) is True
+        assert alert_test.call_count == 2
+        alert_test.assert_called_with("dvr", 8089, manager)
+
+    def test_alert_test_without_manager_fails(self):
+        assert diagnostics.run_test("Disk-Space", "dvr", 8089) is False
+
+    def test_unknown_test_fails(self):
+        assert diagnostics.run_test("nope", "dvr", 8089, object()) is False
+
+
+class TestLazyImports:
+    def test_importing_the_package_does_not_load_test_modules(self):
+        code = (
+            "import sys, core.diagnostics as d; "
+            "print('core.diagnostics.connectivity.server' in sys.modules, "
+            "'core.diagnostics.alerts' in sys.modules, "
+            "d.test_connectivity.__module__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=_APP_DIR,
+        )
+
+        assert result.stdout.split() == [
+            "False",
+            "False",
+            "core.diagnostics.connectivity.server",
+        ]
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            diagnostics.not_a_test
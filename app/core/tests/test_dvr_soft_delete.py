@@ -150,6 +150,21 @@ class TestHardDelete:
         remaining = json.loads(hf.read_text())
         assert len(remaining) == 2
 
+    def test_failed_history_rewrite_leaves_original_file(self, tmp_path):
+        history = [
+            {"id": "e1", "dvr_id": "dvr_aaa11111"},
+            {"id": "e2", "dvr_id": "dvr_bbb22222"},
+        ]
+        hf = _history_file(tmp_path, history)
+        servers = [_dvr("dvr_aaa11111")]
+
+        with patch(
+            "core.helpers.atomic_io.os.replace", side_effect=OSError("disk full")
+        ):
+            hard_delete_dvr(tmp_path, servers, "dvr_aaa11111")
+
+        assert json.loads(hf.read_text()) == history
+
     def test_missing_dvr_returns_false(self, tmp_path):
         servers = [_dvr()]
         assert hard_delete_dvr(tmp_path, servers, "dvr_zzz99999") is False
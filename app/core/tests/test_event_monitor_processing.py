@@ -0,0 +1,287 @@
+"""Tests for EventMonitor line parsing, counters, and alert dispatch."""
+
+import pytest
+
+from core.helpers.initialize import initialize_event_monitor  # noqa: F401 — pre-initializes core.helpers to break circular import chain
+from core.engine.event_monitor import EventMonitor
+
+
+class _RecordingAlertManager:
+    def __init__(self, result=None):
+        self.alert_instances = {}
+        self.result = result
+        self.events = []
+
+    async def process_event(self, event_type, event_data):
+        self.events.append((event_type, event_data))
+        return self.result
+
+
+def _make_monitor(result=None):
+    monitor = EventMonitor(
+        host="127.0.0.1", alert_manager=_RecordingAlertManager(result)
+    )
+    monitor.running = True
+    return monitor
+
+
+class TestEventCounters:
+    @pytest.mark.asyncio
+    async def test_plain_json_line_counts_once(self):
+        monitor = _make_monitor()
+
+        await monitor._process_event_line('{"Type": "activities.set", "Name": "a"}')
+
+        assert monitor.stats["total_events"] == 1
+        assert monitor.stats["filtered_events"] == 1
+        assert monitor.alert_manager.events == [
+            ("activities.set", {"Type": "activities.set", "Name": "a"})
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sse_data_line_counts_once(self):
+        monitor = _make_monitor(result="Channel-Watching")
+
+        await monitor._process_event_line('data: {"Type": "jobs.created", "Name": "1"}')
+
+        assert monitor.stats["total_events"] == 1
+        assert monitor.stats["alert_events"] == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_line_is_not_counted(self):
+        monitor = _make_monitor()
+
+        await monitor._process_event_line("data: {not json")
+        await monitor._process_event_line("retry: 1000")
+
+        assert monitor.stats["total_events"] == 0
+        assert monitor.alert_manager.events == []
+
+    @pytest.mark.asyncio
+    async def test_hello_is_counted_as_filtered_but_not_dispatched(self):
+        monitor = _make_monitor()
+
+        await monitor._process_event_line('{"Type": "hello"}')
+
+        assert monitor.stats["total_events"] == 1
+        assert monitor.stats["filtered_events"] == 1
+        assert monitor.alert_manager.events == []
+
+    @pytest.mark.asyncio
+    async def test_total_events_equals_sum_of_outcomes(self):
+        monitor = _make_monitor()
+
+        async def process_event(event_type, event_data):
+            if event_data.get("Name") == "boom":
+                raise RuntimeError("alert bug")
+            return "Channel-Watching" if event_data.get("Name") == "hit" else None
+
+        monitor.alert_manager.process_event = process_event
+        for line in (
+            '{"Type": "hello"}',
+            'data: {"Type": "activities.set", "Name": "hit"}',
+            '{"Type": "activities.set", "Name": "miss"}',
+            '{"Type": "activities.set", "Name": "boom"}',
+            "data: {broken",
+        ):
+            await monitor._process_event_line(line)
+
+        stats = monitor.stats
+        assert stats["total_events"] == 4
+        assert stats["total_events"] == (
+            stats["alert_events"]
+            + stats["filtered_events"]
+            + stats["error_events"]
+            + stats["dropped_events"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_sse_data_line_decodes_payload_once(self, monkeypatch):
+        import core.engine.event_monitor as event_monitor_module
+
+        calls = []
+        real_loads = event_monitor_module.json_loads
+
+        def counting_loads(payload):
+            calls.append(payload)
+            return real_loads(payload)
+
+        monkeypatch.setattr(event_monitor_module, "json_loads", counting_loads)
+        monitor = _make_monitor()
+
+        await monitor._process_event_line('data: {"Type": "jobs.created"}')
+
+        assert calls == ['{"Type": "jobs.created"}']
+
+
+class TestDispatchQueue:
+    @pytest.mark.asyncio
+    async def test_events_are_queued_and_dispatched_in_order(self):
+        import asyncio
+
+        monitor = _make_monitor()
+        queue = asyncio.Queue(maxsize=10)
+        monitor._dispatch_queue = queue
+        task = asyncio.create_task(monitor._async_dispatch_loop(queue))
+
+        await monitor._process_event_line('{"Type": "activities.set", "Name": "1"}')
+        await monitor._process_event_line('{"Type": "activities.set", "Name": "2"}')
+        assert monitor.alert_manager.events == []
+
+        await monitor._stop_dispatcher(queue, task)
+
+        assert [data["Name"] for _, data in monitor.alert_manager.events] == [
+            "1",
+            "2",
+        ]
+        assert monitor._dispatch_queue is None
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts_events(self):
+        import asyncio
+
+        monitor = _make_monitor()
+        monitor._dispatch_queue = asyncio.Queue(maxsize=1)
+
+        await monitor._process_event_line('{"Type": "jobs.created", "Name": "1"}')
+        await monitor._process_event_line('{"Type": "jobs.created", "Name": "2"}')
+
+        assert monitor.stats["total_events"] == 2
+        assert monitor.stats["dropped_events"] == 1
+        assert monitor._dispatch_queue.qsize() == 1
+
+
+class TestVerboseGate:
+    def test_verbose_flag_is_refreshed_when_monitoring_starts(self, monkeypatch):
+        import core.engine.event_monitor as event_monitor_module
+
+        monkeypatch.setattr(event_monitor_module, "is_verbose", lambda: False)
+        monitor = EventMonitor(host="127.0.0.1")
+        assert monitor._verbose is False
+
+        monkeypatch.setattr(event_monitor_module, "is_verbose", lambda: True)
+        monitor._monitor_events_loop = lambda: None
+        monitor.start_monitoring()
+
+        assert monitor._verbose is True
+
+    @pytest.mark.asyncio
+    async def test_verbose_logs_alert_types_and_samples_the_rest(self, monkeypatch):
+        import core.engine.event_monitor as event_monitor_module
+
+        logged = []
+        monkeypatch.setattr(
+            event_monitor_module, "log", lambda msg, *a, **k: logged.append(msg)
+        )
+        monitor = _make_monitor()
+        monitor._verbose = True
+        monitor._verbose_sample_n = 3
+
+        for _ in range(6):
+            await monitor._process_event_line('{"Type": "devices.updated"}')
+        await monitor._process_event_line('{"Type": "jobs.created", "Name": "1"}')
+
+        event_logs = [m for m in logged if m.startswith("Event: ")]
+        assert event_logs == [
+            'Event: {"Type": "devices.updated"}',
+            'Event: {"Type": "devices.updated"}',
+            'Event: {"Type": "jobs.created", "Name": "1"}',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_standard_level_logs_no_events(self, monkeypatch):
+        import core.engine.event_monitor as event_monitor_module
+
+        logged = []
+        monkeypatch.setattr(
+            event_monitor_module, "log", lambda msg, *a, **k: logged.append(msg)
+        )
+        monitor = _make_monitor()
+        monitor._verbose = False
+
+        await monitor._process_event_line('{"Type": "jobs.created", "Name": "1"}')
+
+        assert not [m for m in logged if m.startswith("Event: ")]
+
+
+class TestWatchdogFreshness:
+    def test_event_freshness_is_pushed_to_watchdog_at_most_once_per_interval(self):
+        from unittest.mock import MagicMock
+
+        monitor = _make_monitor()
+        monitor.watchdog = MagicMock()
+
+        monitor._mark_fresh("event")
+        monitor._mark_fresh("event")
+        monitor._mark_fresh("event")
+
+        assert monitor.watchdog.mark_fresh.call_count == 1
+        assert monitor.last_event_at > 0
+
+    def test_poll_freshness_is_always_pushed(self):
+        from unittest.mock import MagicMock
+
+        monitor = _make_monitor()
+        monitor.watchdog = MagicMock()
+
+        monitor._mark_fresh("event")
+        monitor._mark_fresh("poll")
+
+        assert monitor.watchdog.mark_fresh.call_count == 2
+
+
+class TestEventTypeInterning:
+    @pytest.mark.asyncio
+    async def test_dispatched_event_type_is_the_interned_constant(self):
+        from core.helpers.event_types import ACTIVITIES_SET
+
+        monitor = _make_monitor()
+        line = '{"Type": "activities.' + 'set"}'
+
+        await monitor._process_event_line(line)
+
+        event_type, _ = monitor.alert_manager.events[0]
+        assert event_type is ACTIVITIES_SET
+
+    def test_intern_event_type_passes_through_non_strings(self):
+        from core.helpers.event_types import intern_event_type
+
+        assert intern_event_type(None) is None
+        assert intern_event_type(5) == 5
+
+
+class TestTypedDispatch:
+    @pytest.mark.asyncio
+    async def test_queue_carries_event_type_with_payload(self):
+        import asyncio
+
+        from core.helpers.event_types import JOBS_CREATED
+
+        monitor = _make_monitor()
+        monitor._dispatch_queue = asyncio.Queue(maxsize=4)
+
+        await monitor._process_event_line('{"Type": "jobs.created", "Name": "1"}')
+        await monitor._process_event_line('{"Type": "hello"}')
+
+        assert monitor._dispatch_queue.qsize() == 1
+        event_type, data = monitor._dispatch_queue.get_nowait()
+        assert event_type is JOBS_CREATED
+        assert data == {"Type": "jobs.created", "Name": "1"}
+
+    @pytest.mark.asyncio
+    async def test_process_event_routes_on_given_type_without_reading_dict(self):
+        monitor = _make_monitor()
+
+        await monitor._process_event("programs.set", {"Name": "x"})
+
+        assert monitor.alert_manager.events == [("programs.set", {"Name": "x"})]
+
+    @pytest.mark.asyncio
+    async def test_non_object_payload_counts_as_error(self):
+        monitor = _make_monitor()
+
+        await monitor._process_event_line("[1, 2]")
+
+        assert monitor.stats["total_events"] == 1
+        assert monitor.stats["error_events"] == 1
+        assert monitor.alert_manager.events == []
@@ -12,10 +12,12 @@ global setting changes, _stop_dvr_task, and the file-change watcher.
 import asyncio
 import json
 import os
-import select
+import queue
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -49,6 +51,30 @@ def _settings(*dvrs, **extra):
     return base
 
 
+def _read_output(proc):
+    """Queue proc's stdout lines from a helper thread.
+
+    select() on the pipe misses lines already pulled into the text wrapper's
+    buffer by an earlier readline(), so lines are read on a thread instead.
+    """
+    lines = queue.Queue()
+    threading.Thread(
+        target=lambda: [lines.put(line) for line in proc.stdout], daemon=True
+    ).start()
+    return lines
+
+
+def _wait_for_line(lines, text, timeout=5.0):
+    deadline = time.time() + timeout
+    while True:
+        try:
+            line = lines.get(timeout=max(deadline - time.time(), 0))
+        except queue.Empty:
+            return False
+        if text in line:
+            return True
+
+
 class TestEarlySighupHandling:
     def test_no_dvr_core_survives_sighup_before_async_handler_setup(self, tmp_path):
         if not hasattr(signal, "SIGHUP"):
@@ -77,19 +103,10 @@ class TestEarlySighupHandling:
         )
 
         try:
-            deadline = time.time() + 5.0
-            startup_line = ""
-            while time.time() < deadline:
-                ready, _, _ = select.select([proc.stdout], [], [], 0.1)
-                if not ready:
-                    assert proc.poll() is None, (
-                        "core exited before no-DVR startup completed"
-                    )
-                    continue
-                startup_line = proc.stdout.readline()
-                if "Waiting for DVR server configuration" in startup_line:
-                    break
-            assert "Waiting for DVR server configuration" in startup_line
+            lines = _read_output(proc)
+            assert _wait_for_line(lines, "Waiting for DVR server configuration"), (
+                "core exited before no-DVR startup completed"
+            )
 
             os.kill(proc.pid, signal.SIGHUP)
             time.sleep(2.0)
@@ -126,6 +143,133 @@ class TestEarlySighupHandling:
             signal.signal(signal.SIGHUP, original_handler)
 
 
+class TestEarlyShutdownHandling:
+    def test_no_dvr_core_exits_promptly_on_sigterm(self, tmp_path):
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "settings.json").write_text(
+            json.dumps(_settings()), encoding="utf-8"
+        )
+
+        env = os.environ.copy()
+        env["CONFIG_PATH"] = str(config_dir)
+        env.pop("CHANNELS_DVR_HOST", None)
+        env.pop("CHANNELS_DVR_PORT", None)
+        env.pop("CHANNELS_DVR_SERVERS", None)
+
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "core.main"],
+            cwd=Path(__file__).resolve().parent.parent.parent,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        try:
+            lines = _read_output(proc)
+            assert _wait_for_line(lines, "Waiting for DVR server configuration")
+
+            proc.send_signal(signal.SIGTERM)
+
+            assert proc.wait(timeout=5) == 0
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait(timeout=5)
+
+    def test_sigterm_during_dvr_initialization_stops_startup(self, tmp_path):
+        # The DVR accepts connections but never answers, so the connectivity
+        # check blocks until its timeout.
+        silent_dvr = socket.create_server(("127.0.0.1", 0))
+        port = silent_dvr.getsockname()[1]
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "settings.json").write_text(
+            json.dumps(
+                _settings(
+                    _dvr("dvr_a", host="127.0.0.1", port=port, name="First"),
+                    _dvr("dvr_b", host="127.0.0.1", port=port, name="Second"),
+                )
+            ),
+            encoding="utf-8",
+        )
+
+        env = os.environ.copy()
+        env["CONFIG_PATH"] = str(config_dir)
+        env.pop("CHANNELS_DVR_HOST", None)
+        env.pop("CHANNELS_DVR_PORT", None)
+        env.pop("CHANNELS_DVR_SERVERS", None)
+
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "core.main"],
+            cwd=Path(__file__).resolve().parent.parent.parent,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        try:
+            lines = _read_output(proc)
+            assert _wait_for_line(lines, "Initializing DVR: First")
+
+            proc.send_signal(signal.SIGTERM)
+
+            assert _wait_for_line(lines, "Received shutdown signal", timeout=2.0)
+            assert proc.wait(timeout=15) == 0
+            remaining = []
+            while not lines.empty():
+                remaining.append(lines.get_nowait())
+            assert not any("Initializing DVR: Second" in line for line in remaining)
+            assert not any("Monitoring started" in line for line in remaining)
+        finally:
+            silent_dvr.close()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait(timeout=5)
+
+
+class TestStandbyPicksUpConfiguration:
+    def test_no_dvr_core_starts_dvr_added_to_config(self, tmp_path):
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        settings_file = config_dir / "settings.json"
+        settings_file.write_text(json.dumps(_settings()), encoding="utf-8")
+
+        env = os.environ.copy()
+        env["CONFIG_PATH"] = str(config_dir)
+        env.pop("CHANNELS_DVR_HOST", None)
+        env.pop("CHANNELS_DVR_PORT", None)
+        env.pop("CHANNELS_DVR_SERVERS", None)
+
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "core.main"],
+            cwd=Path(__file__).resolve().parent.parent.parent,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        try:
+            lines = _read_output(proc)
+            assert _wait_for_line(lines, "Waiting for DVR server configuration")
+
+            settings_file.write_text(
+                json.dumps(_settings(_dvr("dvr_new", host="127.0.0.1", port=1))),
+                encoding="utf-8",
+            )
+
+            assert _wait_for_line(lines, "starting (new DVR added)", timeout=10.0)
+            proc.send_signal(signal.SIGTERM)
+            assert proc.wait(timeout=10) == 0
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait(timeout=5)
+
+
 class TestComputeReloadDiff:
     def test_dvr_a_port_change_only_a_in_changed(self):
         dvr_a_old = _dvr("dvr_aaa", port=8089)
@@ -667,6 +811,39 @@ class TestWatchConfigAndReload:
         asyncio.run(run())
         assert len(handle_calls) == 0
 
+    def test_periodic_check_skips_reading_an_unchanged_file(self, tmp_path):
+        config_file = tmp_path / "settings.json"
+        config_file.write_text(json.dumps(_settings(_dvr("dvr_aaa"))))
+
+        async def run():
+            from core.main import _watch_config_and_reload
+            import core.main as main_mod
+
+            reads = []
+            real_read = main_mod._read_config_snapshot
+
+            def counting_read():
+                reads.append(1)
+                return real_read()
+
+            shutdown = asyncio.Event()
+
+            async def stop_after():
+                await asyncio.sleep(2.2)
+                shutdown.set()
+
+            with (
+                patch("core.main.CONFIG_FILE", config_file),
+                patch("core.main._read_config_snapshot", side_effect=counting_read),
+            ):
+                await asyncio.gather(
+                    _watch_config_and_reload(shutdown, asyncio.Event(), MagicMock()),
+                    stop_after(),
+                )
+            return reads
+
+        assert len(asyncio.run(run())) == 1
+
     def test_config_snapshot_reads_are_offloaded_to_thread(self, tmp_path):
         config_file = tmp_path / "settings.json"
         config_file.write_text(json.dumps(_settings(_dvr("dvr_aaa"))))
@@ -759,6 +936,51 @@ class TestAsyncRuntimeIntegration:
         assert callable(_init_dvr_monitor_sync)
         assert not inspect.iscoroutinefunction(_init_dvr_monitor_sync)
 
+    def test_init_dvr_monitor_sync_preloads_caches_concurrently(self):
+        from types import SimpleNamespace
+
+        import core.helpers.initialize as init_mod
+        import core.main as mod
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fill(count):
+            def _fill():
+                barrier.wait()
+                return count
+
+            return _fill
+
+        vod_alert = SimpleNamespace(_cache_vod_metadata=fill(12))
+        recording_alert = SimpleNamespace(_cache_channels=fill(3))
+        channel_alert = SimpleNamespace(
+            channel_provider=SimpleNamespace(cache_channels=fill(40))
+        )
+        alert_manager = SimpleNamespace(
+            alert_instances={
+                "Channel-Watching": channel_alert,
+                "VOD-Watching": vod_alert,
+                "Recording-Events": recording_alert,
+            }
+        )
+        dvr = SimpleNamespace(
+            id="dvr_1", name="DVR", host="127.0.0.1", port=8089, overrides={}
+        )
+        logged = []
+
+        with (
+            patch.object(init_mod, "check_server_connectivity", return_value=True),
+            patch.object(init_mod, "initialize_notifications", return_value=MagicMock()),
+            patch.object(init_mod, "initialize_alerts", return_value=alert_manager),
+            patch.object(init_mod, "initialize_event_monitor", return_value="monitor"),
+            patch.object(mod, "log", side_effect=lambda msg, **_: logged.append(msg)),
+        ):
+            monitor = mod._init_dvr_monitor_sync(dvr, MagicMock())
+
+        assert monitor == "monitor"
+        assert "[DVR] Channels: 40" in logged
+        assert "[DVR] VOD library: 12 items | Recordings: 3 scheduled" in logged
+
     def test_no_threading_thread_in_new_hot_reload_functions(self):
         import inspect
         import core.main as mod
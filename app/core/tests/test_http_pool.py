@@ -0,0 +1,44 @@
+"""Tests for the shared per-DVR HTTP client pool."""
+
+from core.helpers import http_pool
+from core.helpers.dvr_connection import EVENT_STREAM_HEADERS
+from core.helpers.job_info import JobInfoProvider
+from core.helpers.program_info import ProgramInfoProvider
+
+
+class TestGetClient:
+    def test_providers_for_one_dvr_share_a_client(self):
+        jobs = JobInfoProvider(host="10.0.0.5", port=8089)
+        programs = ProgramInfoProvider("10.0.0.5", 8089)
+
+        assert jobs._client is programs._client
+        assert jobs._client is http_pool.get_client("10.0.0.5", "8089")
+
+    def test_each_dvr_gets_its_own_client(self):
+        assert http_pool.get_client("10.0.0.5", 8089) is not http_pool.get_client(
+            "10.0.0.6", 8089
+        )
+
+    def test_close_all_closes_clients_and_later_calls_reopen(self):
+        client = http_pool.get_client("10.0.0.7", 8089)
+
+        http_pool.close_all()
+
+        assert client.is_closed
+        replacement = http_pool.get_client("10.0.0.7", 8089)
+        assert replacement is not client
+        assert not replacement.is_closed
+
+    def test_closed_client_is_replaced(self):
+        client = http_pool.get_client("10.0.0.8", 8089)
+        client.close()
+
+        assert http_pool.get_client("10.0.0.8", 8089) is not client
+
+    def test_pooled_clients_ask_for_compressed_responses(self):
+        client = http_pool.get_client("10.0.0.9", 8089)
+
+        assert client.headers["Accept-Encoding"] == "gzip, deflate"
+
+    def test_event_stream_is_requested_uncompressed(self):
+        assert EVENT_STREAM_HEADERS["Accept-Encoding"] == "identity"
@@ -1,17 +1,31 @@
+import json
 import threading
+import time
 
 from core.helpers.job_info import JobInfoProvider
 
 
 class _JobsResponse:
+    status_code = 200
+
     def __init__(self, jobs):
-        self._jobs = jobs
+        self.content = json.dumps(jobs).encode()
 
     def raise_for_status(self):
         return None
 
-    def json(self):
-        return self._jobs
+
+class _FakeClient:
+    def __init__(self, jobs):
+        self._jobs = jobs
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _JobsResponse(self._jobs)
+
+    def close(self):
+        return None
 
 
 def _call_in_daemon_thread(func):
@@ -27,27 +41,202 @@ def _call_in_daemon_thread(func):
     return result["value"]
 
 
-def test_get_all_jobs_refreshes_expired_cache_without_nested_lock_deadlock(monkeypatch):
+def test_get_all_jobs_refreshes_expired_cache_without_nested_lock_deadlock():
     provider = JobInfoProvider(host="127.0.0.1", port=9, cache_ttl=0)
-    monkeypatch.setattr(
-        "core.helpers.job_info.httpx.get",
-        lambda *args, **kwargs: _JobsResponse([{"id": "job-1", "name": "News"}]),
-    )
+    provider._client = _FakeClient([{"id": "job-1", "name": "News"}])
 
     jobs = _call_in_daemon_thread(provider.get_all_jobs)
 
     assert jobs == [{"id": "job-1", "name": "News"}]
 
 
-def test_get_job_by_id_refreshes_expired_cache_without_nested_lock_deadlock(
-    monkeypatch,
-):
+def test_get_job_by_id_refreshes_expired_cache_without_nested_lock_deadlock():
     provider = JobInfoProvider(host="127.0.0.1", port=9, cache_ttl=0)
-    monkeypatch.setattr(
-        "core.helpers.job_info.httpx.get",
-        lambda *args, **kwargs: _JobsResponse([{"id": "job-2", "name": "Movie"}]),
-    )
+    provider._client = _FakeClient([{"id": "job-2", "name": "Movie"}])
 
     job = _call_in_daemon_thread(lambda: provider.get_job_by_id("job-2"))
 
     assert job == {"id": "job-2", "name": "Movie"}
+
+
+def test_lookups_reuse_the_provider_client():
+    provider = JobInfoProvider(host="127.0.0.1", port=9, cache_ttl=0)
+    client = _FakeClient([{"id": "job-3", "name": "Game"}])
+    provider._client = client
+
+    provider.cache_jobs()
+    provider.get_job_by_id("job-3")
+
+    assert client.urls == ["http://127.0.0.1:9/api/v1/jobs"] * 2
+
+
+def test_concurrent_misses_for_one_job_share_a_single_fetch():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._jobs_cache_time = float("inf")
+    fetch_started = threading.Event()
+    follower_joined = threading.Event()
+    release = threading.Event()
+
+    class _ObservedInflight(dict):
+        def get(self, key, default=None):
+            event = super().get(key, default)
+            if event is not None:
+                follower_joined.set()
+            return event
+
+    class _BlockingClient(_FakeClient):
+        def get(self, url, **kwargs):
+            fetch_started.set()
+            release.wait(1.0)
+            return super().get(url, **kwargs)
+
+    provider._inflight = _ObservedInflight()
+    client = _BlockingClient([{"id": "job-4", "name": "Late"}])
+    provider._client = client
+    results = []
+
+    def lookup():
+        results.append(provider.get_job_by_id("job-4"))
+
+    leader = threading.Thread(target=lookup)
+    leader.start()
+    assert fetch_started.wait(1.0)
+    follower = threading.Thread(target=lookup)
+    follower.start()
+    assert follower_joined.wait(1.0)
+    release.set()
+    leader.join(1.0)
+    follower.join(1.0)
+
+    assert results == [{"id": "job-4", "name": "Late"}] * 2
+    assert len(client.urls) == 1
+    assert provider._inflight == {}
+
+
+def test_cache_jobs_skips_entries_without_an_id():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._client = _FakeClient([{"id": "job-5"}, {"name": "orphan"}, {"id": ""}])
+
+    assert provider.cache_jobs() == 3
+    assert provider._jobs_cache == {"job-5": {"id": "job-5"}}
+
+
+def test_malformed_json_is_reported_as_a_failed_fetch():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    response = _JobsResponse([])
+    response.content = b"{not json"
+    provider._client = type("_Client", (), {"get": lambda self, url, **kw: response})()
+
+    assert provider.cache_jobs() == 0
+    assert provider.get_job_by_id("job-6") is None
+    assert provider.get_all_recordings() == []
+
+
+def test_open_jobs_circuit_serves_the_cache_without_a_request():
+    provider = JobInfoProvider(host="127.0.0.1", port=9, cache_ttl=0)
+    provider._jobs_cache = {"job-7": {"id": "job-7"}}
+    client = _FakeClient([])
+    provider._client = client
+    for _ in range(provider._jobs_circuit.FAILURE_THRESHOLD):
+        provider._jobs_circuit.record_failure()
+
+    assert provider.get_all_jobs() == [{"id": "job-7"}]
+    assert provider.get_job_by_id("job-8") is None
+    assert client.urls == []
+
+
+def test_expired_cache_is_served_while_one_background_refresh_runs():
+    provider = JobInfoProvider(host="127.0.0.1", port=9, cache_ttl=0)
+    provider._jobs_cache = {"old": {"id": "old"}}
+    provider._jobs_cache_time = 1
+    release = threading.Event()
+
+    class _SlowClient(_FakeClient):
+        def get(self, url, **kwargs):
+            release.wait(1.0)
+            return super().get(url, **kwargs)
+
+    client = _SlowClient([{"id": "new"}])
+    provider._client = client
+
+    assert provider.get_all_jobs() == [{"id": "old"}]
+    assert provider.get_all_jobs() == [{"id": "old"}]
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "job-cache-refresh":
+            thread.join(1.0)
+
+    assert provider._jobs_cache == {"new": {"id": "new"}}
+    assert len(client.urls) == 1
+    assert provider._refreshing is False
+
+
+def test_bulk_active_check_fetches_the_job_list_once():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    client = _FakeClient([{"id": "job-9"}, {"id": "job-10"}])
+    provider._client = client
+
+    status = provider.is_jobs_active_bulk(["job-9", "job-10", "gone-1", "gone-2"])
+
+    assert status == {"job-9": True, "job-10": True, "gone-1": False, "gone-2": False}
+    assert len(client.urls) == 1
+
+
+def test_bulk_active_check_skips_the_fetch_when_the_cache_covers_every_id():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._jobs_cache = {"job-11": {"id": "job-11"}}
+    provider._jobs_cache_time = time.time()
+    client = _FakeClient([])
+    provider._client = client
+
+    assert provider.is_jobs_active_bulk(["job-11"]) == {"job-11": True}
+    assert client.urls == []
+
+
+def test_bulk_scheduled_check_compares_start_times_against_now():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._client = _FakeClient(
+        [{"id": "later", "start_time": 1000}, {"id": "soon", "start_time": 120}]
+    )
+
+    assert provider.is_recordings_scheduled_bulk(
+        ["later", "soon", "gone"], now=100
+    ) == {"later": True, "soon": False, "gone": False}
+
+
+def test_fresh_cache_is_read_without_waiting_for_the_lock():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._jobs_cache = {"job-12": {"id": "job-12"}}
+    provider._jobs_cache_time = time.time()
+    provider._client = _FakeClient([])
+
+    with provider._lock:
+        jobs = _call_in_daemon_thread(provider.get_all_jobs)
+
+    assert jobs == [{"id": "job-12"}]
+    assert provider._client.urls == []
+
+
+def test_api_fallback_publishes_a_new_cache_dict():
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._jobs_cache_time = time.time()
+    provider._client = _FakeClient([{"id": "job-13"}])
+    snapshot = provider._jobs_cache
+
+    assert provider.get_job_by_id("job-13") == {"id": "job-13"}
+    assert snapshot == {}
+    assert provider._jobs_cache == {"job-13": {"id": "job-13"}}
+
+
+def test_cache_hit_writes_no_log_lines_at_standard_level(monkeypatch):
+    from core.helpers import job_info
+
+    logged = []
+    monkeypatch.setattr(job_info, "is_verbose", lambda: False)
+    monkeypatch.setattr(job_info, "log", lambda msg, **kw: logged.append(msg))
+    provider = JobInfoProvider(host="127.0.0.1", port=9)
+    provider._jobs_cache = {"job-14": {"id": "job-14"}}
+    provider._jobs_cache_time = time.time()
+
+    assert provider.get_job_by_id("job-14") == {"id": "job-14"}
+    assert logged == []
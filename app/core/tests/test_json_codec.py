@@ -0,0 +1,37 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from core.helpers import json_codec
+
+
+class TestJsonCodec:
+    def test_loads_accepts_str_and_bytes(self):
+        assert json_codec.loads('{"Type": "hello"}') == {"Type": "hello"}
+        assert json_codec.loads(b'{"Type": "hello"}') == {"Type": "hello"}
+
+    def test_invalid_payload_raises_stdlib_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("data: {}")
+
+    def test_stdlib_fallback_when_orjson_missing(self):
+        with patch.object(json_codec, "_ORJSON_AVAILABLE", False):
+            assert json_codec.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+            with pytest.raises(json_codec.JSONDecodeError):
+                json_codec.loads("not json")
+
+    def test_dumps_round_trips_compact_utf8(self):
+        payload = {"title": "Caf\u00e9", "extra": {1: "one"}}
+
+        encoded = json_codec.dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == {"title": "Caf\u00e9", "extra": {"1": "one"}}
+
+    def test_dumps_stdlib_fallback_matches(self):
+        payload = {"a": [1, 2], "b": "\u00e9"}
+        with patch.object(json_codec, "_ORJSON_AVAILABLE", False):
+            fallback = json_codec.dumps(payload)
+
+        assert fallback == json_codec.dumps(payload)
@@ -90,6 +90,19 @@ def test_logs_endpoint_clamps_requested_lines(client, tmp_path):
     assert lines[-1] == "line 1099"
 
 
+def test_logs_endpoint_tails_across_read_chunks(client, tmp_path):
+    log_file = tmp_path / "channelwatch.log"
+    log_file.write_text("\n".join(f"line {i} " + "x" * 200 for i in range(1000)) + "\n")
+
+    with patch("ui.backend.main.LOG_FILE", log_file):
+        response = client.get("/api/logs?lines=400")
+
+    lines = response.json()["lines"]
+    assert len(lines) == 400
+    assert lines[0].startswith("line 600 ")
+    assert lines[-1].startswith("line 999 ")
+
+
 def test_logs_download_returns_404_when_log_file_missing(client, tmp_path):
     with patch("ui.backend.main.LOG_FILE", tmp_path / "missing.log"):
         response = client.get("/api/logs/download")
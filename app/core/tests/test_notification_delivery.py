@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
@@ -935,6 +936,39 @@ class TestNotificationManagerIntegration:
         assert retry_total == 0
         assert circuit_total == 0
 
+    def test_providers_and_webhook_are_delivered_concurrently(self):
+        from core.notifications.notification import NotificationManager
+
+        nm = NotificationManager()
+        senders = []
+        barrier = threading.Barrier(3, timeout=2.0)
+
+        def send_when_all_started(*args, **kwargs):
+            barrier.wait()
+            return True
+
+        for provider_type in ("Apprise", "Pushover"):
+            provider = MagicMock()
+            provider.PROVIDER_TYPE = provider_type
+            provider.is_configured.return_value = True
+            provider.send_notification.side_effect = send_when_all_started
+            nm.register_provider(provider)
+            senders.append(provider)
+        mock_wm = MagicMock()
+        mock_wm.is_configured.return_value = True
+        mock_wm.send_notification.side_effect = send_when_all_started
+        nm.register_webhook_manager(mock_wm)
+        senders.append(mock_wm)
+
+        with patch(
+            "core.notifications.delivery._get_delivery_db_engine", return_value=None
+        ):
+            result = nm.send_notification("T", "m", dvr_id="dvr1", event_type="test")
+
+        assert result is True
+        for sender in senders:
+            sender.send_notification.assert_called_once()
+
 
 class TestNotificationLogEndpoint:
     def test_notification_log_endpoint_filters_and_serializes_rows(
@@ -3,9 +3,10 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 
+from core.helpers import activity_recorder
 from core.helpers.activity_recorder import (
     should_record_activity,
-    cleanup_notification_history,
+    _evict_notification_history,
 )
 from core.engine.alert_manager import AlertManager
 
@@ -47,24 +48,31 @@ class TestShouldRecordActivityWithExplicitHistory:
         assert "mykey" in history
 
 
-class TestCleanupNotificationHistory:
+class TestEvictNotificationHistory:
     def test_removes_old_entries(self):
         history: dict[str, float] = {"old-key": time.time() - 3700}
-        cleanup_notification_history(history)
+        _evict_notification_history(history, time.time())
         assert "old-key" not in history
 
     def test_keeps_recent_entries(self):
         history: dict[str, float] = {"new-key": time.time()}
-        cleanup_notification_history(history)
+        _evict_notification_history(history, time.time())
         assert "new-key" in history
 
     def test_mixed_entries(self):
         now = time.time()
         history: dict[str, float] = {"old": now - 4000, "fresh": now}
-        cleanup_notification_history(history)
+        _evict_notification_history(history, now)
         assert "old" not in history
         assert "fresh" in history
 
+    def test_caps_history_at_max_entries(self, monkeypatch):
+        monkeypatch.setattr(activity_recorder, "MAX_NOTIFICATION_HISTORY", 2)
+        now = time.time()
+        history: dict[str, float] = {"a": now - 2, "b": now - 1, "c": now}
+        _evict_notification_history(history, now)
+        assert list(history) == ["b", "c"]
+
 
 class TestAlertManagerOwnsHistory:
     def test_alert_manager_has_notification_history(self):
@@ -134,3 +142,46 @@ class TestCrossDvrIsolation:
             for m in managers
         ]
         assert all(results), "All 10 DVRs should independently record the same key"
+
+
+class TestNotificationHistoryEviction:
+    def test_expired_entries_are_evicted_on_record(self):
+        now = time.time()
+        history: dict[str, float] = {"stale": now - 4000, "recent": now - 10}
+
+        assert should_record_activity("new", history) is True
+
+        assert list(history) == ["recent", "new"]
+
+    def test_rerecorded_key_moves_to_newest_end(self):
+        now = time.time()
+        history: dict[str, float] = {"a": now - 60, "b": now - 30}
+
+        assert should_record_activity("a", history) is True
+
+        assert list(history) == ["b", "a"]
+
+    def test_history_is_capped(self, monkeypatch):
+        import core.helpers.activity_recorder as recorder
+
+        monkeypatch.setattr(recorder, "MAX_NOTIFICATION_HISTORY", 3)
+        history: dict[str, float] = {}
+        for key in ("k1", "k2", "k3", "k4"):
+            should_record_activity(key, history)
+
+        assert list(history) == ["k2", "k3", "k4"]
+
+    def test_suppressed_duplicate_skips_log_formatting_when_not_verbose(
+        self, monkeypatch
+    ):
+        import core.helpers.activity_recorder as recorder
+
+        logged = []
+        monkeypatch.setattr(recorder, "is_verbose", lambda: False)
+        monkeypatch.setattr(recorder, "log", lambda *a, **k: logged.append(a))
+        history: dict[str, float] = {}
+
+        should_record_activity("dup", history)
+        assert should_record_activity("dup", history) is False
+
+        assert logged == []
@@ -6,6 +6,7 @@ publish status details for the UI.
 """
 
 import asyncio
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
@@ -20,6 +21,13 @@ from core.engine.event_monitor import EventMonitor
 pytest_plugins = ["core.tests.fixtures.mock_dvr_cluster"]
 
 
+@pytest.fixture(autouse=True)
+def _neutral_reconnect_jitter():
+    """Pin jitter to its midpoint so backoff schedules are exact."""
+    with patch("core.engine.event_monitor.random.random", return_value=0.5):
+        yield
+
+
 class TestOfflineDvrBehavior:
     def test_dvr_offline_backoff_schedule(self, mock_dvr_cluster):
         """Reconnect delays must start at 1 s and double to a 60 s cap."""
@@ -169,6 +177,56 @@ class TestOfflineDvrBehavior:
         )
 
 
+class TestReconnectJitter:
+    @pytest.mark.parametrize(
+        ("random_value", "expected"),
+        [(0.0, [0.5, 1.0, 2.0]), (0.99, [1.49, 2.98, 5.96])],
+    )
+    def test_reconnect_delay_is_jittered(self, random_value, expected):
+        monitor = EventMonitor(host="127.0.0.1")
+        monitor.running = True
+        sleep_calls: list[float] = []
+
+        def capture_sleep(delay: float) -> None:
+            sleep_calls.append(delay)
+            if len(sleep_calls) >= 3:
+                monitor.running = False
+
+        with (
+            patch(
+                "core.engine.event_monitor.random.random", return_value=random_value
+            ),
+            patch.object(
+                monitor, "_monitor_events", side_effect=ConnectionError("down")
+            ),
+            patch.object(monitor, "_sleep_interruptibly", side_effect=capture_sleep),
+        ):
+            monitor._monitor_events_loop()
+
+        assert sleep_calls == pytest.approx(expected)
+
+    def test_jittered_delay_never_exceeds_cap(self):
+        monitor = EventMonitor(host="127.0.0.1")
+        monitor.running = True
+        sleep_calls: list[float] = []
+
+        def capture_sleep(delay: float) -> None:
+            sleep_calls.append(delay)
+            if len(sleep_calls) >= 8:
+                monitor.running = False
+
+        with (
+            patch("core.engine.event_monitor.random.random", return_value=0.99),
+            patch.object(
+                monitor, "_monitor_events", side_effect=ConnectionError("down")
+            ),
+            patch.object(monitor, "_sleep_interruptibly", side_effect=capture_sleep),
+        ):
+            monitor._monitor_events_loop()
+
+        assert max(sleep_calls) == 60
+
+
 class TestDvrRetryAfterBackoff:
     def test_async_monitor_events_records_retry_after_from_429_response(self):
         class FakeResponse:
@@ -247,16 +305,27 @@ class TestDvrRetryAfterBackoff:
     def test_reconnect_sleep_stops_promptly_when_monitor_is_stopped(self):
         monitor = EventMonitor(host="127.0.0.1")
         monitor.running = True
-        sleep_calls: list[float] = []
 
-        def capture_sleep(delay: float) -> None:
-            sleep_calls.append(delay)
-            monitor.running = False
+        timer = threading.Timer(0.05, monitor.stop_monitoring)
+        timer.start()
+        started = time.monotonic()
+        try:
+            monitor._sleep_interruptibly(60.0)
+        finally:
+            timer.cancel()
+
+        assert time.monotonic() - started < 5.0
+        assert monitor.running is False
+
+    def test_reconnect_sleep_skipped_after_stop(self):
+        monitor = EventMonitor(host="127.0.0.1")
+        monitor.running = True
+        monitor.stop_monitoring()
 
-        with patch("core.engine.event_monitor.time.sleep", side_effect=capture_sleep):
+        with patch.object(monitor._stop_event, "wait") as wait:
             monitor._sleep_interruptibly(60.0)
 
-        assert sleep_calls == [1.0]
+        wait.assert_not_called()
 
     def test_retry_after_http_date_is_parsed(self):
         future = datetime.now(timezone.utc) + timedelta(seconds=30)
@@ -351,9 +420,9 @@ class TestDvrStreamFailures:
             def __init__(self):
                 self.status_code = status_code
 
-            async def aiter_lines(self):
+            async def aiter_bytes(self):
                 if False:
-                    yield ""
+                    yield b""
 
         class FakeStream:
             async def __aenter__(self):
@@ -5,6 +5,7 @@ import pytest
 from core.helpers.parsing import (
     extract_channel_number,
     extract_channel_name,
+    extract_channel_details,
     extract_device_name,
     extract_ip_address,
     extract_resolution,
@@ -47,6 +48,38 @@ class TestExtractChannelName:
         assert extract_channel_name(value) == expected
 
 
+class TestExtractChannelDetails:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "Watching ch7 ABC from Living Room (192.168.1.10)",
+            "Watching ch13.1 ACTION NETWORK from Bedroom",
+            "Watching ch7 from Living Room",
+            "Watching ch7 ABC from 192.168.1.50",
+            "Watching ch7 ABC (HD) from Den",
+            "Watching ch7 ABC FROM Den from Office",
+            "from Hall ch7 ABC from Den",
+            "Watching ch13.1 from fromage",
+            "Watching ch15 from From fromage",
+            "Watching ch13.1 from Den FROM Office",
+            "Just channel info ch7 ABC",
+            "No match",
+            "",
+        ],
+    )
+    def test_matches_standalone_extractors(self, value):
+        assert extract_channel_details(value) == (
+            extract_channel_number(value),
+            extract_channel_name(value),
+            extract_device_name(value),
+        )
+
+    def test_single_pass_fields(self):
+        assert extract_channel_details(
+            "Watching ch13.1 PBS KIDS from Living Room (192.168.1.10)"
+        ) == ("13.1", "PBS KIDS", "Living Room")
+
+
 class TestExtractDeviceName:
     @pytest.mark.parametrize(
         "value,expected",
@@ -101,6 +134,9 @@ class TestExtractSourceFromSessionId:
         "session_id,expected",
         [
             ("dvr-stream-A1B2C3D4-192.168.1.10", "Tuner (A1B2C3D4)"),
+            ("dvr-stream-a1b2c3d4-192.168.1.10", "Tuner (a1b2c3d4)"),
+            ("dvr-stream-A1G2-192.168.1.10", "A1G2"),
+            ("dvr-stream--192.168.1.10", ""),
             ("dvr-stream-M3U-MyProvider-192.168.1.10", "MyProvider"),
             ("dvr-stream-M3U", "M3U"),
             ("dvr-stream-TVE-hulu-192.168.1.10", "TVE (Hulu)"),
@@ -124,11 +160,26 @@ class TestIsValidIpAddress:
             ("not-an-ip", False),
             ("", False),
             ("192.168.1.999", False),
+            ("1.2.3", False),
+            ("::1", True),
+            ("fe80::1", True),
+            ("Living Room", False),
+            ("Den:TV", False),
         ],
     )
     def test_validate(self, value, expected):
         assert is_valid_ip_address(value) == expected
 
+    def test_device_names_skip_address_parsing(self, monkeypatch):
+        import core.helpers.parsing as parsing
+
+        def fail(text):
+            raise AssertionError(f"parsed {text!r}")
+
+        monkeypatch.setattr(parsing.ipaddress, "ip_address", fail)
+
+        assert is_valid_ip_address("Living Room TV") is False
+
 
 class TestParseEventData:
     def test_valid_json(self):
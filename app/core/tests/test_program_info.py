@@ -0,0 +1,305 @@
+"""Tests for ProgramInfoProvider XMLTV parsing and lookups."""
+
+from datetime import datetime, timezone
+
+import pytest
+import pytz
+
+from core.helpers import program_info
+from core.helpers.program_info import ProgramInfoProvider
+
+
+def _make_provider(tz="America/New_York"):
+    provider = object.__new__(ProgramInfoProvider)
+    provider.timezone = tz
+    provider.local_tz = pytz.timezone(tz)
+    return provider
+
+
+class TestParseXmltvTime:
+    def test_matches_timezone_aware_conversion(self):
+        provider = _make_provider()
+        expected = int(
+            datetime(2024, 3, 10, 7, 30, tzinfo=timezone.utc)
+            .astimezone(provider.local_tz)
+            .timestamp()
+        )
+
+        assert provider._parse_xmltv_time("20240310073000 +0000") == expected
+
+    def test_repeated_boundaries_hit_the_cache(self):
+        provider = _make_provider()
+        program_info._xmltv_timestamp.cache_clear()
+
+        for _ in range(5):
+            provider._parse_xmltv_time("20240601180000 +0000")
+
+        info = program_info._xmltv_timestamp.cache_info()
+        assert (info.misses, info.hits) == (1, 4)
+
+    def test_malformed_time_returns_none(self):
+        assert _make_provider()._parse_xmltv_time("not-a-time") is None
+
+
+_GUIDE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<tv>
+  <channel id="ch-a"><display-name>A</display-name><lcn>7</lcn></channel>
+  <channel id="ch-b"><display-name>B</display-name></channel>
+  <programme channel="ch-a" start="20240601180000 +0000" stop="20240601183000 +0000">
+    <title>Evening News</title><desc>Headlines</desc><icon src="http://img/n.png"/>
+  </programme>
+  <programme channel="ch-a" start="20240601183000 +0000" stop="20240601190000 +0000">
+    <title>Caf\xc3\xa9 Hour</title>
+  </programme>
+  <programme channel="ch-a" start="bad" stop="20240601190000 +0000"/>
+</tv>
+"""
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def parser_backend(request, monkeypatch):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+        monkeypatch.setattr(program_info, "_LXML_AVAILABLE", True)
+    else:
+        monkeypatch.setattr(program_info, "_LXML_AVAILABLE", False)
+    return request.param
+
+
+@pytest.mark.usefixtures("parser_backend")
+class TestParseXmltvData:
+    def _provider(self):
+        provider = _make_provider()
+        provider._guide = ({}, {})
+        return provider
+
+    def test_streams_channels_and_programmes_into_the_caches(self):
+        provider = self._provider()
+
+        channel_map, program_cache = provider._parse_xmltv_data(_GUIDE)
+
+        assert channel_map == {"7": "ch-a"}
+        guide = program_cache["ch-a"]
+        assert len(guide) == 2
+        assert guide.titles == ["Evening News", "Café Hour"]
+        assert guide.descriptions == ["Headlines", ""]
+        assert guide.icon_urls == ["http://img/n.png", None]
+        assert guide.stop_times[1] - guide.start_times[1] == 1800
+
+    def test_malformed_document_reports_failure(self):
+        assert self._provider()._parse_xmltv_data(b"<tv><channel") is None
+
+    def test_external_entities_are_not_resolved(self, tmp_path):
+        secret = tmp_path / "secret.txt"
+        secret.write_text("leaked")
+        guide = (
+            f'<?xml version="1.0"?><!DOCTYPE tv [<!ENTITY x SYSTEM "{secret.as_uri()}">]>'
+            '<tv><programme channel="c" start="20240601180000 +0000" '
+            'stop="20240601183000 +0000"><title>&x;</title></programme></tv>'
+        ).encode()
+
+        guide_data = self._provider()._parse_xmltv_data(guide)
+
+        if guide_data is not None:
+            assert guide_data[1]["c"].titles != ["leaked"]
+
+    def test_repeated_titles_and_icons_share_one_string(self):
+        guide = b"""<tv>
+  <programme channel="ch-a" start="20240601180000 +0000" stop="20240601183000 +0000">
+    <title>Rerun</title><icon src="http://img/r.png"/>
+  </programme>
+  <programme channel="ch-b" start="20240601180000 +0000" stop="20240601183000 +0000">
+    <title>Rerun</title><icon src="http://img/r.png"/>
+  </programme>
+  <programme channel="ch-b" start="20240601183000 +0000" stop="20240601190000 +0000">
+    <title></title>
+  </programme>
+</tv>"""
+
+        _, program_cache = self._provider()._parse_xmltv_data(guide)
+
+        first, second = program_cache["ch-a"], program_cache["ch-b"]
+        assert first.titles[0] is second.titles[0]
+        assert first.icon_urls[0] is second.icon_urls[0]
+        assert second.titles[1] == "Unknown Program"
+
+
+_OUT_OF_ORDER_GUIDE = b"""<tv>
+  <channel id="ch-a"><lcn>7</lcn></channel>
+  <programme channel="ch-a" start="20240601190000 +0000" stop="20240601193000 +0000">
+    <title>Third</title>
+  </programme>
+  <programme channel="ch-a" start="20240601180000 +0000" stop="20240601183000 +0000">
+    <title>First</title>
+  </programme>
+  <programme channel="ch-a" start="20240601183000 +0000" stop="20240601184500 +0000">
+    <title>Second</title>
+  </programme>
+</tv>
+"""
+
+
+class TestGetCurrentProgram:
+    def _provider(self):
+        provider = _make_provider()
+        provider._guide = provider._parse_xmltv_data(_OUT_OF_ORDER_GUIDE)
+        provider.cache_program_data = lambda: 3
+        return provider
+
+    def test_programs_are_sorted_by_start_time(self):
+        guide = self._provider().program_cache["ch-a"]
+
+        assert guide.titles == ["First", "Second", "Third"]
+        assert list(guide.start_times) == sorted(guide.start_times)
+
+    def test_lookup_returns_program_dict(self):
+        provider = self._provider()
+        start = provider.program_cache["ch-a"].start_times[0]
+
+        assert provider.get_current_program("7", start) == {
+            "channel_id": "ch-a",
+            "start_time": start,
+            "stop_time": start + 1800,
+            "title": "First",
+            "description": "",
+            "icon_url": None,
+        }
+
+    def test_lookup_finds_program_covering_timestamp(self):
+        provider = self._provider()
+        start = provider.program_cache["ch-a"].start_times[0]
+
+        assert provider.get_current_program("7", start)["title"] == "First"
+        assert provider.get_current_program("7", start + 1799)["title"] == "First"
+        assert provider.get_current_program("7", start + 1800)["title"] == "Second"
+        assert provider.get_current_program("7", start + 3600)["title"] == "Third"
+
+    def test_gaps_and_out_of_range_times_return_none(self):
+        provider = self._provider()
+        start = provider.program_cache["ch-a"].start_times[0]
+
+        assert provider.get_current_program("7", start - 1) is None
+        assert provider.get_current_program("7", start + 2700) is None
+        assert provider.get_current_program("7", start + 5400) is None
+        assert provider.get_current_program("9", start) is None
+
+
+class TestGuideCircuit:
+    def test_open_circuit_keeps_serving_the_stale_guide(self):
+        provider = ProgramInfoProvider("127.0.0.1", 9, cache_ttl=0)
+        provider._guide = provider._parse_xmltv_data(_OUT_OF_ORDER_GUIDE)
+        provider.cache_timestamp = 1
+        for _ in range(provider._guide_circuit.FAILURE_THRESHOLD):
+            provider._guide_circuit.record_failure()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("guide fetched while circuit open")
+
+        provider._client = type("_Client", (), {"get": fail})()
+        start = provider.program_cache["ch-a"].start_times[0]
+
+        assert provider.get_current_program("7", start)["title"] == "First"
+
+
+class TestCacheProgramData:
+    def _provider(self, guide=_OUT_OF_ORDER_GUIDE):
+        provider = ProgramInfoProvider("127.0.0.1", 9, cache_ttl=3600)
+        provider._fetch_xmltv_data = lambda: guide
+        return provider
+
+    def test_refresh_publishes_a_new_guide_in_one_swap(self):
+        provider = self._provider()
+        before = provider._guide
+
+        assert provider.cache_program_data() == 3
+
+        assert provider._guide is not before
+        assert provider.channel_map == {"7": "ch-a"}
+
+    def test_failed_parse_keeps_the_previous_guide(self):
+        provider = self._provider()
+        provider.cache_program_data()
+        previous = provider._guide
+        provider.cache_timestamp = 0
+        provider._fetch_xmltv_data = lambda: b"<tv><programme"
+
+        assert provider.cache_program_data() == 0
+        assert provider._guide is previous
+
+    def test_lookups_do_not_wait_for_a_refresh_in_progress(self):
+        import threading
+
+        provider = self._provider()
+        provider.cache_program_data()
+        provider.cache_timestamp = 0
+        start = provider.program_cache["ch-a"].start_times[0]
+        fetch_started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch():
+            fetch_started.set()
+            release.wait(1.0)
+            return _OUT_OF_ORDER_GUIDE
+
+        provider._fetch_xmltv_data = slow_fetch
+        refresher = threading.Thread(target=provider.cache_program_data)
+        refresher.start()
+        assert fetch_started.wait(1.0)
+
+        try:
+            assert provider.get_current_program("7", start)["title"] == "First"
+        finally:
+            release.set()
+            refresher.join(1.0)
+
+
+class TestFetchXmltvData:
+    def test_returns_undecoded_response_bytes(self):
+        provider = ProgramInfoProvider("127.0.0.1", 9)
+        body = b"<tv/>"
+
+        class _Response:
+            status_code = 200
+            content = body
+
+            @property
+            def text(self):
+                raise AssertionError("guide body should not be decoded to str")
+
+        provider._client = type("_Client", (), {"get": lambda s, u, **k: _Response()})()
+
+        assert provider._fetch_xmltv_data() is body
+
+    def test_parser_honours_the_declared_encoding(self):
+        guide = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>\n<tv>'
+            '<channel id="c"><lcn>4</lcn></channel>'
+            '<programme channel="c" start="20240601180000 +0000" '
+            'stop="20240601183000 +0000"><title>Télé</title></programme></tv>'
+        ).encode("latin-1")
+
+        _, program_cache = _make_provider()._parse_xmltv_data(guide)
+
+        assert program_cache["c"].titles == ["Télé"]
+
+
+class TestGetCurrentPrograms:
+    def test_batch_lookup_matches_single_lookups(self):
+        provider = _make_provider()
+        provider._guide = provider._parse_xmltv_data(_OUT_OF_ORDER_GUIDE)
+        refreshes = []
+        provider.cache_program_data = lambda: refreshes.append(1) or 3
+        start = provider.program_cache["ch-a"].start_times[0]
+
+        programs = provider.get_current_programs(["7", "9"], start + 1800)
+
+        assert list(programs) == ["7"]
+        assert programs["7"] == provider.get_current_program("7", start + 1800)
+        assert len(refreshes) == 2
+
+    def test_no_guide_returns_empty_mapping(self):
+        provider = _make_provider()
+        provider._guide = ({}, {})
+        provider.cache_program_data = lambda: 0
+
+        assert provider.get_current_programs(["7"]) == {}
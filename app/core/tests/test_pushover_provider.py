@@ -0,0 +1,68 @@
+"""Tests for PushoverProvider image attachment handling."""
+
+from unittest.mock import MagicMock
+
+from core.notifications.providers import pushover
+from core.notifications.providers.pushover import PushoverProvider
+
+
+def _response(status_code=200, content=b"img", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+def _make_provider():
+    provider = PushoverProvider()
+    provider.initialize(user_key="user", api_token="token")
+    provider._session = MagicMock()
+    provider._session.post.return_value = _response()
+    return provider
+
+
+class TestImageCache:
+    def test_repeated_image_is_downloaded_once(self):
+        provider = _make_provider()
+        provider._session.get.return_value = _response(
+            headers={"Content-Type": "image/png"}
+        )
+
+        assert provider.send_notification("A", "m", image_url="https://x/logo.png")
+        assert provider.send_notification("B", "m", image_url="https://x/logo.png")
+
+        provider._session.get.assert_called_once()
+        files = provider._session.post.call_args.kwargs["files"]
+        assert files["attachment"] == ("image.jpg", b"img", "image/png")
+
+    def test_expired_image_is_downloaded_again(self, monkeypatch):
+        provider = _make_provider()
+        provider._session.get.return_value = _response()
+        clock = iter([1000.0, 1000.0 + pushover.IMAGE_CACHE_TTL_SECONDS + 1])
+        monkeypatch.setattr(pushover.time, "monotonic", lambda: next(clock))
+
+        provider.send_notification("A", "m", image_url="https://x/logo.png")
+        provider.send_notification("B", "m", image_url="https://x/logo.png")
+
+        assert provider._session.get.call_count == 2
+
+    def test_failed_download_is_not_cached(self):
+        provider = _make_provider()
+        provider._session.get.return_value = _response(status_code=404)
+
+        provider.send_notification("A", "m", image_url="https://x/missing.png")
+        provider.send_notification("B", "m", image_url="https://x/missing.png")
+
+        assert provider._session.get.call_count == 2
+        assert "files" not in provider._session.post.call_args.kwargs
+
+    def test_cache_keeps_only_the_newest_entries(self, monkeypatch):
+        monkeypatch.setattr(pushover, "IMAGE_CACHE_MAX_ENTRIES", 2)
+        provider = _make_provider()
+        provider._session.get.return_value = _response()
+
+        for name in ("a", "b", "c"):
+            provider.send_notification("T", "m", image_url=f"https://x/{name}.png")
+
+        assert list(provider._image_cache) == ["https://x/b.png", "https://x/c.png"]
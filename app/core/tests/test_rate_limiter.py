@@ -2,7 +2,7 @@
 
 import time
 
-from core.notifications.rate_limiter import RateLimiter
+from core.notifications.rate_limiter import DuplicateFilter, RateLimiter
 
 
 class TestRateLimiterBasic:
@@ -98,3 +98,92 @@ class TestRateLimiterConfigurable:
         assert rl.allow() is False
         rl.reset()
         assert rl.allow() is True
+
+
+class TestDuplicateFilter:
+    def test_recorded_key_is_duplicate_within_window(self):
+        df = DuplicateFilter(window_seconds=5)
+        assert df.is_duplicate("Title", "Body") is False
+        assert df.is_duplicate("Title", "Body") is False
+
+        df.record("Title", "Body")
+
+        assert df.is_duplicate("Title", "Body") is True
+        assert df.is_duplicate("Title", "Other body") is False
+
+    def test_repeat_after_window_is_sent_again(self):
+        df = DuplicateFilter(window_seconds=5)
+        df.record("Title", "Body")
+
+        # Simulate the entry ageing out
+        df._recent[("Title", "Body")] = time.time() - 6
+
+        assert df.is_duplicate("Title", "Body") is False
+
+    def test_oldest_entries_are_evicted_at_capacity(self):
+        df = DuplicateFilter(window_seconds=300, max_entries=2)
+        df.record("a", "")
+        df.record("b", "")
+        df.record("c", "")
+
+        assert list(df._recent) == [("b", ""), ("c", "")]
+        assert df.is_duplicate("a", "") is False
+
+    def test_manager_sends_identical_notification_once(self):
+        from unittest.mock import MagicMock
+
+        from core.notifications.notification import NotificationManager
+
+        manager = NotificationManager()
+        provider = MagicMock()
+        provider.PROVIDER_TYPE = "Apprise"
+        provider.is_configured.return_value = True
+        provider.send_notification.return_value = True
+        manager.register_provider(provider)
+
+        assert manager.send_notification("Title", "Body") is True
+        assert manager.send_notification("Title", "Body") is True
+
+        assert provider.send_notification.call_count == 1
+        assert manager.rate_limiter.allow() is True
+
+    @staticmethod
+    def _manager(**kwargs):
+        from unittest.mock import MagicMock
+
+        from core.notifications.notification import NotificationManager
+
+        manager = NotificationManager(**kwargs)
+        provider = MagicMock()
+        provider.PROVIDER_TYPE = "Apprise"
+        provider.is_configured.return_value = True
+        provider.send_notification.return_value = True
+        manager.register_provider(provider)
+        return manager, provider
+
+    def test_rate_limited_copy_is_not_reported_as_sent_on_retry(self):
+        manager, provider = self._manager(rate_limit=1)
+
+        assert manager.send_notification("First", "Msg") is True
+        assert manager.send_notification("Title", "Msg") is False
+        assert manager.send_notification("Title", "Msg") is False
+
+        assert provider.send_notification.call_count == 1
+
+    def test_failed_delivery_is_not_remembered(self):
+        manager, provider = self._manager()
+        provider.send_notification.return_value = False
+
+        assert manager.send_notification("Title", "Msg", event_type="channel") is False
+        provider.send_notification.return_value = True
+        assert manager.send_notification("Title", "Msg", event_type="channel") is True
+
+    def test_same_text_from_other_dvr_or_event_type_is_sent(self):
+        manager, provider = self._manager()
+
+        assert manager.send_notification("T", "M", dvr_id="a", event_type="x")
+        assert manager.send_notification("T", "M", dvr_id="b", event_type="x")
+        assert manager.send_notification("T", "M", dvr_id="a", event_type="y")
+        assert manager.send_notification("T", "M", dvr_id="a", event_type="x")
+
+        assert provider.send_notification.call_count == 3
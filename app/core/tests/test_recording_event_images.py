@@ -108,9 +108,9 @@ async def test_cleanup_offloads_blocking_job_provider_work_from_event_loop():
         def __init__(self):
             super().__init__(host="127.0.0.1", port=9, cache_ttl=0)
 
-        def is_job_active(self, job_id: str) -> bool:
+        def is_jobs_active_bulk(self, job_ids):
             time.sleep(0.05)
-            return True
+            return {job_id: True for job_id in job_ids}
 
         def cache_jobs(self) -> int:
             time.sleep(0.05)
@@ -167,7 +167,9 @@ async def test_cleanup_snapshots_and_deletes_recording_dicts_under_event_lock():
     alert.pending_recordings = {
         "pending-stale": {"first_seen": time.time() - 90000, "retry_count": 0}
     }
-    alert.job_provider.is_job_active = MagicMock(return_value=False)
+    alert.job_provider.is_jobs_active_bulk = MagicMock(
+        side_effect=lambda job_ids: {job_id: False for job_id in job_ids}
+    )
     lock_entries = 0
     original_lock = alert._event_lock
 
@@ -129,3 +129,38 @@ class TestRoundTrip:
         for i in range(5):
             assert await sm2.has_session(f"sess{i}")
             assert await sm2.was_notification_sent(f"key{i}", within_seconds=60)
+
+
+class TestNotificationHistoryOrder:
+    @pytest.mark.anyio
+    async def test_rerecorded_notification_moves_to_newest_end(self):
+        sm = SessionManager()
+        await sm.record_notification("a")
+        await sm.record_notification("b")
+        await sm.record_notification("a")
+
+        assert list(sm.notification_history) == ["b", "a"]
+
+    @pytest.mark.anyio
+    async def test_load_state_orders_history_oldest_first(self):
+        now = time.time()
+        sm = SessionManager()
+        await sm.record_notification("live")
+
+        await sm.load_state(
+            {"notification_history": {"newer": now - 10, "older": now - 60}}
+        )
+
+        assert list(sm.notification_history) == ["older", "newer", "live"]
+
+    @pytest.mark.anyio
+    async def test_cleanup_evicts_expired_entries_from_the_oldest_end(self):
+        now = time.time()
+        sm = SessionManager()
+        sm.notification_history.update({"old": now - 500, "fresh": now - 5})
+        sm.processing_events.update({"stale": now - 400, "busy": now})
+
+        await sm.cleanup(event_ttl=300, notification_ttl=100)
+
+        assert list(sm.notification_history) == ["fresh"]
+        assert list(sm.processing_events) == ["busy"]
@@ -0,0 +1,41 @@
+import pytest
+
+from core.engine.sse import MAX_PENDING_BYTES, split_sse_payloads
+
+
+class TestSplitSsePayloads:
+    def test_strips_data_prefix_and_skips_blank_and_comment_lines(self):
+        chunk = b'data: {"Type": "hello"}\n\n: keep-alive\n{"Type": "jobs.created"}\n'
+
+        payloads, carry = split_sse_payloads(chunk)
+
+        assert payloads == [b'{"Type": "hello"}', b'{"Type": "jobs.created"}']
+        assert carry == b""
+
+    def test_non_data_fields_are_skipped(self):
+        chunk = b"event: activities.set\nid: 7\nretry: 1000\nnot json\n"
+
+        assert split_sse_payloads(chunk) == ([], b"")
+
+    def test_partial_line_is_carried_into_next_chunk(self):
+        payloads, carry = split_sse_payloads(b'data: {"Type": "act')
+        assert payloads == []
+
+        payloads, carry = split_sse_payloads(b'ivities.set"}\r\n', carry)
+
+        assert payloads == [b'{"Type": "activities.set"}']
+        assert carry == b""
+
+    def test_final_partial_line_is_decoded_at_end_of_stream(self):
+        payloads, carry = split_sse_payloads(b'data: {"Type": "hello"}\ndata: {"Ty')
+        payloads, carry = split_sse_payloads(b'pe": "jobs.created"}', carry)
+        assert payloads == []
+
+        payloads, carry = split_sse_payloads(b"", carry, final=True)
+
+        assert payloads == [b'{"Type": "jobs.created"}']
+        assert carry == b""
+
+    def test_oversized_partial_line_is_rejected(self):
+        with pytest.raises(ValueError):
+            split_sse_payloads(b"x" * (MAX_PENDING_BYTES + 1))
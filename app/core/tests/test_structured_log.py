@@ -250,6 +250,44 @@ class TestSetupLoggingJsonMode:
                                 pass
 
 
+class TestLogFileReopen:
+    def test_handler_follows_log_file_renamed_by_another_process(self):
+        from core.helpers.logging import _ReopeningRotatingFileHandler
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "channelwatch.log")
+            handler = _ReopeningRotatingFileHandler(path, when="midnight")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            try:
+                handler.handle(_make_record("before"))
+                os.rename(path, path + ".1")
+                handler._next_reopen_check = 0.0
+                handler.handle(_make_record("after"))
+            finally:
+                handler.close()
+
+            with open(path + ".1") as f:
+                assert f.read() == "before\n"
+            with open(path) as f:
+                assert f.read() == "after\n"
+
+    def test_reopen_check_is_throttled(self):
+        from core.helpers.logging import _ReopeningRotatingFileHandler
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "channelwatch.log")
+            handler = _ReopeningRotatingFileHandler(path, when="midnight")
+            try:
+                with patch("core.helpers.logging.os.stat") as stat:
+                    stat.return_value = os.fstat(handler.stream.fileno())
+                    for _ in range(3):
+                        handler.handle(_make_record())
+            finally:
+                handler.close()
+
+            assert stat.call_count == 1
+
+
 class TestLogFunctionModes:
     def setup_method(self):
         clear_log_context()
@@ -302,3 +340,15 @@ class TestLogFunctionModes:
         log("verbose suppressed", level=LOG_VERBOSE)
         captured = capsys.readouterr()
         assert "verbose suppressed" not in captured.out
+
+    def test_is_verbose_tracks_log_level(self):
+        import core.helpers.logging as _log_mod
+
+        orig_level = _log_mod.log_level
+        try:
+            _log_mod.set_log_level(_log_mod.LOG_STANDARD)
+            assert _log_mod.is_verbose() is False
+            _log_mod.set_log_level(_log_mod.LOG_VERBOSE)
+            assert _log_mod.is_verbose() is True
+        finally:
+            _log_mod.log_level = orig_level
@@ -0,0 +1,64 @@
+"""Tests for the event stream diagnostic tool."""
+
+from unittest.mock import MagicMock, patch
+
+from core.helpers.tools import monitor_event_stream
+
+
+def _stream_client(chunks):
+    response = MagicMock()
+    response.status_code = 200
+    response.iter_bytes.return_value = iter(chunks)
+    client = MagicMock()
+    client.__enter__.return_value = client
+    client.stream.return_value.__enter__.return_value = response
+    return client
+
+
+def test_counts_and_logs_events_split_across_chunks():
+    chunks = [
+        b'data: {"Type": "hello"}\n\ndata: {"Type": "activ',
+        b'ities.set", "Value": "caf\xc3\xa9"}\n: keep-alive\n',
+    ]
+    logged = []
+
+    with (
+        patch("core.helpers.tools.httpx.Client", return_value=_stream_client(chunks)),
+        patch("core.helpers.tools.log", side_effect=logged.append),
+    ):
+        assert monitor_event_stream("127.0.0.1", 8089, duration=0.1) is True
+
+    assert [m for m in logged if m.startswith("Event: ")] == [
+        'Event: {"Type": "hello"}',
+        'Event: {"Type": "activities.set", "Value": "café"}',
+    ]
+    assert logged[-1] == "Monitoring complete - 2 events received"
+
+
+def test_reads_the_stream_without_rechunking():
+    client = _stream_client([b'data: {"Type": "hello"}\n'])
+
+    with (
+        patch("core.helpers.tools.httpx.Client", return_value=client),
+        patch("core.helpers.tools.log"),
+    ):
+        monitor_event_stream("127.0.0.1", 8089, duration=0.1)
+
+    response = client.stream.return_value.__enter__.return_value
+    response.iter_bytes.assert_called_once_with()
+
+
+def test_logs_an_event_left_unterminated_at_end_of_stream():
+    chunks = [b'data: {"Type": "hello"}\ndata: {"Type": "jobs.created"}']
+    logged = []
+
+    with (
+        patch("core.helpers.tools.httpx.Client", return_value=_stream_client(chunks)),
+        patch("core.helpers.tools.log", side_effect=logged.append),
+    ):
+        monitor_event_stream("127.0.0.1", 8089, duration=0.1)
+
+    assert [m for m in logged if m.startswith("Event: ")] == [
+        'Event: {"Type": "hello"}',
+        'Event: {"Type": "jobs.created"}',
+    ]
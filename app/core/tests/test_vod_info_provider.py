@@ -1,3 +1,4 @@
+import json
 from types import SimpleNamespace
 from typing import cast
 
@@ -89,3 +90,284 @@ def test_vod_metadata_provider_keeps_lowercase_key_compatibility(monkeypatch):
     assert formatted["title"] == "Lowercase Movie"
     assert formatted["duration"] == "1m 05s"
     assert formatted["image_url"] == "https://example.invalid/lower.jpg"
+
+
+def test_vod_cache_miss_refetches_the_list_once(monkeypatch):
+    from core.helpers.vod_info import VODInfoProvider
+
+    provider = VODInfoProvider("127.0.0.1", 8089, _settings())
+    fetches = []
+    listing = [{"ID": "1", "Title": "Old"}]
+
+    def fetch():
+        fetches.append(1)
+        return list(listing)
+
+    monkeypatch.setattr(provider, "_fetch_metadata", fetch)
+
+    assert provider.get_metadata("1")["Title"] == "Old"
+    listing.append({"ID": "2", "Title": "New"})
+
+    assert provider.get_metadata("2")["Title"] == "New"
+    assert len(fetches) == 2
+
+
+def test_vod_miss_right_after_a_fetch_does_not_refetch(monkeypatch):
+    from core.helpers.vod_info import VODInfoProvider
+
+    provider = VODInfoProvider("127.0.0.1", 8089, _settings())
+    fetches = []
+    monkeypatch.setattr(
+        provider, "_fetch_metadata", lambda: fetches.append(1) or [{"ID": "1"}]
+    )
+
+    assert provider.get_metadata("missing") is None
+    assert len(fetches) == 1
+
+
+def test_vod_repeated_miss_is_answered_from_memory(monkeypatch):
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+    fetches = []
+    monkeypatch.setattr(
+        provider, "_fetch_metadata", lambda: fetches.append(1) or [{"ID": "1"}]
+    )
+    clock = [1_000_000.0]
+    monkeypatch.setattr(vod_info.time, "time", lambda: clock[0])
+
+    provider.get_metadata("1")
+    assert provider.get_metadata("missing") is None
+    assert provider.get_metadata("missing") is None
+    assert len(fetches) == 2
+
+    clock[0] += provider.MISS_TTL_SECONDS
+    assert provider.get_metadata("missing") is None
+    assert len(fetches) == 3
+
+
+def test_vod_expired_misses_are_pruned(monkeypatch):
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+
+    provider._record_miss("a", 0.0)
+    provider._record_miss("b", 30.0)
+    provider._record_miss("c", 70.0)
+
+    assert list(provider._misses) == ["b", "c"]
+
+
+def test_vod_expired_cache_is_served_while_refreshing_in_background(monkeypatch):
+    import threading
+
+    from core.helpers.vod_info import VODInfoProvider
+
+    provider = VODInfoProvider("127.0.0.1", 8089, _settings())
+    release = threading.Event()
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        if len(fetches) > 1:
+            release.wait(5)
+            return [{"ID": "1", "Title": "New"}]
+        return [{"ID": "1", "Title": "Old"}]
+
+    monkeypatch.setattr(provider, "_fetch_metadata", fetch)
+    provider.get_metadata("1")
+    provider.last_fetch -= provider.cache_ttl
+
+    assert provider.get_metadata("1")["Title"] == "Old"
+    assert provider.get_metadata("1")["Title"] == "Old"
+    assert provider._refreshing
+    assert provider.get_metadata("2") is None
+    assert "2" not in provider._misses
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "vod-cache-refresh":
+            thread.join(5)
+
+    assert len(fetches) == 2
+    assert not provider._refreshing
+    assert provider.get_metadata("1")["Title"] == "New"
+
+
+class _MetadataResponse:
+    def __init__(self, status_code, items=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(items).encode() if items is not None else b""
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        return None
+
+
+def test_vod_refresh_sends_validators_and_keeps_cache_on_304():
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+    sent_headers = []
+    responses = [
+        _MetadataResponse(
+            200,
+            [{"ID": "7", "Title": "Kept"}],
+            {"ETag": '"v1"', "Last-Modified": "Sat, 01 Jun 2024 00:00:00 GMT"},
+        ),
+        _MetadataResponse(304),
+    ]
+
+    def fake_get(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    provider._client = SimpleNamespace(get=fake_get)
+
+    provider._update_cache()
+    cache = provider.metadata_cache
+    provider._force_refresh()
+
+    assert sent_headers == [
+        {},
+        {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Sat, 01 Jun 2024 00:00:00 GMT",
+        },
+    ]
+    assert provider.metadata_cache is cache
+    assert provider.last_fetch > 0
+
+
+def test_vod_fetch_is_unconditional_while_the_cache_is_empty():
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+    provider._etag = '"stale"'
+    sent_headers = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return _MetadataResponse(200, [])
+
+    provider._client = SimpleNamespace(get=fake_get)
+
+    provider._fetch_metadata()
+
+    assert sent_headers == [{}]
+
+
+def test_vod_malformed_metadata_body_is_a_failed_fetch():
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+    response = _MetadataResponse(200, [], {"ETag": '"bad"'})
+    response.content = b"[{not json"
+    provider._client = SimpleNamespace(get=lambda url, **kwargs: response)
+
+    assert provider._fetch_metadata() is vod_info._FETCH_FAILED
+    assert provider._etag is None
+
+
+def test_vod_failed_forced_refresh_keeps_the_cache(monkeypatch):
+    import httpx
+
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+    provider.metadata_cache = {"1": {"id": "1", "name": "Cached"}}
+    provider.last_fetch = 1_000.0
+    provider._etag = '"v1"'
+    monkeypatch.setattr(vod_info.time, "time", lambda: 1_010.0)
+
+    def unreachable(url, **kwargs):
+        raise httpx.ConnectError("connection refused")
+
+    provider._client = SimpleNamespace(get=unreachable)
+
+    assert provider.get_metadata("2") is None
+    assert provider.get_metadata("1") == {"id": "1", "name": "Cached"}
+    assert provider.last_fetch == 1_000.0
+    assert "2" not in provider._misses
+
+
+def test_vod_provider_uses_the_shared_dvr_client():
+    from core.helpers.http_pool import get_client
+    from core.helpers.vod_info import VODInfoProvider
+
+    provider = VODInfoProvider("127.0.0.1", 8089, _settings())
+
+    assert provider._client is get_client("127.0.0.1", 8089)
+
+
+def test_vod_format_fields_are_resolved_from_settings_once():
+    from core.helpers.vod_info import VODInfoProvider
+
+    settings = _settings()
+    settings.vod_summary = False
+    settings.vod_cast = False
+    provider = VODInfoProvider("127.0.0.1", 8089, settings)
+    settings.vod_summary = True
+
+    formatted = provider.format_metadata(
+        {"Title": "Movie", "Summary": "Ignored", "Duration": 5, "Cast": ["A"]},
+        "0m5s",
+    )
+
+    assert formatted == {
+        "title": "Movie",
+        "duration": "5s",
+        "progress": "0m5s",
+        "image_url": "",
+        "rating": "",
+        "genres": [],
+    }
+
+
+def test_vod_format_without_settings_is_empty():
+    from core.helpers.vod_info import VODInfoProvider
+
+    provider = VODInfoProvider("127.0.0.1", 8089, None)
+
+    assert provider.format_metadata({"Title": "Movie"}, "1m") == {}
+
+
+def test_vod_duration_formatting_truncates_to_whole_seconds():
+    from core.helpers.vod_info import _format_duration
+
+    assert _format_duration(0) == "0s"
+    assert _format_duration(None) == "0s"
+    assert _format_duration("59.9") == "59s"
+    assert _format_duration(3599.999) == "59m 59s"
+    assert _format_duration(10 * 86400 + 61) == "240h 01m 01s"
+
+
+def test_vod_unchanged_body_keeps_the_cache_without_decoding(monkeypatch):
+    from core.helpers import vod_info
+
+    provider = vod_info.VODInfoProvider("127.0.0.1", 8089, _settings())
+    bodies = [
+        [{"ID": "1", "Title": "Same"}],
+        [{"ID": "1", "Title": "Same"}],
+        [{"ID": "1", "Title": "Changed"}],
+    ]
+    provider._client = SimpleNamespace(
+        get=lambda url, **kwargs: _MetadataResponse(200, bodies.pop(0))
+    )
+    decoded = []
+    real_loads = vod_info.json_loads
+    monkeypatch.setattr(
+        vod_info, "json_loads", lambda data: decoded.append(1) or real_loads(data)
+    )
+
+    provider._force_refresh()
+    cache = provider.metadata_cache
+    provider._force_refresh()
+
+    assert provider.metadata_cache is cache
+    assert len(decoded) == 1
+
+    provider._force_refresh()
+
+    assert provider.metadata_cache["1"]["Title"] == "Changed"
+    assert len(decoded) == 2
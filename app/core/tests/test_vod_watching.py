@@ -0,0 +1,16 @@
+"""Tests for VOD-Watching event name and timestamp parsing."""
+
+from core.alerts.vod_watching import _RE_FILE_ID, _RE_SESSION_ID, format_timestamp
+
+
+def test_format_timestamp_spaces_units():
+    assert format_timestamp("1h2m3s") == "1h 02m 03s"
+    assert format_timestamp("4m5s") == "4m 05s"
+    assert format_timestamp("9s") == "9s"
+    assert format_timestamp("1h 02m") == "1h 02m"
+
+
+def test_fallback_patterns_match_file_ids_and_session_ids():
+    assert _RE_FILE_ID.search("6-file-1234").group(1) == "1234"
+    assert _RE_FILE_ID.search("6-file1234-abc").group(1) == "1234"
+    assert _RE_SESSION_ID.search("6-file1234-192.168.1.5").group(1) == "192.168.1.5"
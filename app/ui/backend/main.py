@@ -2373,7 +2373,7 @@ def load_alert_history():
     if os.path.exists(HISTORY_FILE):
         try:
             log.debug(f"[WebUI] Loading activity history from {HISTORY_FILE}")
-            with open(HISTORY_FILE, "r") as f:
+            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
                 items = json.load(f)
 
             new_history = []
@@ -4563,18 +4563,19 @@ LOG_TAIL_MAX_LINES = 1000
 
 def _tail_log_lines(path: Path, requested_lines: int) -> list[str]:
     line_count = max(1, min(int(requested_lines or 100), LOG_TAIL_MAX_LINES))
-    chunk_size = 8192
+    chunk_size = 65536
     chunks: list[bytes] = []
     newline_count = 0
 
-    with path.open("rb") as f:
-        f.seek(0, os.SEEK_END)
-        position = f.tell()
+    # Unbuffered positional reads: one pread() per chunk walking back from the
+    # end, with no seeks and no stdio buffer to refill.
+    with path.open("rb", buffering=0) as f:
+        fd = f.fileno()
+        position = os.fstat(fd).st_size
         while position > 0 and newline_count <= line_count:
             read_size = min(chunk_size, position)
             position -= read_size
-            f.seek(position)
-            chunk = f.read(read_size)
+            chunk = os.pread(fd, read_size, position)
             chunks.append(chunk)
             newline_count += chunk.count(b"\n")
 